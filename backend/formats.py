@@ -0,0 +1,281 @@
+"""Response formats for run payloads, chosen from the `Accept` header.
+
+Returning a payload dict from an endpoint makes FastAPI walk it with
+`jsonable_encoder` before encoding it, which dominates the response time of
+long runs (price histories alone hold one dict per card per tick). The
+payload endpoints encode straight to bytes instead:
+
+- `application/json` (default): orjson when installed, else the stdlib
+  encoder without whitespace;
+- `application/msgpack` (or `application/x-msgpack`): MessagePack, needs
+  the `msgpack` package;
+- `application/vnd.apache.arrow.stream`: an Arrow IPC stream of one table
+  of the payload, selected with `table` (see `TABLES`), needs `pyarrow`.
+
+`negotiate` picks the best available format the client accepts and falls
+back to JSON for anything else (e.g. `*/*` or `text/html`). Asking only for
+a binary format whose package is missing raises `UnsupportedFormat`.
+
+Price histories, most of a payload's bytes, can be sent in the compact
+delta/run-length form of `encode_price_history` (`compact_histories`), and
+bodies are compressed with zstd (needs `zstandard`) or gzip when the client
+sends a matching `Accept-Encoding` (`compress`).
+"""
+
+import gzip
+import json
+from typing import Dict, List, Literal, Mapping, Optional, Tuple, get_args
+
+from simulation.types import encode_price_history
+
+try:
+    import orjson
+except ImportError:  # the stdlib encoder is used instead
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # only gzip compression is offered
+    zstandard = None
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+ARROW = "application/vnd.apache.arrow.stream"
+
+_MEDIA_TYPES = {
+    JSON: JSON,
+    "application/*": JSON,
+    "*/*": JSON,
+    MSGPACK: MSGPACK,
+    "application/x-msgpack": MSGPACK,
+    ARROW: ARROW,
+}
+# Package each binary format needs
+_PACKAGES = {MSGPACK: "msgpack", ARROW: "pyarrow"}
+
+# Tables of a payload served as Arrow streams; the first is the default
+TABLES = ("timeseries", "market", "events", "price_points")
+
+# Price history forms; "compact" uses simulation.types.encode_price_history
+HistoryFormat = Literal["full", "compact"]
+HISTORY_FORMATS = get_args(HistoryFormat)
+
+# Smaller bodies are sent uncompressed
+MIN_COMPRESS_BYTES = 1024
+
+
+class UnsupportedFormat(ValueError):
+    """The requested format or table cannot be produced for this payload."""
+
+
+def _ranked(accept: str) -> List[str]:
+    """Return the media types of an Accept header, most preferred first."""
+    ranked: List[Tuple[float, int, str]] = []
+    for position, part in enumerate(accept.split(",")):
+        media_type, *params = (p.strip() for p in part.split(";"))
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_type and q > 0:
+            ranked.append((-q, position, media_type.lower()))
+    return [media_type for _, _, media_type in sorted(ranked)]
+
+
+def _available(media_type: str) -> bool:
+    package = _PACKAGES.get(media_type)
+    if package is None:
+        return True
+    try:
+        __import__(package)
+    except ImportError:
+        return False
+    return True
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """Return the media type to respond with for an Accept header.
+
+    Raises:
+        UnsupportedFormat: if only formats whose package is missing are
+            acceptable
+    """
+    missing = []
+    for media_type in _ranked(accept or JSON):
+        known = _MEDIA_TYPES.get(media_type)
+        if known is None:
+            continue
+        if _available(known):
+            return known
+        missing.append(known)
+    if missing:
+        raise UnsupportedFormat(
+            f"{missing[0]} responses need the {_PACKAGES[missing[0]]} package"
+        )
+    return JSON
+
+
+def dumps_json(payload: Mapping) -> bytes:
+    if orjson is not None:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(payload, option=options)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def dumps_msgpack(payload: Mapping) -> bytes:
+    import msgpack
+
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def _columns(rows: List[Dict]) -> Dict[str, List]:
+    """Turn rows into columns, keyed by the first row's fields."""
+    names = list(rows[0]) if rows else []
+    return {name: [row.get(name) for row in rows] for name in names}
+
+
+# Fields of every price history point
+_POINT_FIELDS = ("tick", "price", "quality_score", "desirability")
+
+
+def _price_points(agents: List[Dict]) -> Dict[str, List]:
+    """Return every card instance's price history as columns."""
+    columns: Dict[str, List] = {
+        name: [] for name in ("agent_id", "card_instance_id", "card_id")
+    }
+    points: Dict[str, List] = {name: [] for name in _POINT_FIELDS}
+    for agent in agents:
+        for card in agent["card_instances"]:
+            history = card["price_history"]
+            columns["agent_id"] += [agent["id"]] * len(history)
+            columns["card_instance_id"] += [card["card_instance_id"]] * len(history)
+            columns["card_id"] += [card["card_id"]] * len(history)
+            for name, values in points.items():
+                values += [point[name] for point in history]
+    return {**columns, **points}
+
+
+def table_columns(payload: Mapping, table: Optional[str] = None) -> Dict[str, List]:
+    """Return one table of a run payload as columns.
+
+    Tables: "timeseries" (the scalar fields of every entry), "market" (the
+    market snapshots), "events" and "price_points" (one row per recorded
+    price of every card instance).
+
+    Raises:
+        UnsupportedFormat: for an unknown table or one the payload lacks
+    """
+    table = table or TABLES[0]
+    if table not in TABLES:
+        raise UnsupportedFormat(f"Unknown table {table!r}; expected one of {TABLES}")
+    needs = "agents" if table == "price_points" else "timeseries"
+    if table == "events" and "events" in payload:
+        needs = "events"
+    if needs not in payload:
+        raise UnsupportedFormat(f"The payload has no {needs} for table {table!r}")
+
+    if table == "price_points":
+        return _price_points(payload["agents"])
+    if needs == "events":
+        rows = payload["events"]
+    elif table == "events":
+        rows = [e for entry in payload["timeseries"] for e in entry.get("events", [])]
+    elif table == "market":
+        rows = [
+            entry["market_snapshot"]
+            for entry in payload["timeseries"]
+            if "market_snapshot" in entry
+        ]
+    else:
+        rows = [
+            {k: v for k, v in entry.items() if k not in ("events", "market_snapshot")}
+            for entry in payload["timeseries"]
+        ]
+    return _columns(rows)
+
+
+def dumps_arrow(payload: Mapping, table: Optional[str] = None) -> bytes:
+    import pyarrow as pa
+
+    data = pa.table(table_columns(payload, table))
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, data.schema) as writer:
+        writer.write_table(data)
+    return sink.getvalue().to_pybytes()
+
+
+def _compact_card(card: Mapping) -> Dict:
+    history = card["price_history"]
+    if not isinstance(history, list):
+        return dict(card)
+    columns = [[point[name] for point in history] for name in _POINT_FIELDS]
+    return {**card, "price_history": encode_price_history(*columns)}
+
+
+def _compact_agent(agent: Mapping) -> Dict:
+    if "card_instances" not in agent:
+        return dict(agent)
+    return {
+        **agent,
+        "card_instances": [_compact_card(c) for c in agent["card_instances"]],
+    }
+
+
+def compact_histories(payload: Mapping, history: str = "compact") -> Mapping:
+    """Return `payload` with compact card price histories.
+
+    Rewrites the cards under "agents", "agent" and "cards" into copies, so
+    cached payloads are left untouched; `history="full"` returns the
+    payload as is.
+
+    Raises:
+        UnsupportedFormat: for an unknown history format
+    """
+    if history not in HISTORY_FORMATS:
+        raise UnsupportedFormat(
+            f"Unknown history format {history!r}; expected one of {HISTORY_FORMATS}"
+        )
+    if history == "full":
+        return payload
+    compact = dict(payload)
+    if compact.get("agents"):
+        compact["agents"] = [_compact_agent(a) for a in compact["agents"]]
+    if compact.get("agent"):
+        compact["agent"] = _compact_agent(compact["agent"])
+    if compact.get("cards"):
+        compact["cards"] = [_compact_card(c) for c in compact["cards"]]
+    return compact
+
+
+def compress(
+    body: bytes, accept_encoding: Optional[str]
+) -> Tuple[bytes, Optional[str]]:
+    """Compress a body for an Accept-Encoding header.
+
+    Prefers zstd when `zstandard` is installed, then gzip; bodies under
+    `MIN_COMPRESS_BYTES` stay uncompressed.
+
+    Returns:
+        (body, content_encoding): content_encoding is None if uncompressed
+    """
+    if len(body) < MIN_COMPRESS_BYTES or not accept_encoding:
+        return body, None
+    for coding in _ranked(accept_encoding):
+        if coding == "zstd" and zstandard is not None:
+            return zstandard.ZstdCompressor(level=3).compress(body), "zstd"
+        if coding in ("gzip", "*"):
+            return gzip.compress(body, compresslevel=5, mtime=0), "gzip"
+    return body, None
+
+
+def encode(payload: Mapping, media_type: str, table: Optional[str] = None) -> bytes:
+    """Serialize a payload as `media_type` (see `negotiate`)."""
+    if media_type == MSGPACK:
+        return dumps_msgpack(payload)
+    if media_type == ARROW:
+        return dumps_arrow(payload, table)
+    return dumps_json(payload)
@@ -0,0 +1,169 @@
+"""Background simulation jobs for the backend API.
+
+`JobManager` runs simulations on a bounded thread pool so request handlers
+return immediately. Each job is driven through `iter_simulation`, which lets
+it publish progress after every tick and stop cooperatively at a tick
+boundary when cancelled. With a result cache, a job starts from the
+longest cached prefix of its run and caches its own result. Jobs live in
+memory and are lost on restart; only the most recent finished jobs are
+kept, while their results persist in the run store.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from simulation import SimulationConfig, iter_simulation
+from simulation.cache import ResultCache
+from simulation.engine import SimulationResult, build_result
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+CANCELLED = "cancelled"
+FAILED = "failed"
+FINISHED = (COMPLETED, CANCELLED, FAILED)
+
+# Simulations running at once; further jobs wait in the queue
+MAX_JOB_WORKERS = 2
+# Finished jobs kept for polling before the oldest are forgotten
+MAX_FINISHED_JOBS = 32
+
+
+@dataclass
+class Job:
+    """State of one background simulation run.
+
+    `tick` is the last completed tick; `result` holds the `run_simulation`
+    payload once the job has completed and `run_id` the id `on_complete`
+    stored it under, if any.
+    """
+
+    id: str
+    config: SimulationConfig
+    status: str = QUEUED
+    tick: int = -1
+    result: Optional[SimulationResult] = None
+    error: Optional[str] = None
+    run_id: Optional[str] = None
+    cancel_requested: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def total(self) -> int:
+        return self.config.ticks
+
+    def to_dict(self) -> Dict:
+        """Return the JSON-serializable status of the job (without the result)."""
+        return {
+            "id": self.id,
+            "status": self.status,
+            "tick": max(self.tick, 0),
+            "total": self.total,
+            "progress": max(self.tick, 0) / self.total if self.total else 1.0,
+            "config": dict(self.config.__dict__),
+            "error": self.error,
+            "run_id": self.run_id,
+        }
+
+
+class JobManager:
+    """Submit, poll and cancel simulation jobs on a bounded worker pool.
+
+    Parameters:
+        max_workers: simulations allowed to run concurrently
+        on_complete: optional callback invoked with the result payload of
+            every job that completes; it may return the id the run was
+            stored under
+        cache: optional result cache jobs resume from and add to
+    """
+
+    def __init__(
+        self,
+        max_workers: int = MAX_JOB_WORKERS,
+        on_complete: Optional[Callable[[SimulationResult], Optional[str]]] = None,
+        cache: Optional[ResultCache] = None,
+    ) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="polydros-job"
+        )
+        self._on_complete = on_complete
+        self._cache = cache
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, config: SimulationConfig) -> Job:
+        """Queue a simulation run and return its job immediately."""
+        job = Job(id=uuid.uuid4().hex, config=config)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Request cancellation; the job stops before its next tick.
+
+        Queued jobs are cancelled before they start. Finished jobs are left
+        unchanged. Returns None for unknown ids.
+        """
+        job = self.get(job_id)
+        if job is None:
+            return None
+        job.cancel_requested.set()
+        with self._lock:
+            if job.status == QUEUED:
+                job.status = CANCELLED
+        return job
+
+    def shutdown(self, cancel: bool = True) -> None:
+        """Stop the worker pool, cancelling unfinished jobs by default."""
+        if cancel:
+            for job in self.list():
+                self.cancel(job.id)
+        self._executor.shutdown(wait=True)
+
+    def _run(self, job: Job) -> None:
+        with self._lock:
+            if job.status != QUEUED:
+                return
+            job.status = RUNNING
+        try:
+            if self._cache is not None:
+                stream, timeseries = self._cache.resume(job.config)
+            else:
+                stream, timeseries = iter_simulation(job.config), []
+            if timeseries:
+                job.tick = timeseries[-1]["tick"]
+            for entry in stream:
+                timeseries.append(entry)
+                job.tick = entry["tick"]
+                if job.cancel_requested.is_set() and not stream.finished:
+                    job.status = CANCELLED
+                    return
+            stream.final()
+            job.result = build_result(job.config, stream.world, timeseries)
+            if self._cache is not None:
+                self._cache.put(job.result)
+        except Exception as exc:  # report the failure through the job status
+            job.error = f"{type(exc).__name__}: {exc}"
+            job.status = FAILED
+            return
+        if self._on_complete is not None:
+            job.run_id = self._on_complete(job.result)
+        job.status = COMPLETED
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, j in self._jobs.items() if j.status in FINISHED]
+        for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
@@ -0,0 +1,286 @@
+"""Live worlds of stored runs, kept so they can be advanced incrementally.
+
+`POST /runs/{id}/advance` continues a run from its current tick instead of
+re-simulating every earlier tick. `LiveRuns` keeps the `SimulationStream` of
+the most recently advanced runs in memory; older ones are checkpointed to
+disk in the background (see `simulation/checkpoint.py`) and restored on
+demand, so advancing keeps working after eviction or a restart. Only the
+newest checkpoints are kept; a run whose checkpoint was dropped is
+re-simulated from its stored config.
+
+Advancing does work in proportion to the new ticks and the cards held, not
+to the run's length: the store only receives the new timeseries entries,
+price points and the card instances that changed, and results handed out
+for a live run read its world in place (see `LiveRun.view`).
+"""
+
+import pickle
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass, field
+from operator import attrgetter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from simulation.checkpoint import load_checkpoint
+from simulation.engine import (
+    SimulationResult,
+    SimulationStream,
+    build_result,
+    summarize_agent,
+)
+
+# Runs whose worlds stay in memory; the least recently used are checkpointed
+MAX_LIVE_RUNS = 8
+# Checkpoints of evicted runs kept on disk; the oldest are deleted
+MAX_CHECKPOINTS = 64
+
+# Everything a stored card instance row is rendered from
+_card_state = attrgetter(
+    "card_instance_id",
+    "ref",
+    "agent_id",
+    "acquisition_tick",
+    "acquisition_price",
+    "current_price",
+    "quality_score",
+    "desirability",
+    "win_count",
+    "loss_count",
+    "condition",
+)
+
+
+@dataclass
+class LiveRun:
+    """A run's live stream and the timeseries it has produced so far.
+
+    `lock` serializes advancing the run.
+    """
+
+    stream: SimulationStream
+    timeseries: List[Dict]
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # (label, state) of every held card instance by (agent id, position), as
+    # of the latest delta; None until the first advance
+    _cards: Optional[Dict[Tuple[int, int], Tuple]] = field(default=None, repr=False)
+    # Results of `view` that read the live world
+    _views: List[weakref.ref] = field(default_factory=list, repr=False)
+
+    @property
+    def tick(self) -> int:
+        return self.stream.world.tick
+
+    def view(self) -> SimulationResult:
+        """Return the run so far as a result, without copying the world.
+
+        The result reads the live world until the run advances again; if it
+        is still referenced then, the run moves on with a copy of the world
+        and leaves the original to the result. Call with `lock` held.
+        """
+        result = build_result(
+            self.stream.config, self.stream.world, list(self.timeseries)
+        )
+        self._views.append(weakref.ref(result))
+        return result
+
+    def _fork(self) -> None:
+        """Continue on a copy of the world, leaving the original to the views."""
+        stream = self.stream
+        # a round trip of our own world, not of outside data
+        world = pickle.loads(  # noqa: S301
+            pickle.dumps(stream.world, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        self.stream = SimulationStream(
+            stream.config, engine=stream.engine, pool=stream.pool, world=world
+        )
+
+    def _card_states(self) -> Dict[Tuple[int, int], Tuple]:
+        return {
+            (agent.id, position): (card.label, _card_state(card))
+            for agent in self.stream.world.agents.values()
+            for position, card in enumerate(agent.card_instances.values())
+        }
+
+    def advance(self, ticks: int) -> Tuple[List[Dict], Dict]:
+        """Run `ticks` more ticks. Call with `lock` held.
+
+        Returns:
+            (entries, delta): the new timeseries entries and what the run
+            produced over them, for `RunStore.append`
+        """
+        if any(view() is not None for view in self._views):
+            self._fork()
+        self._views = []
+        if self._cards is None:
+            self._cards = self._card_states()
+        since = self.tick
+        self.stream.extend(ticks)
+        entries = list(self.stream)
+        self.timeseries.extend(entries)
+        return entries, self._delta(since, entries)
+
+    def _delta(self, since: int, entries: List[Dict]) -> Dict:
+        """Collect what the run produced after tick `since` (see `advance`).
+
+        Card instances are compared with their state at the previous delta,
+        and price points are read from the history store's tails, so neither
+        depends on how long the run has been going.
+        """
+        world = self.stream.world
+        store = world.price_history
+        previous = self._cards
+        current = {}
+        changed = []
+        counts = {}
+        labels = []
+        indices = []
+        for agent in world.agents.values():
+            position = -1
+            for position, card in enumerate(agent.card_instances.values()):
+                label = card.label
+                state = current[(agent.id, position)] = (label, _card_state(card))
+                if previous.get((agent.id, position)) != state:
+                    # the history is read separately, below
+                    changed.append(
+                        {
+                            **card.to_dict(history_from=world.tick + 1),
+                            "position": position,
+                        }
+                    )
+                if card.history is store:
+                    labels.append(label)
+                    indices.append(card.history_index)
+            counts[agent.id] = position + 1
+        self._cards = current
+
+        owners, *columns = store.points_from(indices, since + 1)
+        points = [
+            (labels[owner], tick, round(price, 2), quality_score, desirability)
+            for owner, tick, price, quality_score, desirability in zip(
+                owners.tolist(), *(column.tolist() for column in columns), strict=True
+            )
+        ]
+        held = {label for label, _ in current.values()}
+        return {
+            "config": self.stream.config.__dict__,
+            "timeseries": entries,
+            "final": self.stream.final(),
+            "agents": [
+                summarize_agent(world, agent, detail=False)
+                for agent in world.agents.values()
+            ],
+            "card_instances": changed,
+            "card_counts": counts,
+            "removed": [label for label, _ in previous.values() if label not in held],
+            "price_points": points,
+        }
+
+
+class LiveRuns:
+    """Bounded registry of live runs by run id.
+
+    Parameters:
+        checkpoint_dir: where evicted runs are checkpointed
+        capacity: live runs kept in memory
+        max_checkpoints: checkpoint files kept in `checkpoint_dir`
+    """
+
+    def __init__(
+        self,
+        checkpoint_dir: Path,
+        capacity: int = MAX_LIVE_RUNS,
+        max_checkpoints: int = MAX_CHECKPOINTS,
+    ) -> None:
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.capacity = capacity
+        self.max_checkpoints = max_checkpoints
+        self._runs: "OrderedDict[str, LiveRun]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="polydros-checkpoint"
+        )
+        self._pending: Dict[str, Future] = {}
+
+    def _path(self, run_id: str) -> Path:
+        return self.checkpoint_dir / f"{run_id}.ckpt"
+
+    def keep(self, run_id: str, result: SimulationResult) -> LiveRun:
+        """Take over the world of a finished run so it can be advanced.
+
+        The world moves on from here, so pass a result nothing else reads,
+        such as a fresh `ResultCache.run` (its views are not built) once
+        the cache has encoded it (`ResultCache.wait`).
+        """
+        stream = SimulationStream(result.config, world=result.world)
+        return self._add(run_id, LiveRun(stream, list(result.timeseries)))
+
+    def _add(self, run_id: str, run: LiveRun) -> LiveRun:
+        with self._lock:
+            self._runs[run_id] = run
+            self._runs.move_to_end(run_id)
+            while len(self._runs) > self.capacity:
+                evicted_id, evicted_run = self._runs.popitem(last=False)
+                future = self._writer.submit(self._checkpoint, evicted_id, evicted_run)
+                self._pending[evicted_id] = future
+                future.add_done_callback(
+                    lambda done, done_id=evicted_id: self._settle(done_id, done)
+                )
+        return run
+
+    def _settle(self, run_id: str, future: Future) -> None:
+        with self._lock:
+            if self._pending.get(run_id) is future:
+                del self._pending[run_id]
+
+    def _checkpoint(self, run_id: str, run: LiveRun) -> None:
+        """Write an evicted run to disk, then drop the oldest checkpoints."""
+        with run.lock:
+            self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            run.stream.checkpoint(self._path(run_id), run.timeseries)
+        paths = sorted(
+            self.checkpoint_dir.glob("*.ckpt"), key=lambda p: p.stat().st_mtime
+        )
+        for path in paths[: max(0, len(paths) - self.max_checkpoints)]:
+            path.unlink(missing_ok=True)
+
+    def wait(self, run_id: Optional[str] = None) -> None:
+        """Block until the pending checkpoint of `run_id` (default: all) is written."""
+        with self._lock:
+            if run_id is None:
+                futures = list(self._pending.values())
+            elif run_id in self._pending:
+                futures = [self._pending[run_id]]
+            else:
+                return
+        wait_futures(futures)
+
+    def get(self, run_id: str) -> Optional[LiveRun]:
+        """Return a live run, restoring it from its checkpoint if evicted."""
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is not None:
+                self._runs.move_to_end(run_id)
+                return run
+            pending = self._pending.pop(run_id, None)
+            if pending is not None:
+                wait_futures([pending])
+            path = self._path(run_id)
+            if not path.exists():
+                return None
+            checkpoint = load_checkpoint(path)
+            run = LiveRun(checkpoint.stream(), list(checkpoint.timeseries or []))
+            path.unlink()
+            return self._add(run_id, run)
+
+    def discard(self, run_id: str) -> None:
+        """Forget a run and remove its checkpoint."""
+        with self._lock:
+            self._runs.pop(run_id, None)
+            pending = self._pending.pop(run_id, None)
+        if pending is not None:
+            wait_futures([pending])
+        self._path(run_id).unlink(missing_ok=True)
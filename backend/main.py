@@ -1,22 +1,92 @@
 """FastAPI backend skeleton exposing a simple simulation run endpoint.
 
 This is intentionally minimal: it demonstrates an HTTP API to run the
-simulation and return JSON. In production you'd add pagination, auth, and
-background task execution.
+simulation and return JSON. Long runs can be submitted as background jobs
+(`/jobs`, see `backend/jobs.py`); agent list endpoints are paginated
+(see `backend/query.py`). Every finished run is persisted in the SQLite run
+store (`backend/store.py`) off the request path, once per config, and can
+be read back by id under `/runs`.
+Simulations are served from a deterministic result cache when the same or
+a shorter run of the seed was computed before (`simulation/cache.py`).
+Run payloads are encoded in the format the `Accept` header asks for: JSON,
+MessagePack or Arrow tables (`backend/formats.py`), compressed per
+`Accept-Encoding`, and `history=compact` sends card price histories in a
+delta/run-length form. In production you'd add auth.
 """
 
-from fastapi import FastAPI
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterator, Optional, Union
+
+from fastapi import (
+    FastAPI,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
+from starlette.concurrency import run_in_threadpool
 
-from simulation import SimulationConfig, run_simulation
+from simulation import SimulationConfig
+from simulation.cache import CacheKey, ResultCache
+from simulation.engine import SimulationResult, build_result
+from simulation.types import AgentCardInstance
+from simulation.world import Event
+
+from .formats import (
+    ARROW,
+    HistoryFormat,
+    UnsupportedFormat,
+    compact_histories,
+    compress,
+    encode,
+    negotiate,
+)
+from .jobs import COMPLETED, JobManager
+from .live import LiveRuns
+from .query import (
+    MAX_PAGE_SIZE,
+    SortValue,
+    page,
+    page_offset,
+    paginate,
+    sort_items,
+)
+from .store import (
+    AGENT_SORT_COLUMNS,
+    CARD_SORT_COLUMNS,
+    EVENT_SORT_COLUMNS,
+    RunStore,
+)
 
 app = FastAPI(title="Polydros Simulation API")
 
 # In-memory storage for the last simulation run. Lightweight and reset on
-# server restart. Persist to disk or DB later if needed.
+# server restart; every run is also persisted in STORE.
 LAST_RUN = None
 
+# Persistent SQLite store of finished runs, read back by run id
+STORE = RunStore()
+
+# Finished runs by config, reused instead of re-simulating
+CACHE = ResultCache()
+
+# Stored run ids by cache key, so repeating a run reuses its stored copy
+RUN_IDS: "OrderedDict[CacheKey, str]" = OrderedDict()
+RUN_IDS_LOCK = threading.Lock()
+MAX_RUN_IDS = 1024
+
+# Live worlds of recently advanced runs, continued by /runs/{run_id}/advance
+LIVE = LiveRuns(STORE.path.parent / "checkpoints")
+
+# Largest number of ticks a single advance call may run
+MAX_ADVANCE_TICKS = 1000
+
 # Development CORS settings: allow frontend dev server to call the API.
 # In production narrow this down to the actual origin(s).
 app.add_middleware(
@@ -25,9 +95,41 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Run-Id"],
 )
 
 
+def _store_last_run(result: SimulationResult) -> str:
+    """Keep `result` as LAST_RUN and queue it for the store.
+
+    A run of a config that is already stored (and was not advanced since)
+    is not saved again. Returns the run id right away; a new run is written
+    in the background.
+    """
+    global LAST_RUN
+    LAST_RUN = result
+    key = CACHE.key(result.config)
+    with RUN_IDS_LOCK:
+        run_id = RUN_IDS.get(key)
+        if run_id is None or not STORE.exists(run_id):
+            run_id = RUN_IDS[key] = STORE.save_async(result)
+        RUN_IDS.move_to_end(key)
+        while len(RUN_IDS) > MAX_RUN_IDS:
+            RUN_IDS.popitem(last=False)
+    return run_id
+
+
+def _forget_run_id(run_id: str) -> None:
+    """Stop reusing a stored run for its config (it was advanced or deleted)."""
+    with RUN_IDS_LOCK:
+        for key in [k for k, v in RUN_IDS.items() if v == run_id]:
+            del RUN_IDS[key]
+
+
+# Background simulation jobs; a completed job becomes the LAST_RUN
+JOBS = JobManager(on_complete=_store_last_run, cache=CACHE)
+
+
 class RunRequest(BaseModel):
     # Use concrete int types so downstream callers (mypy) see int and not
     # Optional[int]. Pydantic will still accept values via the HTTP payload.
@@ -36,107 +138,614 @@ class RunRequest(BaseModel):
     ticks: int = 1
 
 
-@app.post("/run")
-def run(req: RunRequest) -> dict:
-    cfg = SimulationConfig(
+def _config(req: RunRequest) -> SimulationConfig:
+    return SimulationConfig(
         seed=req.seed,
         initial_agents=req.agents,
         ticks=req.ticks,
     )
-    result = run_simulation(cfg)
-    # store last run in memory for inspection via agents endpoints
-    global LAST_RUN
-    LAST_RUN = result
-    return result
+
+
+def _payload(result: SimulationResult, fields: Optional[str]) -> dict:
+    """Return the requested comma-separated result keys (default: all).
+
+    Only the requested views are serialized, e.g. `fields=timeseries,final`
+    skips building the per-agent payload.
+    """
+    if fields is None:
+        return result.to_dict()
+    wanted = {f.strip() for f in fields.split(",")}
+    return {key: result[key] for key in result.KEYS if key in wanted}
+
+
+def _respond(
+    request: Request,
+    payload: Dict,
+    table: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+    history: HistoryFormat = "full",
+) -> Response:
+    """Encode a payload in the format the client accepts (`backend/formats.py`).
+
+    The payload is serialized straight to bytes, skipping FastAPI's
+    `jsonable_encoder` pass, and compressed per `Accept-Encoding`. `table`
+    picks the table of Arrow responses and `history="compact"` encodes card
+    price histories compactly. Unsupported formats or tables get a 406 error
+    payload.
+    """
+    try:
+        media_type = negotiate(request.headers.get("accept"))
+        if media_type != ARROW:  # Arrow tables are already columnar
+            payload = compact_histories(payload, history)
+        body = encode(payload, media_type, table)
+    except UnsupportedFormat as exc:
+        return JSONResponse({"error": str(exc)}, status_code=406)
+    body, content_encoding = compress(body, request.headers.get("accept-encoding"))
+    headers = {"Vary": "Accept, Accept-Encoding", **(headers or {})}
+    if content_encoding is not None:
+        headers["Content-Encoding"] = content_encoding
+    return Response(body, media_type=media_type, headers=headers)
+
+
+def _with_history(body: Dict, history: HistoryFormat) -> Dict:
+    """Apply the `history` query parameter to a response body.
+
+    "compact" sends card price histories in the delta/run-length form of
+    `simulation.types.encode_price_history`; "full" (default) as point lists.
+    """
+    return dict(compact_histories(body, history))
+
+
+@app.post("/run")
+def run(
+    req: RunRequest,
+    request: Request,
+    fields: Optional[str] = None,
+    table: Optional[str] = None,
+    history: HistoryFormat = "full",
+) -> Response:
+    """Run a simulation and return its payload (see `_payload` and `_respond`).
+
+    The run is kept for the agents endpoints and persisted; its id is sent
+    in the `X-Run-Id` header for the `/runs/{run_id}` endpoints.
+    """
+    result = CACHE.run(_config(req))
+    run_id = _store_last_run(result)
+    payload = _payload(result, fields)
+    return _respond(request, payload, table, {"X-Run-Id": run_id}, history)
+
+
+def _stream_messages(
+    cfg: SimulationConfig, history: HistoryFormat = "full"
+) -> Iterator[Dict]:
+    """Yield one message per completed tick, then the final run result.
+
+    Messages are {"type": "tick", "data": <timeseries entry>} followed by
+    {"type": "result", "data": {"run_id", "config", "final", "agents"}}.
+    Once the run finishes it is stored like a `/run` call. Ticks of a
+    cached prefix of the run are replayed before the remaining ones run;
+    `history` applies to the result's agents (see `_with_history`).
+    """
+    stream, timeseries = CACHE.resume(cfg)
+    for entry in timeseries:
+        yield {"type": "tick", "data": entry}
+    for entry in stream:
+        timeseries.append(entry)
+        yield {"type": "tick", "data": entry}
+
+    stream.final()
+    result = build_result(cfg, stream.world, timeseries)
+    CACHE.put(result)
+    run_id = _store_last_run(result)
+    data = {
+        "run_id": run_id,
+        "config": result["config"],
+        "final": result["final"],
+        "agents": result["agents"],
+    }
+    yield {"type": "result", "data": _with_history(data, history)}
+
+
+@app.post("/run/stream")
+def run_stream(
+    req: RunRequest, request: Request, history: HistoryFormat = "full"
+) -> StreamingResponse:
+    """Run a simulation and push each tick to the client as it completes.
+
+    Responds with newline-delimited JSON (one message per line) by default,
+    or server-sent events (`event: tick|result`) when the client sends
+    `Accept: text/event-stream`. See `_stream_messages` for the messages.
+    """
+    messages = _stream_messages(_config(req), history)
+    if "text/event-stream" in request.headers.get("accept", ""):
+        body = (
+            f"event: {m['type']}\ndata: {json.dumps(m['data'])}\n\n"
+            for m in messages
+        )
+        return StreamingResponse(
+            body,
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
+    return StreamingResponse(
+        (json.dumps(m) + "\n" for m in messages),
+        media_type="application/x-ndjson",
+    )
+
+
+@app.websocket("/ws/run")
+async def run_websocket(websocket: WebSocket) -> None:
+    """WebSocket variant of `/run/stream`.
+
+    The client sends one RunRequest JSON message and receives the same tick
+    and result messages; the server closes the socket after the result.
+    """
+    await websocket.accept()
+    try:
+        try:
+            req = RunRequest(**await websocket.receive_json())
+        except (ValidationError, TypeError, ValueError) as exc:
+            await websocket.send_json({"type": "error", "data": str(exc)})
+            await websocket.close(code=1008)
+            return
+
+        messages = _stream_messages(_config(req))
+        while True:
+            # Ticks run in a worker thread so the event loop stays responsive
+            message = await run_in_threadpool(next, messages, None)
+            if message is None:
+                break
+            await websocket.send_json(message)
+    except WebSocketDisconnect:
+        return
+    await websocket.close()
+
+
+@app.post("/jobs")
+def create_job(req: RunRequest) -> dict:
+    """Queue a simulation as a background job and return its id immediately.
+
+    Poll `GET /jobs/{id}` for progress and fetch the payload from
+    `GET /jobs/{id}/result` once the job has completed.
+    """
+    return {"job": JOBS.submit(_config(req)).to_dict()}
+
+
+@app.get("/jobs")
+def list_jobs() -> dict:
+    return {"jobs": [job.to_dict() for job in JOBS.list()]}
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str) -> dict:
+    """Return status and progress (current tick / total ticks) of a job."""
+    job = JOBS.get(job_id)
+    if job is None:
+        return {"error": "Job not found"}
+    return {"job": job.to_dict()}
+
+
+@app.get("/jobs/{job_id}/result", response_model=None)
+def get_job_result(
+    job_id: str,
+    request: Request,
+    fields: Optional[str] = None,
+    table: Optional[str] = None,
+    history: HistoryFormat = "full",
+) -> Union[dict, Response]:
+    """Return the `/run` payload of a completed job (see `_payload`)."""
+    job = JOBS.get(job_id)
+    if job is None:
+        return {"error": "Job not found"}
+    if job.status != COMPLETED:
+        return {"error": f"Job is {job.status}", "job": job.to_dict()}
+    return _respond(request, _payload(job.result, fields), table, history=history)
+
+
+@app.delete("/jobs/{job_id}")
+def cancel_job(job_id: str) -> dict:
+    """Cancel a job; a running job stops at its next tick boundary."""
+    job = JOBS.cancel(job_id)
+    if job is None:
+        return {"error": "Job not found"}
+    return {"job": job.to_dict()}
+
+
+@app.get("/cache")
+def cache_stats() -> dict:
+    """Return the result cache's size and hit/miss counters."""
+    return {"cache": CACHE.stats()}
+
+
+def _find_agent(agent_id: int) -> Dict:
+    """Look an agent of the stored run up by id.
+
+    Returns {"agent": summary}, or an error payload when there is no run or
+    no such agent. Only the requested agent is serialized.
+    """
+    if LAST_RUN is None:
+        return {"error": "No simulation run available"}
+    agent = LAST_RUN.agent(int(agent_id))
+    if agent is None:
+        return {"error": "Agent not found"}
+    return {"agent": agent}
+
+
+def _find_world_agent(agent_id: int) -> Dict:
+    """Like `_find_agent`, but return the last run's `Agent` unserialized.
+
+    The list endpoints filter, sort and page its card instances and events
+    as objects and only serialize the rows of the returned page.
+    """
+    if LAST_RUN is None:
+        return {"error": "No simulation run available"}
+    agent = LAST_RUN.world.agents.get(int(agent_id))
+    if agent is None:
+        return {"error": "Agent not found"}
+    return {"agent": agent}
+
+
+def _matches(value: Optional[str], wanted: Optional[str]) -> bool:
+    return wanted is None or (value or "").lower() == wanted.lower()
+
+
+def _card_value(card: AgentCardInstance, field: str) -> SortValue:
+    """Read a card sort field as `AgentCardInstance.to_dict` renders it."""
+    value = getattr(card, field)
+    if field in ("acquisition_price", "current_price"):
+        return round(value, 2)
+    return value
+
+
+def _event_value(event: Event, field: str) -> SortValue:
+    return getattr(event, field)
 
 
 @app.get("/agents")
-def list_agents() -> dict:
+def list_agents(
+    prism_min: Optional[float] = None,
+    prism_max: Optional[float] = None,
+    sort: Optional[str] = None,
+    order: str = "asc",
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+) -> dict:
     """Return a list of agents from the last run.
 
-    Returns minimal metadata: id, prism, collection_count.
+    Returns minimal metadata: id, prism, name, nick, collection_count and
+    booster_count; use `/agents/{id}` for the full summary. `prism_min` and
+    `prism_max` bound the Prism balance inclusively; sorting and pagination
+    work as in `backend/query.py`.
     """
     if LAST_RUN is None:
         return {"error": "No simulation run available"}
-    return {"agents": LAST_RUN.get("agents", [])}
+    rows = LAST_RUN.overview()
+    if prism_min is not None:
+        rows = [row for row in rows if row["prism"] >= prism_min]
+    if prism_max is not None:
+        rows = [row for row in rows if row["prism"] <= prism_max]
+    try:
+        rows = sort_items(rows, sort, order, AGENT_SORT_COLUMNS)
+        return paginate(rows, "agents", offset, limit, cursor)
+    except ValueError as e:
+        return {"error": str(e)}
 
 
 @app.get("/agents/{agent_id}")
-def get_agent(agent_id: int) -> dict:
-    if LAST_RUN is None:
-        return {"error": "No simulation run available"}
-    agents = LAST_RUN.get("agents", [])
-    for agent in agents:
-        if int(agent["id"]) == int(agent_id):
-            return {"agent": agent}
-    return {"error": "Agent not found"}
+def get_agent(agent_id: int, history: HistoryFormat = "full") -> dict:
+    return _with_history(_find_agent(agent_id), history)
 
 
 @app.get("/agents/{agent_id}/traits")
 def get_agent_traits(agent_id: int) -> dict:
     """Return trait profile for an agent."""
-    if LAST_RUN is None:
-        return {"error": "No simulation run available"}
-    agents = LAST_RUN.get("agents", [])
-    for agent in agents:
-        if int(agent["id"]) == int(agent_id):
-            return {"traits": agent.get("traits", {})}
-    return {"error": "Agent not found"}
+    found = _find_agent(agent_id)
+    if "error" in found:
+        return found
+    return {"traits": found["agent"].get("traits", {})}
 
 
 @app.get("/agents/{agent_id}/collection")
 def get_agent_collection(agent_id: int) -> dict:
     """Return collection summary by rarity for an agent."""
-    if LAST_RUN is None:
-        return {"error": "No simulation run available"}
-    agents = LAST_RUN.get("agents", [])
-    for agent in agents:
-        if int(agent["id"]) == int(agent_id):
-            return {
-                "id": agent.get("id"),
-                "collection_count": agent.get("collection_count"),
-                "rarity_breakdown": agent.get("rarity_breakdown", {}),
-                "sample_cards": agent.get("sample_cards", []),
-            }
-    return {"error": "Agent not found"}
+    found = _find_agent(agent_id)
+    if "error" in found:
+        return found
+    agent = found["agent"]
+    return {
+        "id": agent.get("id"),
+        "collection_count": agent.get("collection_count"),
+        "rarity_breakdown": agent.get("rarity_breakdown", {}),
+        "sample_cards": agent.get("sample_cards", []),
+    }
 
 
 @app.get("/agents/{agent_id}/cards")
-def get_agent_cards(agent_id: int) -> dict:
-    """Return all cards in an agent's collection (full inventory).
+def get_agent_cards(
+    agent_id: int,
+    rarity: Optional[str] = None,
+    color: Optional[str] = None,
+    sort: Optional[str] = None,
+    order: str = "asc",
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    history: HistoryFormat = "full",
+) -> dict:
+    """Return the cards in an agent's collection (full inventory).
 
-    This endpoint returns the complete card database for an agent, including
-    all card details (rarity, holo status, quality score, etc.).
+    This endpoint returns the card instances of an agent, including all card
+    details (rarity, holo status, quality score, etc.). Cards can be filtered
+    by `rarity` and `color`, sorted by any of `CARD_SORT_COLUMNS` and paged;
+    `total` counts every card matching the filters.
     """
-    if LAST_RUN is None:
-        return {"error": "No simulation run available"}
-    agents = LAST_RUN.get("agents", [])
-    for agent in agents:
-        if int(agent["id"]) == int(agent_id):
-            return {
-                "id": agent.get("id"),
-                "name": agent.get("name"),
-                "collection_count": agent.get("collection_count"),
-                "cards": agent.get("card_instances", []),
-            }
-    return {"error": "Agent not found"}
+    found = _find_world_agent(agent_id)
+    if "error" in found:
+        return found
+    agent = found["agent"]
+    cards = [
+        card
+        for card in agent.card_instances.values()
+        if _matches(card.card_rarity, rarity) and _matches(card.card_color, color)
+    ]
+    try:
+        cards = sort_items(cards, sort, order, CARD_SORT_COLUMNS, _card_value)
+        page = paginate(
+            cards, "cards", offset, limit, cursor, AgentCardInstance.to_dict
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+    body = {
+        "id": agent.id,
+        "name": agent.name,
+        "collection_count": len(agent.collection),
+        **page,
+    }
+    return _with_history(body, history)
 
 
 @app.get("/agents/{agent_id}/events")
-def get_agent_events(agent_id: int) -> dict:
-    """Return all events for a specific agent.
+def get_agent_events(
+    agent_id: int,
+    event_type: Optional[str] = None,
+    tick_min: Optional[int] = None,
+    tick_max: Optional[int] = None,
+    sort: Optional[str] = None,
+    order: str = "asc",
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+) -> dict:
+    """Return the events of a specific agent.
 
     This endpoint returns events where the agent was the primary actor
-    (e.g., purchases, sales initiated by this agent).
+    (e.g., purchases, sales initiated by this agent), in tick order unless
+    sorted otherwise. `event_type` takes one type or a comma separated list;
+    `tick_min` and `tick_max` bound the tick range inclusively.
     """
-    if LAST_RUN is None:
-        return {"error": "No simulation run available"}
-    agents = LAST_RUN.get("agents", [])
-    for agent in agents:
-        if int(agent["id"]) == int(agent_id):
-            return {
-                "id": agent.get("id"),
-                "name": agent.get("name"),
-                "events": agent.get("agent_events", []),
-            }
-    return {"error": "Agent not found"}
+    found = _find_world_agent(agent_id)
+    if "error" in found:
+        return found
+    agent = found["agent"]
+    events = LAST_RUN.world.events.for_agent(agent.id, primary_only=True)
+    if event_type is not None:
+        types = {t.strip() for t in event_type.split(",")}
+        events = [e for e in events if e.event_type in types]
+    if tick_min is not None or tick_max is not None:
+        low = tick_min if tick_min is not None else float("-inf")
+        high = tick_max if tick_max is not None else float("inf")
+        events = [e for e in events if low <= e.tick <= high]
+    try:
+        events = sort_items(events, sort, order, EVENT_SORT_COLUMNS, _event_value)
+        page = paginate(events, "events", offset, limit, cursor, Event.to_dict)
+    except ValueError as e:
+        return {"error": str(e)}
+    return {"id": agent.id, "name": agent.name, **page}
+
+
+@app.get("/runs")
+def list_runs(
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+) -> dict:
+    """Return the stored runs, newest first: id, creation time, config, final."""
+    try:
+        offset = page_offset(offset, cursor)
+    except ValueError as e:
+        return {"error": str(e)}
+    runs, total = STORE.list_runs(offset, limit)
+    return page("runs", runs, total, offset, limit)
+
+
+@app.get("/runs/{run_id}")
+def get_run(run_id: str) -> dict:
+    run = STORE.get_run(run_id)
+    if run is None:
+        return {"error": "Run not found"}
+    return {"run": run}
+
+
+@app.delete("/runs/{run_id}")
+def delete_run(run_id: str) -> dict:
+    _forget_run_id(run_id)
+    LIVE.discard(run_id)
+    if not STORE.delete(run_id):
+        return {"error": "Run not found"}
+    return {"deleted": run_id}
+
+
+@app.post("/runs/{run_id}/advance")
+def advance_run(
+    run_id: str,
+    ticks: int = Query(1, ge=1, le=MAX_ADVANCE_TICKS),
+    include_agents: bool = False,
+    history: HistoryFormat = "full",
+) -> dict:
+    """Continue a stored run by `ticks` ticks and return only the new entries.
+
+    The first advance loads the run's world from the result cache (or
+    re-simulates it from its stored config); it is then kept live between
+    calls or restored from its checkpoint, so stepping through a run never
+    re-simulates earlier ticks. The output matches a fresh run to the same
+    tick. The stored run is extended with what changed and a view of the
+    live run becomes LAST_RUN (see `LiveRun.view`).
+
+    Returns {"run_id", "tick", "timeseries": new entries} plus the full
+    "agents" summaries when `include_agents` is set.
+    """
+    global LAST_RUN
+    run = STORE.get_run(run_id)
+    if run is None:
+        LIVE.discard(run_id)  # deleted, or dropped from the store
+        return {"error": "Run not found"}
+    _forget_run_id(run_id)
+    live = LIVE.get(run_id)
+    if live is None:
+        result = CACHE.run(SimulationConfig(**run["config"]))
+        CACHE.wait(CACHE.key(result.config))  # encoded before it advances
+        live = LIVE.keep(run_id, result)
+
+    with live.lock:
+        if LAST_RUN is not None and LAST_RUN.world is live.stream.world:
+            # replaced below, so the run need not copy its world for it
+            LAST_RUN = None
+        since = live.tick
+        entries, delta = live.advance(ticks)
+        STORE.append(run_id, delta, since)
+        result = live.view()
+        body = {"run_id": run_id, "tick": live.tick, "timeseries": entries}
+        if include_agents:
+            body["agents"] = result.agents()
+        LAST_RUN = result
+    return _with_history(body, history)
+
+
+@app.get("/runs/{run_id}/result", response_model=None)
+def get_run_result(
+    run_id: str,
+    request: Request,
+    table: Optional[str] = None,
+    history: HistoryFormat = "full",
+) -> Union[dict, Response]:
+    """Return the full `/run` payload of a stored run (see `_respond`)."""
+    result = STORE.result(run_id)
+    if result is None:
+        return {"error": "Run not found"}
+    return _respond(request, result, table, history=history)
+
+
+@app.get("/runs/{run_id}/timeseries", response_model=None)
+def get_run_timeseries(
+    run_id: str,
+    request: Request,
+    tick_min: Optional[int] = None,
+    tick_max: Optional[int] = None,
+    table: Optional[str] = None,
+) -> Union[dict, Response]:
+    """Return a stored run's timeseries entries, optionally within a tick range.
+
+    Arrow responses serve the "timeseries", "market" or "events" table.
+    """
+    if STORE.get_run(run_id) is None:
+        return {"error": "Run not found"}
+    timeseries = STORE.timeseries(run_id, tick_min, tick_max)
+    return _respond(request, {"timeseries": timeseries}, table)
+
+
+@app.get("/runs/{run_id}/events")
+def get_run_events(
+    run_id: str,
+    agent_id: Optional[int] = None,
+    event_type: Optional[str] = None,
+    tick_min: Optional[int] = None,
+    tick_max: Optional[int] = None,
+    sort: Optional[str] = None,
+    order: str = "asc",
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+) -> dict:
+    """Return a stored run's events, filtered like `/agents/{id}/events`.
+
+    `agent_id` selects the events that agent was the primary actor of.
+    """
+    if STORE.get_run(run_id) is None:
+        return {"error": "Run not found"}
+    types = None if event_type is None else [t.strip() for t in event_type.split(",")]
+    try:
+        offset = page_offset(offset, cursor)
+        events, total = STORE.events(
+            run_id, agent_id, types, tick_min, tick_max, sort, order, offset, limit
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+    return page("events", events, total, offset, limit)
+
+
+@app.get("/runs/{run_id}/agents")
+def list_run_agents(
+    run_id: str,
+    prism_min: Optional[float] = None,
+    prism_max: Optional[float] = None,
+    sort: Optional[str] = None,
+    order: str = "asc",
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+) -> dict:
+    """Return the agents of a stored run, like `/agents`."""
+    if STORE.get_run(run_id) is None:
+        return {"error": "Run not found"}
+    try:
+        offset = page_offset(offset, cursor)
+        agents, total = STORE.agents(
+            run_id, prism_min, prism_max, sort, order, offset, limit
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+    return page("agents", agents, total, offset, limit)
+
+
+@app.get("/runs/{run_id}/agents/{agent_id}")
+def get_run_agent(
+    run_id: str, agent_id: int, history: HistoryFormat = "full"
+) -> dict:
+    agent = STORE.agent(run_id, agent_id)
+    if agent is None:
+        return {"error": "Agent not found"}
+    return _with_history({"agent": agent}, history)
+
+
+@app.get("/runs/{run_id}/agents/{agent_id}/cards")
+def get_run_agent_cards(
+    run_id: str,
+    agent_id: int,
+    rarity: Optional[str] = None,
+    color: Optional[str] = None,
+    sort: Optional[str] = None,
+    order: str = "asc",
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    history: HistoryFormat = "full",
+) -> dict:
+    """Return an agent's cards from a stored run, like `/agents/{id}/cards`."""
+    agent = STORE.overview(run_id, agent_id)
+    if agent is None:
+        return {"error": "Agent not found"}
+    try:
+        offset = page_offset(offset, cursor)
+        cards, total = STORE.cards(
+            run_id, agent_id, rarity, color, sort, order, offset, limit
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+    body = {
+        "id": agent["id"],
+        "name": agent["name"],
+        "collection_count": agent["collection_count"],
+        **page("cards", cards, total, offset, limit),
+    }
+    return _with_history(body, history)
@@ -0,0 +1,135 @@
+"""Pagination, sorting and filtering for the list endpoints.
+
+List endpoints return one page of their items together with the total
+number of matches, so clients no longer have to download a whole agent
+collection or event history to show twenty rows of it. A page is selected
+either by `offset` or by the opaque `cursor` returned as `next_cursor` of
+the previous page; without a `limit` every match is returned.
+
+Items may be dicts or model objects (card instances, events): a `value`
+getter reads their sort fields and a `render` function serializes only the
+rows of the returned page.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar, Union
+
+T = TypeVar("T")
+
+# What a sortable field holds: text, a number, or nothing
+SortValue = Union[str, int, float, None]
+
+# Largest page a client may request in one call.
+MAX_PAGE_SIZE = 1000
+
+ORDERS = ("asc", "desc")
+
+
+def _sort_value(value: SortValue) -> tuple:
+    """Sort key placing missing values last and comparing text without case."""
+    if value is None:
+        return (1, 0)
+    if isinstance(value, str):
+        return (0, value.lower())
+    return (0, value)
+
+
+def _item_value(item: Dict, field: str) -> SortValue:
+    return item.get(field)
+
+
+def sort_items(
+    items: List[T],
+    sort: Optional[str],
+    order: str,
+    fields: Sequence[str],
+    value: Callable[[T, str], SortValue] = _item_value,
+) -> List[T]:
+    """Return `items` sorted by one of the allowed `fields`.
+
+    Parameters:
+        items: rows to sort; not modified
+        sort: field to sort by, or None to keep the stored order
+        order: "asc" or "desc"
+        fields: field names clients may sort by
+        value: reads a field of an item (default: dict lookup)
+
+    Raises:
+        ValueError: for an unknown sort field or order
+    """
+    if order not in ORDERS:
+        raise ValueError(f"Unknown sort order: {order}")
+    if sort is None:
+        return items[::-1] if order == "desc" else items
+    if sort not in fields:
+        raise ValueError(f"Unknown sort field: {sort}")
+    # sorted() is stable, so ties keep the stored order
+    return sorted(
+        items,
+        key=lambda item: _sort_value(value(item, sort)),
+        reverse=order == "desc",
+    )
+
+
+def page_offset(offset: int, cursor: Optional[str]) -> int:
+    """Return the first row of a page: the decoded `cursor`, else `offset`.
+
+    Raises:
+        ValueError: for a malformed cursor
+    """
+    if cursor is None:
+        return offset
+    try:
+        value = int(cursor)
+    except ValueError:
+        raise ValueError(f"Invalid cursor: {cursor}") from None
+    if value < 0:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return value
+
+
+def page(
+    key: str, rows: Sequence[Dict], total: int, offset: int, limit: Optional[int]
+) -> Dict:
+    """Build the response of one page of `total` matching rows.
+
+    Returns:
+        {key: rows, "total", "offset", "limit", "next_cursor"}; `next_cursor`
+        is None on the last page.
+    """
+    stop = offset + len(rows)
+    return {
+        key: list(rows),
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "next_cursor": str(stop) if stop < total else None,
+    }
+
+
+def paginate(
+    items: Sequence[T],
+    key: str,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    render: Optional[Callable[[T], Dict]] = None,
+) -> Dict:
+    """Slice one page out of `items` (see `page`).
+
+    Parameters:
+        items: every matching row, already filtered and sorted
+        key: name under which the page is returned
+        offset: index of the first row; ignored when `cursor` is given
+        limit: page size, or None for all remaining rows
+        cursor: `next_cursor` of the previous page
+        render: serializes each row of the page (default: rows are dicts)
+
+    Raises:
+        ValueError: for a malformed cursor
+    """
+    offset = page_offset(offset, cursor)
+    stop = len(items) if limit is None else offset + limit
+    rows = items[offset:stop]
+    if render is not None:
+        rows = [render(item) for item in rows]
+    return page(key, rows, len(items), offset, limit)
@@ -0,0 +1,914 @@
+"""Persistent run store backed by a local SQLite database.
+
+Every finished run is written to normalized tables (runs, tick summaries,
+market snapshots, events, agents, card instances and their price points) in
+a single transaction, so runs survive restarts and any number of them can
+be kept and queried by `run_id` without holding them in memory. Filters,
+sorting and pagination are pushed down into indexed SQL queries.
+
+`save_async` hands the write to a background writer thread and returns the
+run id at once, so request handlers do not wait for the database; reads of
+a run that is still being written wait for its save to finish.
+
+The database path defaults to `backend/data/runs.sqlite3` and can be moved
+with the `POLYDROS_RUN_DB` environment variable. Only the newest
+`MAX_STORED_RUNS` runs are kept (`POLYDROS_MAX_RUNS` overrides it); older
+ones are deleted as new runs are saved.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from simulation.engine import SimulationResult
+
+DEFAULT_PATH = Path(__file__).resolve().parent / "data" / "runs.sqlite3"
+
+# Runs kept in the store; saving a newer one deletes the oldest
+MAX_STORED_RUNS = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    seed INTEGER,
+    initial_agents INTEGER,
+    ticks INTEGER,
+    config TEXT NOT NULL,
+    final TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_created ON runs (created_at);
+
+CREATE TABLE IF NOT EXISTS ticks (
+    run_id TEXT NOT NULL,
+    tick INTEGER NOT NULL,
+    agent_count INTEGER,
+    total_cards INTEGER,
+    distributor_boosters INTEGER,
+    total_unopened_boosters INTEGER,
+    PRIMARY KEY (run_id, tick)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS market_snapshots (
+    run_id TEXT NOT NULL,
+    tick INTEGER NOT NULL,
+    total_volume_traded REAL,
+    cards_traded_count INTEGER,
+    price_index REAL,
+    volatility REAL,
+    unique_cards_in_circulation INTEGER,
+    total_card_instances INTEGER,
+    PRIMARY KEY (run_id, tick)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS events (
+    run_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    tick INTEGER NOT NULL,
+    agent_id INTEGER,
+    event_type TEXT NOT NULL,
+    description TEXT,
+    agent_ids TEXT NOT NULL,
+    triggered INTEGER,
+    PRIMARY KEY (run_id, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS events_by_tick ON events (run_id, tick);
+CREATE INDEX IF NOT EXISTS events_by_agent ON events (run_id, agent_id, tick);
+CREATE INDEX IF NOT EXISTS events_by_type ON events (run_id, event_type, tick);
+
+CREATE TABLE IF NOT EXISTS agents (
+    run_id TEXT NOT NULL,
+    agent_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    prism REAL,
+    name TEXT,
+    nick TEXT,
+    rng_seed INTEGER,
+    collection_count INTEGER,
+    booster_count INTEGER,
+    full_collection TEXT NOT NULL,
+    deck TEXT NOT NULL,
+    traits TEXT NOT NULL,
+    PRIMARY KEY (run_id, agent_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS agents_by_prism ON agents (run_id, prism);
+
+CREATE TABLE IF NOT EXISTS card_instances (
+    run_id TEXT NOT NULL,
+    agent_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    card_instance_id TEXT NOT NULL,
+    card_id TEXT,
+    card_name TEXT,
+    flavor_text TEXT,
+    card_color TEXT,
+    card_rarity TEXT,
+    acquisition_tick INTEGER,
+    acquisition_price REAL,
+    current_price REAL,
+    quality_score REAL,
+    desirability REAL,
+    win_count INTEGER,
+    loss_count INTEGER,
+    condition TEXT,
+    gem_colored INTEGER,
+    gem_colorless INTEGER,
+    PRIMARY KEY (run_id, agent_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS card_instances_by_id
+    ON card_instances (run_id, card_instance_id);
+CREATE INDEX IF NOT EXISTS card_instances_by_rarity
+    ON card_instances (run_id, agent_id, card_rarity COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS card_instances_by_color
+    ON card_instances (run_id, agent_id, card_color COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS price_points (
+    run_id TEXT NOT NULL,
+    card_instance_id TEXT NOT NULL,
+    tick INTEGER NOT NULL,
+    price REAL,
+    quality_score REAL,
+    desirability REAL,
+    PRIMARY KEY (run_id, card_instance_id, tick)
+) WITHOUT ROWID;
+"""
+
+TABLES = (
+    "runs",
+    "ticks",
+    "market_snapshots",
+    "events",
+    "agents",
+    "card_instances",
+    "price_points",
+)
+
+TICK_COLUMNS = (
+    "tick",
+    "agent_count",
+    "total_cards",
+    "distributor_boosters",
+    "total_unopened_boosters",
+)
+MARKET_COLUMNS = (
+    "tick",
+    "total_volume_traded",
+    "cards_traded_count",
+    "price_index",
+    "volatility",
+    "unique_cards_in_circulation",
+    "total_card_instances",
+)
+AGENT_COLUMNS = (
+    "id",
+    "prism",
+    "name",
+    "nick",
+    "rng_seed",
+    "collection_count",
+    "booster_count",
+)
+# Card instance columns in `AgentCardInstance.to_dict` order; price_history
+# is stored in price_points, keyed by card_instance_id and tick, and spliced
+# back in before gem_colored.
+CARD_COLUMNS = (
+    "card_instance_id",
+    "card_id",
+    "card_name",
+    "flavor_text",
+    "card_color",
+    "card_rarity",
+    "agent_id",
+    "acquisition_tick",
+    "acquisition_price",
+    "current_price",
+    "quality_score",
+    "desirability",
+    "win_count",
+    "loss_count",
+    "condition",
+    "gem_colored",
+    "gem_colorless",
+)
+# agent_id is part of the card_instances key
+STORED_CARD_COLUMNS = tuple(c for c in CARD_COLUMNS if c != "agent_id")
+PRICE_COLUMNS = ("tick", "price", "quality_score", "desirability")
+
+# Columns clients may sort agents / cards / events by
+AGENT_SORT_COLUMNS = ("id", "name", "prism", "collection_count", "booster_count")
+CARD_SORT_COLUMNS = (
+    "card_id",
+    "card_name",
+    "card_color",
+    "card_rarity",
+    "acquisition_tick",
+    "acquisition_price",
+    "current_price",
+    "quality_score",
+    "desirability",
+    "win_count",
+    "loss_count",
+)
+EVENT_SORT_COLUMNS = ("tick", "event_type")
+
+
+# Bound parameters per IN (...) query
+_SQL_CHUNK = 500
+
+_EVENT_INSERT = "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+# run_id, agent_id, position and the STORED_CARD_COLUMNS
+_CARD_UPSERT = (
+    "INSERT OR REPLACE INTO card_instances VALUES "
+    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def new_run_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def _order_by(
+    sort: Optional[str], order: str, allowed: Sequence[str], tiebreak: str
+) -> str:
+    """Build an ORDER BY clause from a whitelisted column.
+
+    Text compares without case and missing values sort last; ties keep the
+    stored order, like `backend.query.sort_items`.
+
+    Raises:
+        ValueError: for an unknown sort column or order
+    """
+    if order not in ("asc", "desc"):
+        raise ValueError(f"Unknown sort order: {order}")
+    if sort is None:
+        return f"ORDER BY {tiebreak} {order.upper()}"
+    if sort not in allowed:
+        raise ValueError(f"Unknown sort field: {sort}")
+    column = "agent_id" if sort == "id" else sort
+    return (
+        f"ORDER BY {column} IS NULL, {column} COLLATE NOCASE {order.upper()}, "
+        f"{tiebreak}"
+    )
+
+
+def _page(
+    conn: sqlite3.Connection,
+    table: str,
+    condition: str,
+    params: Sequence,
+    order_by: str,
+    offset: int,
+    limit: Optional[int],
+) -> Tuple[List[sqlite3.Row], int]:
+    """Run the COUNT and the paged SELECT of a filtered list query."""
+    base = f"FROM {table} WHERE {condition}"  # noqa: S608
+    total = conn.execute(f"SELECT COUNT(*) {base}", params).fetchone()[0]
+    rows = conn.execute(
+        f"SELECT * {base} {order_by} LIMIT ? OFFSET ?",
+        (*params, -1 if limit is None else limit, offset),
+    ).fetchall()
+    return rows, total
+
+
+class RunStore:
+    """SQLite-backed store of finished runs.
+
+    Connections are opened per operation, so one store can be shared by the
+    request handlers and the background job threads; writes are serialized
+    with a lock and each run is written in one transaction. Saves queued
+    with `save_async` run on a single writer thread, in order.
+
+    Parameters:
+        path: database file; defaults to $POLYDROS_RUN_DB or DEFAULT_PATH
+        max_runs: runs kept before the oldest are deleted; defaults to
+            $POLYDROS_MAX_RUNS or MAX_STORED_RUNS
+    """
+
+    def __init__(
+        self, path: Optional[os.PathLike] = None, max_runs: Optional[int] = None
+    ) -> None:
+        if path is None:
+            path = os.environ.get("POLYDROS_RUN_DB") or DEFAULT_PATH
+        if max_runs is None:
+            max_runs = int(os.environ.get("POLYDROS_MAX_RUNS") or MAX_STORED_RUNS)
+        self.path = Path(path)
+        self.max_runs = max_runs
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="polydros-store"
+        )
+        self._pending: Dict[str, Future] = {}
+        self._pending_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:  # commits, or rolls back on error
+                yield conn
+        finally:
+            conn.close()
+
+    # -- writing ---------------------------------------------------------
+
+    def save(self, result: Mapping, run_id: Optional[str] = None) -> str:
+        """Write a run result (a `SimulationResult` or its dict) and its id.
+
+        All rows are bulk inserted in one transaction; saving under an
+        existing `run_id` replaces that run, and runs beyond `max_runs` are
+        deleted oldest first. The agent and event views of a
+        `SimulationResult` are serialized one at a time and not cached on it.
+        """
+        run_id = run_id or new_run_id()
+        config = result["config"]
+        if isinstance(result, SimulationResult):
+            agent_views: Iterable[Dict] = result.iter_agents()
+            event_views: Iterable[Dict] = result.iter_events()
+        else:
+            agent_views, event_views = result["agents"], result["events"]
+        events = self._event_rows(run_id, event_views, 0)
+        agents, cards, points = self._agent_rows(run_id, agent_views)
+
+        with self._write_lock, self._connect() as conn:
+            self._delete(conn, run_id)
+            conn.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run_id,
+                    time.time(),
+                    config.get("seed"),
+                    config.get("initial_agents"),
+                    config.get("ticks"),
+                    json.dumps(config),
+                    json.dumps(result["final"]),
+                ),
+            )
+            self._insert_ticks(conn, run_id, result["timeseries"])
+            conn.executemany(_EVENT_INSERT, events)
+            self._insert_agents(conn, agents, cards, points)
+            expired = conn.execute(
+                "SELECT run_id FROM runs ORDER BY created_at DESC, run_id "
+                "LIMIT -1 OFFSET ?",
+                (self.max_runs,),
+            ).fetchall()
+            for (expired_id,) in expired:
+                self._delete(conn, expired_id)
+        return run_id
+
+    def save_async(self, result: Mapping, run_id: Optional[str] = None) -> str:
+        """Queue `save` on the writer thread and return the run id at once.
+
+        The world of a `SimulationResult` must not be advanced until the save
+        is done (see `wait`). A save that fails leaves the run unstored.
+        """
+        run_id = run_id or new_run_id()
+        with self._pending_lock:
+            future = self._writer.submit(self.save, result, run_id)
+            self._pending[run_id] = future
+        future.add_done_callback(lambda done: self._settle(run_id, done))
+        return run_id
+
+    def _settle(self, run_id: str, future: Future) -> None:
+        with self._pending_lock:
+            if self._pending.get(run_id) is future:
+                del self._pending[run_id]
+
+    def exists(self, run_id: str) -> bool:
+        """Whether a run is stored or queued to be."""
+        with self._pending_lock:
+            if run_id in self._pending:
+                return True
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return row is not None
+
+    def wait(self, run_id: Optional[str] = None) -> None:
+        """Block until the queued save of `run_id` (default: every run) is done."""
+        with self._pending_lock:
+            if run_id is None:
+                futures = list(self._pending.values())
+            elif run_id in self._pending:
+                futures = [self._pending[run_id]]
+            else:
+                return
+        wait_futures(futures)
+
+    def append(self, run_id: str, delta: Mapping, since: int) -> None:
+        """Extend a stored run with the ticks after `since`.
+
+        `delta` is `LiveRun.advance`'s:
+
+        - "config", "final": the updated config and final summary
+        - "timeseries": the new entries, whose events are appended after the
+          stored ones
+        - "agents": every agent's summary without card instances and events
+        - "card_instances": the card instances added or changed, each with
+          its "position" among its agent's card instances
+        - "card_counts": the number of card instances of each agent
+        - "removed": ids of the card instances that left every collection
+        - "price_points": the points recorded after `since`, as (card
+          instance id, tick, price, quality_score, desirability)
+
+        Agent rows are replaced and card instance rows written by position,
+        so the work follows what changed rather than the size of the run.
+        Everything is written in one transaction.
+
+        Raises:
+            KeyError: if the run is not stored
+        """
+        self.wait(run_id)
+        config = delta["config"]
+        new_events = [e for entry in delta["timeseries"] for e in entry["events"]]
+        agents, _, _ = self._agent_rows(run_id, delta["agents"])
+        cards = [
+            (
+                run_id,
+                card["agent_id"],
+                card["position"],
+                *(card[c] for c in STORED_CARD_COLUMNS),
+            )
+            for card in delta["card_instances"]
+        ]
+        points = [(run_id, *point) for point in delta["price_points"]]
+
+        with self._write_lock, self._connect() as conn:
+            updated = conn.execute(
+                "UPDATE runs SET ticks = ?, config = ?, final = ? WHERE run_id = ?",
+                (
+                    config.get("ticks"),
+                    json.dumps(config),
+                    json.dumps(delta["final"]),
+                    run_id,
+                ),
+            )
+            if updated.rowcount == 0:
+                raise KeyError(run_id)
+            start = conn.execute(
+                "SELECT COALESCE(MAX(seq) + 1, 0) FROM events WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()[0]
+            conn.execute(
+                "DELETE FROM ticks WHERE run_id = ? AND tick > ?", (run_id, since)
+            )
+            conn.execute(
+                "DELETE FROM market_snapshots WHERE run_id = ? AND tick > ?",
+                (run_id, since),
+            )
+            self._insert_ticks(conn, run_id, delta["timeseries"])
+            conn.executemany(
+                _EVENT_INSERT, self._event_rows(run_id, new_events, start)
+            )
+            conn.executemany(
+                "DELETE FROM price_points WHERE run_id = ? AND card_instance_id = ?",
+                [(run_id, label) for label in delta["removed"]],
+            )
+            conn.execute("DELETE FROM agents WHERE run_id = ?", (run_id,))
+            self._insert_agents(conn, agents, cards, points)
+            # drop the card instances past the end of each collection
+            conn.execute(
+                "DELETE FROM card_instances WHERE run_id = ? AND agent_id NOT IN "
+                "(SELECT agent_id FROM agents WHERE run_id = ?)",
+                (run_id, run_id),
+            )
+            conn.executemany(
+                "DELETE FROM card_instances "
+                "WHERE run_id = ? AND agent_id = ? AND position >= ?",
+                [(run_id, *count) for count in delta["card_counts"].items()],
+            )
+
+    @staticmethod
+    def _event_rows(run_id: str, events: Iterable[Dict], start: int) -> List[Tuple]:
+        return [
+            (
+                run_id,
+                seq,
+                e["tick"],
+                e["agent_id"],
+                e["event_type"],
+                e["description"],
+                json.dumps(e["agent_ids"]),
+                e["triggered"],
+            )
+            for seq, e in enumerate(events, start)
+        ]
+
+    @staticmethod
+    def _agent_rows(
+        run_id: str, agents: Iterable[Dict]
+    ) -> Tuple[List[Tuple], List[Tuple], List[Tuple]]:
+        """Flatten agent summaries into agent, card instance and price rows."""
+        agent_rows = []
+        card_rows = []
+        price_rows = []
+        for position, agent in enumerate(agents):
+            agent_id = agent["id"]
+            agent_rows.append(
+                (
+                    run_id,
+                    agent_id,
+                    position,
+                    *(agent.get(c) for c in AGENT_COLUMNS[1:]),
+                    json.dumps(agent.get("full_collection", [])),
+                    json.dumps(agent.get("deck", [])),
+                    json.dumps(agent.get("traits", {})),
+                )
+            )
+            for card_pos, card in enumerate(agent.get("card_instances", [])):
+                card_rows.append(
+                    (
+                        run_id,
+                        agent_id,
+                        card_pos,
+                        *(card[c] for c in STORED_CARD_COLUMNS),
+                    )
+                )
+                label = card["card_instance_id"]
+                price_rows.extend(
+                    (run_id, label, *(p[c] for c in PRICE_COLUMNS))
+                    for p in card["price_history"]
+                )
+        return agent_rows, card_rows, price_rows
+
+    @staticmethod
+    def _insert_ticks(
+        conn: sqlite3.Connection, run_id: str, timeseries: Sequence[Dict]
+    ) -> None:
+        conn.executemany(
+            "INSERT INTO ticks VALUES (?, ?, ?, ?, ?, ?)",
+            [(run_id, *(e.get(c) for c in TICK_COLUMNS)) for e in timeseries],
+        )
+        conn.executemany(
+            "INSERT INTO market_snapshots VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (run_id, *(e["market_snapshot"].get(c) for c in MARKET_COLUMNS))
+                for e in timeseries
+                if "market_snapshot" in e
+            ],
+        )
+
+    @staticmethod
+    def _insert_agents(
+        conn: sqlite3.Connection,
+        agents: List[Tuple],
+        cards: List[Tuple],
+        points: List[Tuple],
+    ) -> None:
+        conn.executemany(
+            "INSERT INTO agents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", agents
+        )
+        conn.executemany(_CARD_UPSERT, cards)
+        conn.executemany(
+            "INSERT OR REPLACE INTO price_points VALUES (?, ?, ?, ?, ?, ?)", points
+        )
+
+    def delete(self, run_id: str) -> bool:
+        """Remove a run and all of its rows; False if it was not stored."""
+        self.wait(run_id)
+        with self._write_lock, self._connect() as conn:
+            return self._delete(conn, run_id)
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, run_id: str) -> bool:
+        found = False
+        for table in TABLES:
+            sql = f"DELETE FROM {table} WHERE run_id = ?"  # noqa: S608
+            cursor = conn.execute(sql, (run_id,))
+            found = found or (table == "runs" and cursor.rowcount > 0)
+        return found
+
+    # -- reading ---------------------------------------------------------
+
+    @staticmethod
+    def _run_row(row: sqlite3.Row) -> Dict:
+        return {
+            "run_id": row["run_id"],
+            "created_at": row["created_at"],
+            "config": json.loads(row["config"]),
+            "final": json.loads(row["final"]),
+        }
+
+    def list_runs(
+        self, offset: int = 0, limit: Optional[int] = None
+    ) -> Tuple[List[Dict], int]:
+        """Return (runs, total), newest first, without their payloads."""
+        self.wait()
+        order_by = "ORDER BY created_at DESC, run_id"
+        with self._connect() as conn:
+            rows, total = _page(conn, "runs", "1", (), order_by, offset, limit)
+        return [self._run_row(row) for row in rows], total
+
+    def get_run(self, run_id: str) -> Optional[Dict]:
+        """Return a run's id, creation time, config and final summary."""
+        self.wait(run_id)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return None if row is None else self._run_row(row)
+
+    def timeseries(
+        self,
+        run_id: str,
+        tick_min: Optional[int] = None,
+        tick_max: Optional[int] = None,
+    ) -> List[Dict]:
+        """Rebuild the timeseries entries of a run within a tick range."""
+        low = -1 if tick_min is None else tick_min
+        high = 2**62 if tick_max is None else tick_max
+        self.wait(run_id)
+        with self._connect() as conn:
+            ticks = conn.execute(
+                "SELECT * FROM ticks WHERE run_id = ? AND tick BETWEEN ? AND ? "
+                "ORDER BY tick",
+                (run_id, low, high),
+            ).fetchall()
+            markets = conn.execute(
+                "SELECT * FROM market_snapshots "
+                "WHERE run_id = ? AND tick BETWEEN ? AND ?",
+                (run_id, low, high),
+            ).fetchall()
+            events = conn.execute(
+                "SELECT * FROM events WHERE run_id = ? AND tick BETWEEN ? AND ? "
+                "ORDER BY seq",
+                (run_id, low, high),
+            ).fetchall()
+
+        by_tick: Dict[int, List[Dict]] = {}
+        for row in events:
+            by_tick.setdefault(row["tick"], []).append(self._event(row))
+        snapshots = {row["tick"]: row for row in markets}
+        entries = []
+        for row in ticks:
+            entry = {c: row[c] for c in TICK_COLUMNS}
+            snapshot = snapshots.get(row["tick"])
+            if snapshot is not None:
+                entry["events"] = by_tick.get(row["tick"], [])
+                entry["market_snapshot"] = {c: snapshot[c] for c in MARKET_COLUMNS}
+            entries.append(entry)
+        return entries
+
+    @staticmethod
+    def _event(row: sqlite3.Row) -> Dict:
+        return {
+            "tick": row["tick"],
+            "agent_id": row["agent_id"],
+            "event_type": row["event_type"],
+            "description": row["description"],
+            "agent_ids": json.loads(row["agent_ids"]),
+            "triggered": None if row["triggered"] is None else bool(row["triggered"]),
+        }
+
+    def events(
+        self,
+        run_id: str,
+        agent_id: Optional[int] = None,
+        event_types: Optional[Sequence[str]] = None,
+        tick_min: Optional[int] = None,
+        tick_max: Optional[int] = None,
+        sort: Optional[str] = None,
+        order: str = "asc",
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Dict], int]:
+        """Return (events, total matches) of a run.
+
+        `agent_id` selects the events the agent was the primary actor of,
+        matching an agent summary's "agent_events".
+
+        Raises:
+            ValueError: for an unknown sort field or order
+        """
+        where = ["run_id = ?"]
+        params: List = [run_id]
+        if agent_id is not None:
+            where.append("agent_id = ?")
+            params.append(agent_id)
+        if event_types:
+            where.append(f"event_type IN ({', '.join('?' * len(event_types))})")
+            params.extend(event_types)
+        if tick_min is not None:
+            where.append("tick >= ?")
+            params.append(tick_min)
+        if tick_max is not None:
+            where.append("tick <= ?")
+            params.append(tick_max)
+        condition = " AND ".join(where)
+        order_by = _order_by(sort, order, EVENT_SORT_COLUMNS, "seq")
+        self.wait(run_id)
+        with self._connect() as conn:
+            rows, total = _page(
+                conn, "events", condition, params, order_by, offset, limit
+            )
+        return [self._event(row) for row in rows], total
+
+    @staticmethod
+    def _overview(row: sqlite3.Row) -> Dict:
+        return {
+            "id": row["agent_id"],
+            "prism": row["prism"],
+            "name": row["name"],
+            "nick": row["nick"],
+            "collection_count": row["collection_count"],
+            "booster_count": row["booster_count"],
+        }
+
+    def agents(
+        self,
+        run_id: str,
+        prism_min: Optional[float] = None,
+        prism_max: Optional[float] = None,
+        sort: Optional[str] = None,
+        order: str = "asc",
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Dict], int]:
+        """Return (agent overview rows, total matches) of a run.
+
+        `prism_min` and `prism_max` bound the Prism balance inclusively.
+
+        Raises:
+            ValueError: for an unknown sort field or order
+        """
+        where = ["run_id = ?"]
+        params: List = [run_id]
+        if prism_min is not None:
+            where.append("prism >= ?")
+            params.append(prism_min)
+        if prism_max is not None:
+            where.append("prism <= ?")
+            params.append(prism_max)
+        condition = " AND ".join(where)
+        order_by = _order_by(sort, order, AGENT_SORT_COLUMNS, "position")
+        self.wait(run_id)
+        with self._connect() as conn:
+            rows, total = _page(
+                conn, "agents", condition, params, order_by, offset, limit
+            )
+        return [self._overview(row) for row in rows], total
+
+    def _agent_row(self, run_id: str, agent_id: int) -> Optional[sqlite3.Row]:
+        self.wait(run_id)
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT * FROM agents WHERE run_id = ? AND agent_id = ?",
+                (run_id, agent_id),
+            ).fetchone()
+
+    def overview(self, run_id: str, agent_id: int) -> Optional[Dict]:
+        """Return one agent's overview row (see `agents`)."""
+        row = self._agent_row(run_id, agent_id)
+        return None if row is None else self._overview(row)
+
+    def agent(self, run_id: str, agent_id: int) -> Optional[Dict]:
+        """Rebuild one agent's full summary, as `SimulationResult.agent`."""
+        row = self._agent_row(run_id, agent_id)
+        if row is None:
+            return None
+        cards, _ = self.cards(run_id, agent_id)
+        events, _ = self.events(run_id, agent_id=agent_id)
+        return self._summary(row, cards, events)
+
+    @staticmethod
+    def _summary(row: sqlite3.Row, cards: List[Dict], events: List[Dict]) -> Dict:
+        return {
+            "id": row["agent_id"],
+            "prism": row["prism"],
+            "name": row["name"],
+            "nick": row["nick"],
+            "rng_seed": row["rng_seed"],
+            "collection_count": row["collection_count"],
+            "booster_count": row["booster_count"],
+            "full_collection": json.loads(row["full_collection"]),
+            "card_instances": cards,
+            "deck": json.loads(row["deck"]),
+            "traits": json.loads(row["traits"]),
+            "agent_events": events,
+        }
+
+    def cards(
+        self,
+        run_id: str,
+        agent_id: int,
+        rarity: Optional[str] = None,
+        color: Optional[str] = None,
+        sort: Optional[str] = None,
+        order: str = "asc",
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Dict], int]:
+        """Return (card instances with price history, total matches).
+
+        `rarity` and `color` match without case.
+
+        Raises:
+            ValueError: for an unknown sort field or order
+        """
+        where = ["run_id = ?", "agent_id = ?"]
+        params: List = [run_id, agent_id]
+        if rarity is not None:
+            where.append("card_rarity = ? COLLATE NOCASE")
+            params.append(rarity)
+        if color is not None:
+            where.append("card_color = ? COLLATE NOCASE")
+            params.append(color)
+        condition = " AND ".join(where)
+        order_by = _order_by(sort, order, CARD_SORT_COLUMNS, "position")
+        self.wait(run_id)
+        with self._connect() as conn:
+            rows, total = _page(
+                conn, "card_instances", condition, params, order_by, offset, limit
+            )
+            labels = [row["card_instance_id"] for row in rows]
+            history: Dict[str, List[Dict]] = {label: [] for label in labels}
+            for chunk in range(0, len(labels), _SQL_CHUNK):
+                batch = labels[chunk : chunk + _SQL_CHUNK]
+                points = conn.execute(
+                    "SELECT * FROM price_points WHERE run_id = ? AND "  # noqa: S608
+                    f"card_instance_id IN ({', '.join('?' * len(batch))}) "
+                    "ORDER BY card_instance_id, tick",
+                    (run_id, *batch),
+                )
+                for point in points:
+                    history[point["card_instance_id"]].append(
+                        {c: point[c] for c in PRICE_COLUMNS}
+                    )
+
+        cards = [self._card(row, history[row["card_instance_id"]]) for row in rows]
+        return cards, total
+
+    @staticmethod
+    def _card(row: sqlite3.Row, history: List[Dict]) -> Dict:
+        card = {c: row[c] for c in CARD_COLUMNS[:-2]}
+        card["price_history"] = history
+        card["gem_colored"] = row["gem_colored"]
+        card["gem_colorless"] = row["gem_colorless"]
+        return card
+
+    def result(self, run_id: str) -> Optional[Dict]:
+        """Rebuild the full `/run` payload of a stored run.
+
+        Agents, card instances, price points and events are each read with
+        one query for the whole run and grouped here, rather than queried
+        agent by agent.
+        """
+        run = self.get_run(run_id)
+        if run is None:
+            return None
+        timeseries = self.timeseries(run_id)
+        with self._connect() as conn:
+            agent_rows, card_rows, point_rows, event_rows = (
+                conn.execute(sql, (run_id,)).fetchall()
+                for sql in (
+                    "SELECT * FROM agents WHERE run_id = ? ORDER BY position",
+                    "SELECT * FROM card_instances WHERE run_id = ? "
+                    "ORDER BY agent_id, position",
+                    "SELECT * FROM price_points WHERE run_id = ? "
+                    "ORDER BY card_instance_id, tick",
+                    "SELECT * FROM events WHERE run_id = ? ORDER BY seq",
+                )
+            )
+
+        history: Dict[str, List[Dict]] = {}
+        for point in point_rows:
+            history.setdefault(point["card_instance_id"], []).append(
+                {c: point[c] for c in PRICE_COLUMNS}
+            )
+        cards: Dict[int, List[Dict]] = {}
+        for row in card_rows:
+            card = self._card(row, history.get(row["card_instance_id"], []))
+            cards.setdefault(row["agent_id"], []).append(card)
+        events = []
+        agent_events: Dict[int, List[Dict]] = {}
+        for row in event_rows:
+            event = self._event(row)
+            events.append(event)
+            agent_events.setdefault(row["agent_id"], []).append(event)
+        return {
+            "config": run["config"],
+            "timeseries": timeseries,
+            "final": run["final"],
+            "agents": [
+                self._summary(
+                    row,
+                    cards.get(row["agent_id"], []),
+                    agent_events.get(row["agent_id"], []),
+                )
+                for row in agent_rows
+            ],
+            "events": events,
+        }
@@ -5,7 +5,7 @@ import json
 from simulation.engine import run_simulation, SimulationConfig
 
 cfg = SimulationConfig(seed=42, initial_agents=2, ticks=1)
-result = run_simulation(cfg)
+result = run_simulation(cfg).to_dict()
 
 # Check first agent's card instances
 if result['agents']:
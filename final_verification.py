@@ -166,7 +166,7 @@ try:
     from simulation import run_simulation, SimulationConfig
     
     cfg = SimulationConfig(seed=42, initial_agents=2, ticks=5)
-    result = run_simulation(cfg)
+    result = run_simulation(cfg).to_dict()
     
     agent = result['agents'][0] if result['agents'] else None
     if agent:
@@ -1,11 +1,27 @@
+// Card price histories are requested in the compact form (utils/priceHistory.ts)
 export async function runSimulation(body: { seed: number; agents: number; ticks: number; }) {
-  const res = await fetch('http://127.0.0.1:8000/run', {
+  const res = await fetch('http://127.0.0.1:8000/run?history=compact', {
     method: 'POST',
     headers: { 'Content-Type': 'application/json' },
     body: JSON.stringify(body),
   })
   if (!res.ok) throw new Error('API error')
-  return res.json()
+  // The stored run's id, needed to advance it later
+  return { ...(await res.json()), run_id: res.headers.get('X-Run-Id') }
+}
+
+// Continue a stored run by `ticks`: {run_id, tick, timeseries (new entries only), agents?}
+export async function advanceRun(runId: string, ticks: number, includeAgents = false) {
+  const params = new URLSearchParams({
+    ticks: String(ticks),
+    include_agents: String(includeAgents),
+    history: 'compact',
+  })
+  const res = await fetch(`http://127.0.0.1:8000/runs/${runId}/advance?${params}`, { method: 'POST' })
+  if (!res.ok) throw new Error('API error')
+  const body = await res.json()
+  if (body.error) throw new Error(body.error)
+  return body
 }
 
 export async function getAgents() {
@@ -15,7 +31,61 @@ export async function getAgents() {
 }
 
 export async function getAgent(id: number) {
-  const res = await fetch(`http://127.0.0.1:8000/agents/${id}`)
+  const res = await fetch(`http://127.0.0.1:8000/agents/${id}?history=compact`)
+  if (!res.ok) throw new Error('API error')
+  return res.json()
+}
+
+export type PageQuery = Record<string, string | number | undefined>
+
+async function getPage(path: string, query: PageQuery = {}) {
+  const params = new URLSearchParams()
+  Object.entries(query).forEach(([key, value]) => {
+    if (value !== undefined && value !== '') params.set(key, String(value))
+  })
+  const res = await fetch(`http://127.0.0.1:8000${path}?${params}`)
   if (!res.ok) throw new Error('API error')
   return res.json()
 }
+
+// Server-side pages of an agent's cards / events: {cards|events, total, next_cursor}
+export function getAgentCards(id: number, query?: PageQuery) {
+  return getPage(`/agents/${id}/cards`, { history: 'compact', ...query })
+}
+
+export function getAgentEvents(id: number, query?: PageQuery) {
+  return getPage(`/agents/${id}/events`, query)
+}
+
+export async function streamSimulation(
+  body: { seed: number; agents: number; ticks: number; },
+  onTick: (point: any) => void,
+  onResult?: (result: any) => void,
+) {
+  const res = await fetch('http://127.0.0.1:8000/run/stream?history=compact', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', Accept: 'application/x-ndjson' },
+    body: JSON.stringify(body),
+  })
+  if (!res.ok || !res.body) throw new Error('API error')
+
+  // Each line of the NDJSON response is one {type, data} message
+  const reader = res.body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+  const handle = (line: string) => {
+    if (!line.trim()) return
+    const message = JSON.parse(line)
+    if (message.type === 'tick') onTick(message.data)
+    else if (message.type === 'result' && onResult) onResult(message.data)
+  }
+  for (;;) {
+    const { done, value } = await reader.read()
+    if (done) break
+    buffer += decoder.decode(value, { stream: true })
+    const lines = buffer.split('\n')
+    buffer = lines.pop() ?? ''
+    lines.forEach(handle)
+  }
+  handle(buffer + decoder.decode())
+}
@@ -1,6 +1,7 @@
 import React, { useEffect, useState } from 'react'
 import { formatPrice, formatPriceWithCap } from '../utils/priceFormatter'
 import CardDetail from './CardDetail'
+import { decodePriceHistory } from '../utils/priceHistory'
 
 type PricePoint = {
   tick: number
@@ -82,7 +83,7 @@ export default function AgentInventory({ agentId, agents }: AgentInventoryProps)
           quality_score: instance.quality_score || 0,
           price: instance.current_price || 0,
           attractiveness: instance.desirability || 0,
-          priceHistory: instance.price_history || [],
+          priceHistory: decodePriceHistory(instance.price_history),
           power: instance.power,
           health: instance.health,
           cost: instance.cost,
@@ -132,7 +133,7 @@ export default function AgentInventory({ agentId, agents }: AgentInventoryProps)
             quality_score: instance.quality_score || 0,
             price: instance.current_price || 0,
             attractiveness: instance.desirability || 0,
-            priceHistory: instance.price_history || [],
+            priceHistory: decodePriceHistory(instance.price_history),
             power: instance.power,
             health: instance.health,
             cost: instance.cost,
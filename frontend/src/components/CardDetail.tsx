@@ -1,12 +1,6 @@
 import React, { useEffect, useState } from 'react'
 import { formatPrice, formatPriceWithCap } from '../utils/priceFormatter'
-
-type PriceDataPoint = {
-  tick: number
-  price: number
-  quality_score: number
-  desirability: number
-}
+import { decodePriceHistory, PriceHistory } from '../utils/priceHistory'
 
 type CardData = {
   card_id: string
@@ -22,7 +16,7 @@ type CardData = {
   gem_colored?: number
   gem_colorless?: number
   flavor_text?: string
-  priceHistory?: PriceDataPoint[]
+  priceHistory?: PriceHistory // point list or compact encoding
 }
 
 type CardStats = {
@@ -39,6 +33,10 @@ interface CardDetailProps {
 
 export default function CardDetail({ card, onClose }: CardDetailProps) {
   const { formatted: formattedPrice, isCapped } = formatPriceWithCap(card.price)
+  const priceHistory = React.useMemo(
+    () => decodePriceHistory(card.priceHistory),
+    [card.priceHistory],
+  )
   const rarityColors: Record<string, string> = {
     Common: '#888888',
     Uncommon: '#2d5016',
@@ -183,7 +181,7 @@ export default function CardDetail({ card, onClose }: CardDetailProps) {
           <div className="card-price-graph-section">
             <h4>Price History</h4>
             <div className="price-graph-placeholder">
-              {card.priceHistory && card.priceHistory.length > 0 ? (
+              {priceHistory.length > 0 ? (
                 <>
                   <svg viewBox="0 0 350 180" className="price-graph">
                     {/* Grid lines */}
@@ -196,14 +194,14 @@ export default function CardDetail({ card, onClose }: CardDetailProps) {
 
                     {/* Calculate scaling */}
                     {(() => {
-                      const prices = card.priceHistory.map(p => p.price)
+                      const prices = priceHistory.map(p => p.price)
                       const minPrice = Math.min(...prices)
                       const maxPrice = Math.max(...prices)
                       const priceRange = maxPrice - minPrice || 1
-                      const tickRange = card.priceHistory.length - 1 || 1
+                      const tickRange = priceHistory.length - 1 || 1
 
                       // Generate points for polyline
-                      const points = card.priceHistory.map((point, idx) => {
+                      const points = priceHistory.map((point, idx) => {
                         const x = 40 + (idx / tickRange) * 290
                         const y = 150 - ((point.price - minPrice) / priceRange) * 150
                         return `${x},${y}`
@@ -220,7 +218,7 @@ export default function CardDetail({ card, onClose }: CardDetailProps) {
                           />
                           {/* Current price dot */}
                           {(() => {
-                            const lastPoint = card.priceHistory[card.priceHistory.length - 1]
+                            const lastPoint = priceHistory[priceHistory.length - 1]
                             const x = 40 + 290
                             const y = 150 - ((lastPoint.price - minPrice) / priceRange) * 150
                             return <circle cx={x} cy={y} r="3" fill="#FF6B6B" />
@@ -245,8 +243,8 @@ export default function CardDetail({ card, onClose }: CardDetailProps) {
 
                     {/* Y-axis tick labels */}
                     {(() => {
-                      if (card.priceHistory.length === 0) return null
-                      const prices = card.priceHistory.map(p => p.price)
+                      if (priceHistory.length === 0) return null
+                      const prices = priceHistory.map(p => p.price)
                       const minPrice = Math.min(...prices)
                       const maxPrice = Math.max(...prices)
                       return [0, 50, 100, 150].map((y) => (
@@ -258,9 +256,9 @@ export default function CardDetail({ card, onClose }: CardDetailProps) {
 
                     {/* X-axis tick labels (show first, middle, last tick) */}
                     {(() => {
-                      if (card.priceHistory.length === 0) return null
-                      const first = card.priceHistory[0].tick
-                      const last = card.priceHistory[card.priceHistory.length - 1].tick
+                      if (priceHistory.length === 0) return null
+                      const first = priceHistory[0].tick
+                      const last = priceHistory[priceHistory.length - 1].tick
                       const mid = Math.floor((first + last) / 2)
                       const ticks = [first, mid, last]
                       const tickRange = last - first || 1
@@ -302,7 +300,7 @@ export default function CardDetail({ card, onClose }: CardDetailProps) {
                         </tr>
                       </thead>
                       <tbody>
-                        {card.priceHistory.slice(-10).map((point, idx) => (
+                        {priceHistory.slice(-10).map((point, idx) => (
                           <tr key={idx} style={{ borderBottom: '1px solid #eee' }}>
                             <td style={{ textAlign: 'left', padding: '0.5rem' }}>{point.tick}</td>
                             <td style={{ textAlign: 'right', padding: '0.5rem' }}>{formatPrice(point.price)}</td>
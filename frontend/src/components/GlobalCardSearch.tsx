@@ -1,5 +1,6 @@
 import React, { useEffect, useState } from 'react'
 import CardDetail from './CardDetail'
+import { decodePriceHistory } from '../utils/priceHistory'
 import { formatPrice } from '../utils/priceFormatter'
 
 type PriceDataPoint = {
@@ -78,7 +79,7 @@ export default function GlobalCardSearch({ agents }: GlobalCardSearchProps) {
           quality_score: instance.quality_score || 0,
           price: instance.current_price || 0,
           attractiveness: instance.desirability || 0,
-          priceHistory: instance.price_history || [],
+          priceHistory: decodePriceHistory(instance.price_history),
           power: instance.power,
           health: instance.health,
           gem_colored: instance.gem_colored || 0,
@@ -10,7 +10,7 @@ import {
   Tooltip,
   Legend,
 } from 'chart.js'
-import { runSimulation } from '../api.ts'
+import { advanceRun, runSimulation, streamSimulation } from '../api.ts'
 import CardDetail from './CardDetail'
 
 // Register Chart.js components
@@ -79,6 +79,8 @@ export default function SimulationRunner({
   const [agentsData, setAgentsData] = useState<any[]>([])
   const [cards, setCards] = useState<Card[]>([])
   const [selectedCard, setSelectedCard] = useState<Card | null>(null)
+  // Stored run being shown, advanced in place while seed and agents are unchanged
+  const [run, setRun] = useState<{ id: string; seed: number; agents: number } | null>(null)
 
   // Load cards from public/cards/cards.json on component mount
   React.useEffect(() => {
@@ -110,6 +112,7 @@ export default function SimulationRunner({
         setCurrentTick(state.currentTick ?? 0)
         setAllEvents(state.allEvents ?? [])
         setData(state.data ?? null)
+        setRun(state.run ?? null)
         setInitialized(true)
         return
       } catch (err) {
@@ -148,6 +151,7 @@ export default function SimulationRunner({
         const res = await runSimulation({ seed, agents, ticks: 0 })
         const series = res.timeseries as TimeseriesPoint[]
         setData(series)
+        setRun(res.run_id ? { id: res.run_id, seed, agents } : null)
         
         // Pass agents data to parent
         if (onAgents && res.agents) {
@@ -191,42 +195,77 @@ export default function SimulationRunner({
     
     setLoading(true)
     try {
-      // Run simulation from current tick forward
       const nextTick = currentTick + ticks
-      const res = await runSimulation({ seed, agents, ticks: nextTick })
-      const series = res.timeseries as TimeseriesPoint[]
-      const newEvents: SimulationEvent[] = []
-      
-      setData(series)
-      setCurrentTick(nextTick)
-      
-      // Pass agents data to parent
-      if (onAgents && res.agents) {
-        onAgents(res.agents)
+      const showTick = (point: TimeseriesPoint) => {
+        if (onWorldSummary) {
+          onWorldSummary({
+            tick: point.tick,
+            agent_count: point.agent_count,
+            total_cards: point.total_cards,
+            total_unopened_boosters: point.total_unopened_boosters,
+          })
+        }
       }
-      
-      // Use the last timeseries point as the current world summary
-      if (onWorldSummary && series.length > 0) {
-        const last = series[series.length - 1]
-        onWorldSummary({
-          tick: last.tick,
-          agent_count: last.agent_count,
-          total_cards: last.total_cards,
-          total_unopened_boosters: last.total_unopened_boosters,
-        })
+      let series: TimeseriesPoint[] = []
+      let newEvents: SimulationEvent[] = []
+      let nextRun = run
+
+      // Continue the stored run from its current tick: only the new ticks are simulated
+      if (run && run.seed === seed && run.agents === agents && data) {
+        try {
+          const res = await advanceRun(run.id, ticks, true)
+          const added = res.timeseries as TimeseriesPoint[]
+          series = [...data, ...added]
+          newEvents = [...allEvents]
+          added.forEach((point) => {
+            if (point.events && Array.isArray(point.events)) newEvents.push(...point.events)
+          })
+          setData(series)
+          setCurrentTick(res.tick)
+          if (added.length > 0) showTick(added[added.length - 1])
+          if (onEvents) onEvents(newEvents)
+          if (onAgents && res.agents) onAgents(res.agents)
+        } catch (err) {
+          console.warn('Advancing the stored run failed; re-running from tick 0:', err)
+          series = []
+          nextRun = null
+        }
+      }
+
+      // Otherwise run the simulation from tick 0, rendering each tick as it arrives
+      if (series.length === 0) {
+        newEvents = []
+        await streamSimulation(
+          { seed, agents, ticks: nextTick },
+          (point: TimeseriesPoint) => {
+            series.push(point)
+            setData([...series])
+            setCurrentTick(point.tick)
+            showTick(point)
+
+            if (point.events && Array.isArray(point.events)) {
+              newEvents.push(...point.events)
+              if (onEvents) {
+                onEvents([...newEvents])
+              }
+            }
+          },
+          (result) => {
+            // Pass agents data to parent once the run is complete
+            if (onAgents && result.agents) {
+              onAgents(result.agents)
+            }
+            nextRun = result.run_id ? { id: result.run_id, seed, agents } : null
+          },
+        )
       }
-      
-      // Collect all events from all ticks
+      setRun(nextRun)
+      setCurrentTick(nextTick)
+      setAllEvents(newEvents)
       if (onEvents) {
-        series.forEach((point) => {
-          if (point.events && Array.isArray(point.events)) {
-            newEvents.push(...point.events)
-          }
-        })
-        setAllEvents(newEvents)
         onEvents(newEvents)
       }
-      
+
       // Save state to sessionStorage
       const state = {
         seed,
@@ -234,6 +273,7 @@ export default function SimulationRunner({
         currentTick: nextTick,
         data: series,
         allEvents: newEvents,
+        run: nextRun,
       }
       sessionStorage.setItem('simulationRunnerState', JSON.stringify(state))
     } catch (err) {
@@ -246,6 +286,7 @@ export default function SimulationRunner({
 
   function onReset() {
     setCurrentTick(0)
+    setRun(null)
     setAllEvents([])
     // Clear persisted state
     sessionStorage.removeItem('simulationRunnerState')
@@ -256,6 +297,7 @@ export default function SimulationRunner({
         const res = await runSimulation({ seed, agents, ticks: 0 })
         const series = res.timeseries as TimeseriesPoint[]
         setData(series)
+        setRun(res.run_id ? { id: res.run_id, seed, agents } : null)
         
         // Pass agents data to parent
         if (onAgents && res.agents) {
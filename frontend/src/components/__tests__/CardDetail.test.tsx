@@ -146,6 +146,29 @@ describe('CardDetail - Data Structure Validation', () => {
     expect(card.price).toBe(0.0)
   })
 
+  it('decodes a compact price history', () => {
+    const card = {
+      card_id: 'C006',
+      name: 'Compact Card',
+      color: 'Ruby',
+      rarity: 'Rare',
+      is_hologram: false,
+      quality_score: 8.0,
+      price: 1.25,
+      priceHistory: {
+        encoding: 'delta-rle' as const,
+        ticks: [0, 1],
+        runs: [2, 1],
+        price: [100, 25],
+        quality_score: [8.0, 8.0],
+        desirability: [5.0, 5.0],
+      },
+    }
+    const { container } = render(<CardDetail card={card} onClose={() => {}} />)
+    expect(container.textContent).toContain('1.25')
+    expect(container.textContent).not.toContain('No price history')
+  })
+
   it('validates rarity colors are defined', () => {
     const rarities = ['Common', 'Uncommon', 'Rare', 'Mythic', 'Player', 'Alternate Art']
     rarities.forEach((rarity) => {
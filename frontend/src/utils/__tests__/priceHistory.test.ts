@@ -0,0 +1,25 @@
+import { describe, it, expect } from 'vitest'
+import { decodePriceHistory, CompactPriceHistory } from '../priceHistory'
+
+describe('decodePriceHistory', () => {
+  it('passes point lists through', () => {
+    const points = [{ tick: 1, price: 0.33, quality_score: 10, desirability: 7 }]
+    expect(decodePriceHistory(points)).toBe(points)
+    expect(decodePriceHistory(undefined)).toEqual([])
+  })
+
+  it('expands runs with tick gaps and price deltas', () => {
+    const compact: CompactPriceHistory = {
+      encoding: 'delta-rle',
+      ticks: [3, 1, 3],
+      runs: [3, 1, 2],
+      price: [100, 25, -91],
+      quality_score: [10, 9.7, 9.7],
+      desirability: [7, 7, 6.5],
+    }
+    const points = decodePriceHistory(compact)
+    expect(points.map((p) => p.tick)).toEqual([3, 4, 5, 6, 9, 10])
+    expect(points.map((p) => p.price)).toEqual([1, 1, 1, 1.25, 0.34, 0.34])
+    expect(points[5]).toEqual({ tick: 10, price: 0.34, quality_score: 9.7, desirability: 6.5 })
+  })
+})
@@ -0,0 +1,49 @@
+/**
+ * Price history transport formats.
+ *
+ * The API sends a card's price history either as a list of points or, with
+ * `history=compact`, delta/run-length encoded (see
+ * simulation.types.encode_price_history): each run is a span of consecutive
+ * ticks with an unchanged point.
+ */
+
+export type PricePoint = {
+  tick: number
+  price: number
+  quality_score: number
+  desirability: number
+}
+
+export type CompactPriceHistory = {
+  encoding: 'delta-rle'
+  ticks: number[] // gap from the previous run's last tick (first: the first tick)
+  runs: number[] // points per run
+  price: number[] // change in cents from the previous run (first: absolute)
+  quality_score: number[]
+  desirability: number[]
+}
+
+export type PriceHistory = PricePoint[] | CompactPriceHistory
+
+export function decodePriceHistory(history: PriceHistory | null | undefined): PricePoint[] {
+  if (!history) return []
+  if (Array.isArray(history)) return history
+
+  const points: PricePoint[] = []
+  let tick = 0
+  let cents = 0
+  history.runs.forEach((length, run) => {
+    tick += history.ticks[run]
+    cents += history.price[run]
+    for (let offset = 0; offset < length; offset++) {
+      points.push({
+        tick: tick + offset,
+        price: cents / 100,
+        quality_score: history.quality_score[run],
+        desirability: history.desirability[run],
+      })
+    }
+    tick += length - 1
+  })
+  return points
+}
@@ -11,6 +11,7 @@ Usage:
 """
 
 import json
+import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -145,6 +146,13 @@ def main() -> None:
         json.dump(cards, f, indent=2, ensure_ascii=False)
 
     print(f"Exported cards to: {json_path}")
+
+    # Refresh the compiled catalogue so new processes skip JSON parsing.
+    # Running processes pick up the new JSON on their next load anyway.
+    sys.path.insert(0, str(repo_root))
+    from simulation.cards import compile_catalogue
+
+    print(f"Compiled catalogue: {compile_catalogue()}")
     print("Done!")
 
 
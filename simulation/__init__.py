@@ -3,6 +3,6 @@
 Expose high-level API here for convenience.
 """
 
-from .engine import SimulationConfig, run_simulation
+from .engine import SimulationConfig, SimulationResult, iter_simulation, run_simulation
 
-__all__ = ["run_simulation", "SimulationConfig"]
+__all__ = ["run_simulation", "iter_simulation", "SimulationConfig", "SimulationResult"]
@@ -2,10 +2,19 @@
 
 Provides functions to sample packs from a card pool using a provided random
 .Random instance to guarantee determinism when seeded.
+
+`BoosterSampler` precompiles the pool once (per-rarity candidate arrays and
+cumulative weight tables) so repeated pack opening does not rescan the pool.
+It consumes exactly the same random draws as `random.Random.choices`, so packs
+are identical to the original per-call implementation for the same seed.
 """
 
 import random
-from typing import List, Sequence
+from bisect import bisect
+from itertools import accumulate
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
 
 from .types import CardInstance, CardRef, Rarity
 
@@ -16,14 +25,181 @@ DEFAULT_PACK_TEMPLATE = {
     Rarity.PLAYER: 1,  # one player card per pack
 }
 
+HOLOGRAM_CHANCE = 0.02
+MYTHIC_UPGRADE_CHANCE = 0.05
+MYTHIC_HOLOGRAM_CHANCE = 0.05
+
+
+class _RaritySlot:
+    """Candidates and cumulative weights for one rarity slot of a pack."""
+
+    __slots__ = ("count", "indices", "refs", "cum_weights", "cum_array", "total", "hi")
+
+    def __init__(self, pool: Sequence[CardRef], rarity: Rarity, count: int) -> None:
+        self.count = count
+        self.indices = np.array(
+            [i for i, c in enumerate(pool) if c.rarity == rarity], dtype=np.int64
+        )
+        self.refs = [pool[i] for i in self.indices.tolist()]
+        self.cum_weights = list(accumulate(c.pack_weight for c in self.refs))
+        self.cum_array = np.array(self.cum_weights, dtype=np.float64)
+        self.total = self.cum_weights[-1] + 0.0 if self.cum_weights else 0.0
+        self.hi = len(self.refs) - 1
+        if self.refs and not self.total > 0.0:
+            raise ValueError(f"Total pack weight for {rarity.value} cards must be > 0")
+
+
+class BoosterSampler:
+    """Booster pack sampler compiled once from a card pool.
+
+    Parameters:
+        pool: sequence of CardRef available; card indices returned by
+            `open_many` are positions in this sequence
+        template: rarity -> number of cards per pack
+    """
+
+    def __init__(
+        self,
+        pool: Sequence[CardRef],
+        template: Dict[Rarity, int] = DEFAULT_PACK_TEMPLATE,
+    ) -> None:
+        self.cards: List[CardRef] = list(pool)
+        self._slots = [
+            slot
+            for slot in (
+                _RaritySlot(self.cards, rarity, count)
+                for rarity, count in template.items()
+            )
+            if slot.refs
+        ]
+        self.pack_size = sum(slot.count for slot in self._slots)
+
+        # Rare positions in a pack, in pack order, for the mythic upgrade
+        self._rare_positions: List[int] = []
+        offset = 0
+        for slot in self._slots:
+            if slot.refs[0].rarity == Rarity.RARE:
+                self._rare_positions.extend(range(offset, offset + slot.count))
+            offset += slot.count
+
+        self._mythic_indices = [
+            i for i, c in enumerate(self.cards) if c.rarity == Rarity.MYTHIC
+        ]
 
-def _filter_by_rarity(pool: Sequence[CardRef], rarity: Rarity) -> List[CardRef]:
-    return [c for c in pool if c.rarity == rarity]
+    def open_pack(self, rng: random.Random) -> List[CardInstance]:
+        """Open a single booster pack.
+
+        Parameters:
+            rng: seeded random.Random instance for determinism
+
+        Returns:
+            list of CardInstance objects representing cards opened
+        """
+        rnd = rng.random
+        instances: List[CardInstance] = []
+        for slot in self._slots:
+            refs, cum, total, hi = slot.refs, slot.cum_weights, slot.total, slot.hi
+            chosen = [
+                refs[bisect(cum, rnd() * total, 0, hi)] for _ in range(slot.count)
+            ]
+            for ref in chosen:
+                # Very small chance to set hologram flag for any card
+                instances.append(
+                    CardInstance(ref=ref, is_hologram=rnd() < HOLOGRAM_CHANCE)
+                )
+
+        # Simple rare->mythic upgrade
+        if (
+            rnd() < MYTHIC_UPGRADE_CHANCE
+            and self._mythic_indices
+            and self._rare_positions
+        ):
+            pos = self._rare_positions[rng.randrange(len(self._rare_positions))]
+            new_ref = self.cards[rng.choice(self._mythic_indices)]
+            instances[pos] = CardInstance(
+                ref=new_ref, is_hologram=rnd() < MYTHIC_HOLOGRAM_CHANCE
+            )
+
+        return instances
+
+    def open_many(self, n: int, rng: random.Random) -> Tuple[np.ndarray, np.ndarray]:
+        """Open `n` packs at once.
+
+        The random draws are consumed in the same order as `n` calls to
+        `open_pack`; weighted lookups for every slot are then resolved in one
+        vectorized search per rarity.
+
+        Returns:
+            (indices, holograms): int64 array of shape (n, pack_size) holding
+            positions in `cards`, and a bool array of the same shape
+        """
+        return self.open_batch([(rng, n)])
+
+    def open_batch(
+        self, draws: Sequence[Tuple[random.Random, int]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Open the packs of several generators in one batch.
+
+        `draws` holds (rng, packs) pairs, e.g. one per agent opening boosters
+        this tick. Each generator is consumed exactly like `packs` calls to
+        `open_pack`, and the weighted lookups of every pack are resolved in
+        one vectorized search per rarity.
+
+        Returns:
+            (indices, holograms) as in `open_many`, one row per pack in the
+            order of `draws`
+        """
+        card_draws: List[float] = []
+        holo_draws: List[float] = []
+        upgrades: List[Tuple[int, int, int, bool]] = []
+        counts = [slot.count for slot in self._slots]
+        p = 0
+        for rng, packs in draws:
+            rnd = rng.random
+            for _ in range(packs):
+                for count in counts:
+                    card_draws += [rnd() for _ in range(count)]
+                    holo_draws += [rnd() for _ in range(count)]
+                if (
+                    rnd() < MYTHIC_UPGRADE_CHANCE
+                    and self._mythic_indices
+                    and self._rare_positions
+                ):
+                    pos = self._rare_positions[rng.randrange(len(self._rare_positions))]
+                    card = rng.choice(self._mythic_indices)
+                    upgrades.append((p, pos, card, rnd() < MYTHIC_HOLOGRAM_CHANCE))
+                p += 1
+
+        shape = (p, self.pack_size)
+        slot_draws = np.array(card_draws, dtype=np.float64).reshape(shape)
+        holograms = np.array(holo_draws, dtype=np.float64).reshape(shape)
+        holograms = holograms < HOLOGRAM_CHANCE
+        indices = np.empty(shape, dtype=np.int64)
+        col = 0
+        for slot in self._slots:
+            # searchsorted(side="right") is bisect; clip mirrors its hi bound
+            found = np.searchsorted(
+                slot.cum_array,
+                slot_draws[:, col : col + slot.count] * slot.total,
+                side="right",
+            )
+            np.minimum(found, slot.hi, out=found)
+            indices[:, col : col + slot.count] = slot.indices[found]
+            col += slot.count
+
+        for p, pos, card, is_holo in upgrades:
+            indices[p, pos] = card
+            holograms[p, pos] = is_holo
+
+        return indices, holograms
 
 
 def open_booster(pool: Sequence[CardRef], rng: random.Random) -> List[CardInstance]:
     """Open a single booster pack.
 
+    Compiles a `BoosterSampler` for the pool on every call; callers opening
+    many packs from the same pool should build the sampler once instead.
+
     Parameters:
         pool: sequence of CardRef available
         rng: seeded random.Random instance for determinism
@@ -31,34 +207,4 @@ def open_booster(pool: Sequence[CardRef], rng: random.Random) -> List[CardInstan
     Returns:
         list of CardInstance objects representing cards opened
     """
-    # Simple implementation: select exact counts per rarity using weights
-    instances: List[CardInstance] = []
-
-    for rarity, count in DEFAULT_PACK_TEMPLATE.items():
-        candidates = _filter_by_rarity(pool, rarity)
-        if not candidates:
-            continue
-        weights = [c.pack_weight for c in candidates]
-        chosen = rng.choices(candidates, weights=weights, k=count)
-        for c in chosen:
-            # Very small chance to set hologram flag for any card
-            is_holo = rng.random() < 0.02
-            instances.append(CardInstance(ref=c, is_hologram=is_holo))
-
-    # Simple rare->mythic upgrade
-    if rng.random() < 0.05:
-        # try to replace one rare with a mythic if available
-        mythics = _filter_by_rarity(pool, Rarity.MYTHIC)
-        rares = [i for i in instances if i.ref.rarity == Rarity.RARE]
-        if mythics and rares:
-            replace_idx = rng.randrange(len(rares))
-            new_ref = rng.choice(mythics)
-            # replace in place
-            for idx, inst in enumerate(instances):
-                if inst is rares[replace_idx]:
-                    instances[idx] = CardInstance(
-                        ref=new_ref, is_hologram=rng.random() < 0.05
-                    )
-                    break
-
-    return instances
+    return BoosterSampler(pool).open_pack(rng)
@@ -0,0 +1,211 @@
+"""Deterministic result cache with tick-prefix reuse.
+
+A run is fully determined by its seed, agent count, tick count and the card
+catalogue, so finished runs can be reused instead of recomputed. The cache
+keeps each run's final state as a compressed checkpoint (see
+`checkpoint.py`), keyed by the catalogue digest and the config:
+
+- a request for a cached config is served by decoding its checkpoint;
+- a request for more ticks of a cached seed and agent count resumes from
+  the longest cached run (e.g. 500 ticks continue a cached 300-tick state),
+  which gives exactly the output of a run from tick 0.
+
+Entries are evicted least recently used first once the cache holds more
+than `max_entries` runs or `max_bytes` of checkpoint data. New runs are
+encoded on a background thread, off the request that produced them; a
+lookup of the same world waits for them. Every lookup decodes a fresh copy
+of the world, so results may be advanced freely once `wait` says their own
+entry is written.
+Only runs on the full card pool are cached; both engines share entries as
+they produce identical output.
+
+Example:
+    cache = ResultCache()
+    result = cache.run(SimulationConfig(seed=1, ticks=300))
+    longer = cache.run(SimulationConfig(seed=1, ticks=500))  # resumes at 300
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import replace
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .cards import catalogue_digest
+from .checkpoint import Checkpoint, decode_checkpoint, encode_checkpoint
+from .engine import (
+    SimulationConfig,
+    SimulationResult,
+    SimulationStream,
+    build_result,
+    iter_simulation,
+)
+
+# Default bounds: runs kept and total size of their compressed checkpoints
+MAX_CACHED_RUNS = 64
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class CacheKey(NamedTuple):
+    digest: str  # catalogue_digest() the run used
+    seed: int
+    initial_agents: int
+    ticks: int
+
+
+class ResultCache:
+    """Bounded LRU cache of finished runs, reused as tick prefixes.
+
+    Thread-safe; decoding and simulating happen outside the lock, encoding
+    on a single writer thread.
+
+    Parameters:
+        max_entries: runs kept before the least recently used are evicted
+        max_bytes: total checkpoint bytes kept before evicting
+    """
+
+    def __init__(
+        self, max_entries: int = MAX_CACHED_RUNS, max_bytes: int = MAX_CACHE_BYTES
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="polydros-cache"
+        )
+        self._pending: Dict[CacheKey, Future] = {}
+        self.hits = 0
+        self.prefix_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(config: SimulationConfig) -> CacheKey:
+        return CacheKey(
+            catalogue_digest(), config.seed, config.initial_agents, config.ticks
+        )
+
+    def wait(self, key: Optional[CacheKey] = None) -> None:
+        """Block until the queued run of `key` (default: every run) is cached."""
+        with self._lock:
+            if key is None:
+                futures = list(self._pending.values())
+            elif key in self._pending:
+                futures = [self._pending[key]]
+            else:
+                return
+        wait_futures(futures)
+
+    def _longest_prefix(self, key: CacheKey) -> Optional[Tuple[CacheKey, bytes]]:
+        """Return the cached run of `key`'s world with the most ticks <= its own.
+
+        Runs of that world still being encoded are waited for first.
+        """
+        with self._lock:
+            queued = [
+                future
+                for cached, future in self._pending.items()
+                if cached[:3] == key[:3] and cached.ticks <= key.ticks
+            ]
+        wait_futures(queued)
+        with self._lock:
+            best = None
+            for cached in self._entries:
+                if cached[:3] == key[:3] and cached.ticks <= key.ticks:
+                    if best is None or cached.ticks > best.ticks:
+                        best = cached
+            if best is None:
+                self.misses += 1
+                return None
+            if best.ticks == key.ticks:
+                self.hits += 1
+            else:
+                self.prefix_hits += 1
+            self._entries.move_to_end(best)
+            return best, self._entries[best]
+
+    def resume(
+        self, config: SimulationConfig, engine: str = "object"
+    ) -> Tuple[SimulationStream, List[Dict]]:
+        """Start `config` from its longest cached prefix.
+
+        Returns:
+            (stream, timeseries): a stream that yields the remaining ticks
+            (none on an exact hit) and the cached entries before them
+        """
+        found = self._longest_prefix(self.key(config))
+        if found is None:
+            return iter_simulation(config, engine=engine), []
+        checkpoint = decode_checkpoint(found[1])
+        config = replace(checkpoint.config, ticks=config.ticks)
+        return checkpoint.stream(config, engine), list(checkpoint.timeseries or [])
+
+    def put(self, result: SimulationResult) -> None:
+        """Queue a run on the full card pool to be cached.
+
+        Its world must not have advanced, and is encoded in the background:
+        `wait` for its key before handing the world on to be advanced.
+        """
+        key = self.key(replace(result.config, ticks=result.world.tick))
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+            if key in self._pending:
+                return
+            checkpoint = Checkpoint(
+                replace(result.config),
+                "object",
+                result.world,
+                None,
+                list(result.timeseries),
+            )
+            self._pending[key] = self._writer.submit(self._add, key, checkpoint)
+
+    def _add(self, key: CacheKey, checkpoint: Checkpoint) -> None:
+        """Encode a queued run and add it, evicting the least recently used."""
+        try:
+            data = encode_checkpoint(checkpoint)
+        except Exception:
+            with self._lock:
+                del self._pending[key]
+            raise
+        with self._lock:
+            del self._pending[key]
+            if key in self._entries or len(data) > self.max_bytes:
+                return
+            self._entries[key] = data
+            self._bytes += len(data)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def run(self, config: SimulationConfig, engine: str = "object") -> SimulationResult:
+        """`run_simulation(config, engine)`, served from and added to the cache."""
+        stream, timeseries = self.resume(config, engine)
+        timeseries.extend(stream)
+        stream.final()
+        result = build_result(stream.config, stream.world, timeseries)
+        self.put(result)
+        return result
+
+    def clear(self) -> None:
+        self.wait()
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        """Return entry count, size in bytes and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "prefix_hits": self.prefix_hits,
+                "misses": self.misses,
+            }
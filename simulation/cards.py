@@ -5,29 +5,46 @@ from the Excel master set (polydros_master_set_v1.xlsx) using the script in
 scripts/export_cards_from_excel.py.
 
 This module provides helpers to load the full card pool or filtered subsets.
+The parsed catalogue is cached per process and keyed by the JSON file's mtime
+and size, so regenerating the JSON invalidates it automatically. A compiled
+pickle of the catalogue (`cards.pickle` next to the JSON) lets new processes
+such as sweep workers skip JSON parsing. It is only written by the explicit
+build step, `compile_catalogue`, and only unpickled when its header records
+the SHA-256 of the JSON being loaded.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import pickle
+import threading
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, NamedTuple, Optional, Tuple
 
 from .types import CardRef, Rarity
 
 
 _CARDS_PATH = Path(__file__).resolve().parent / "data" / "cards.json"
+_COMPILED_PATH = _CARDS_PATH.with_suffix(".pickle")
+# Compiled artifact header: magic, layout version, then the JSON's SHA-256
+_COMPILED_MAGIC = b"PLYCARDS"
+# Bump when the compiled layout or CardRef fields change
+_COMPILED_VERSION = 2
+# Cards with at least this pack_weight form the sample pool
+_SAMPLE_MIN_WEIGHT = 5.0
 
 
-def _load_raw_cards() -> List[Dict]:
-    """Load raw card dicts from the JSON data file.
+class _Catalogue(NamedTuple):
+    key: Tuple[int, int]  # (mtime_ns, size) of the JSON it was built from
+    digest: str  # SHA-256 of the JSON
+    cards: Tuple[CardRef, ...]
+    sample: Tuple[int, ...]  # indices of the sample_card_pool cards
+    index: Dict[str, int]  # card_id -> position in `cards`
 
-    Raises FileNotFoundError if the data file is missing so callers can handle
-    the error early in tests or runtime.
-    """
-    with _CARDS_PATH.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
-    return data
+
+_CATALOGUE: Optional[_Catalogue] = None
+_CATALOGUE_LOCK = threading.Lock()
 
 
 def _make_cardref(d: Dict) -> CardRef:
@@ -50,10 +67,109 @@ def _make_cardref(d: Dict) -> CardRef:
     )
 
 
+def _file_key(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _compiled_header(digest: str) -> bytes:
+    return _COMPILED_MAGIC + bytes([_COMPILED_VERSION]) + digest.encode("ascii")
+
+
+def _read_compiled(digest: str) -> Optional[Tuple]:
+    """Return (cards, sample) from the compiled artifact if it matches digest.
+
+    The header is compared before anything is unpickled, so only an artifact
+    compiled from this exact JSON is loaded.
+    """
+    header = _compiled_header(digest)
+    try:
+        with _COMPILED_PATH.open("rb") as fh:
+            if fh.read(len(header)) != header:
+                return None
+            # compile_catalogue wrote this for the JSON just hashed
+            cards, sample = pickle.load(fh)  # noqa: S301
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        return None
+    return cards, sample
+
+
+def _write_compiled(digest: str, cards: Tuple, sample: Tuple) -> None:
+    tmp = _COMPILED_PATH.with_suffix(".pickle.tmp")
+    with tmp.open("wb") as fh:
+        fh.write(_compiled_header(digest))
+        pickle.dump((cards, sample), fh, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp.replace(_COMPILED_PATH)
+
+
+def _compile(raw: List[Dict]) -> Tuple[Tuple[CardRef, ...], Tuple[int, ...]]:
+    cards = tuple(_make_cardref(d) for d in raw)
+    sample = tuple(
+        i for i, d in enumerate(raw) if d.get("pack_weight", 0) >= _SAMPLE_MIN_WEIGHT
+    )
+    return cards, sample
+
+
+def _catalogue() -> _Catalogue:
+    """Return the cached catalogue, rebuilding it if the JSON has changed.
+
+    On a rebuild the compiled artifact is used when its recorded digest
+    matches the JSON; otherwise the JSON is parsed. Loading never writes the
+    artifact; run `compile_catalogue` to refresh it.
+    """
+    global _CATALOGUE
+    key = _file_key(_CARDS_PATH)
+    cached = _CATALOGUE
+    if cached is not None and cached.key == key:
+        return cached
+
+    with _CATALOGUE_LOCK:
+        if _CATALOGUE is not None and _CATALOGUE.key == key:
+            return _CATALOGUE
+        data = _CARDS_PATH.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        compiled = _read_compiled(digest)
+        if compiled is None:
+            compiled = _compile(json.loads(data))
+        cards, sample = compiled
+        index = {card.card_id: i for i, card in enumerate(cards)}
+        _CATALOGUE = _Catalogue(key, digest, cards, sample, index)
+        return _CATALOGUE
+
+
+def compile_catalogue() -> Path:
+    """Parse the JSON and (re)write the compiled artifact; return its path.
+
+    Called by scripts/export_cards_from_excel.py after regenerating the JSON.
+    """
+    data = _CARDS_PATH.read_bytes()
+    _write_compiled(hashlib.sha256(data).hexdigest(), *_compile(json.loads(data)))
+    clear_card_cache()
+    return _COMPILED_PATH
+
+
+def clear_card_cache() -> None:
+    """Drop the in-process catalogue so the next load re-reads the data."""
+    global _CATALOGUE
+    _CATALOGUE = None
+
+
+def card_indices() -> Dict[str, int]:
+    """Return card_id -> dense integer index (the card's catalogue position).
+
+    The mapping is shared by every caller and must not be modified.
+    """
+    return _catalogue().index
+
+
+def catalogue_digest() -> str:
+    """Return the SHA-256 of the card data, identifying the catalogue content."""
+    return _catalogue().digest
+
+
 def load_all_cards() -> List[CardRef]:
-    """Return all cards from the master set JSON."""
-    raw = _load_raw_cards()
-    return [_make_cardref(d) for d in raw]
+    """Return all cards from the master set JSON (served from the cache)."""
+    return list(_catalogue().cards)
 
 
 def sample_card_pool() -> List[CardRef]:
@@ -61,8 +177,8 @@ def sample_card_pool() -> List[CardRef]:
 
     Filters to cards with high pack_weight (>= 5.0) to get a manageable subset.
     """
-    raw = _load_raw_cards()
-    return [_make_cardref(d) for d in raw if d.get("pack_weight", 0) >= 5.0]
+    catalogue = _catalogue()
+    return [catalogue.cards[i] for i in catalogue.sample]
 
 
 def large_card_pool() -> List[CardRef]:
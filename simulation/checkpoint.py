@@ -0,0 +1,185 @@
+"""Checkpoint, resume and fork simulations.
+
+A checkpoint is a compact binary snapshot of a `SimulationStream` after a
+completed tick: the whole `WorldState` (agents with their collections, card
+instances and price history, card metadata, distributor stock, events,
+market state and tick) plus the config, engine and card pool it runs with.
+No RNG state needs saving because every random draw is derived from an
+agent's `rng_seed` and the tick number.
+
+Resuming a checkpoint continues with the next tick and produces exactly the
+output of an uninterrupted run. Resuming with a changed config forks the
+run: `ticks` moves the final tick, and a different `seed` re-derives the
+agents' RNG seeds so the fork diverges from the original from the next tick
+on (`initial_agents` only applies to fresh worlds).
+
+Example:
+    stream = iter_simulation(SimulationConfig(seed=1, ticks=1000))
+    timeseries = [next(stream) for _ in range(501)]
+    stream.checkpoint("run.ckpt", timeseries)
+    ...
+    result = resume_simulation("run.ckpt")
+"""
+
+import os
+import pickle
+import random
+import zlib
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .engine import (
+    SimulationConfig,
+    SimulationResult,
+    SimulationStream,
+    build_result,
+)
+from .world import WorldState
+
+if TYPE_CHECKING:
+    from .types import CardRef
+
+# File header: magic plus format version
+_MAGIC = b"PLYCKPT"
+CHECKPOINT_VERSION = 3
+
+
+@dataclass
+class Checkpoint:
+    """Contents of a checkpoint file.
+
+    Parameters:
+        config: config of the run the checkpoint was taken from
+        engine: engine mode the run used
+        world: world state after tick `world.tick`
+        pool: card pool boosters are opened from (None for the full pool)
+        timeseries: timeseries entries up to the checkpoint tick, if saved
+    """
+
+    config: SimulationConfig
+    engine: str
+    world: WorldState
+    pool: Optional[Tuple["CardRef", ...]] = None
+    timeseries: Optional[List[Dict]] = field(default=None, repr=False)
+
+    @property
+    def tick(self) -> int:
+        """Last completed tick."""
+        return self.world.tick
+
+    def stream(
+        self, config: Optional[SimulationConfig] = None, engine: Optional[str] = None
+    ) -> SimulationStream:
+        """Continue the run lazily from the tick after the checkpoint.
+
+        The stream takes ownership of the checkpoint's world, so a checkpoint
+        can be streamed only once; load it again to resume it twice.
+
+        Parameters:
+            config: config to continue with (default: the checkpoint's);
+                a different seed forks the run, see the module docstring
+            engine: engine mode to continue with (default: the checkpoint's)
+        """
+        config = self.config if config is None else config
+        if config.seed != self.config.seed:
+            reseed_agents(self.world, config.seed)
+        return SimulationStream(
+            config,
+            engine=self.engine if engine is None else engine,
+            pool=self.pool,
+            world=self.world,
+        )
+
+
+def reseed_agents(world: WorldState, seed: int) -> None:
+    """Derive fresh per-agent RNG seeds from `seed`, in agent order."""
+    rng = random.Random(seed)
+    for agent in world.agents.values():
+        agent.rng_seed = rng.randint(0, 2 ** 31 - 1)
+
+
+def save_checkpoint(
+    stream: SimulationStream,
+    path: os.PathLike,
+    timeseries: Optional[List[Dict]] = None,
+) -> None:
+    """Write a checkpoint of `stream` after its latest completed tick.
+
+    The world is pickled and zlib-compressed; the file is replaced
+    atomically so an interrupted write never leaves a broken checkpoint.
+
+    Parameters:
+        stream: simulation to checkpoint; it can keep running afterwards
+        path: checkpoint file to write
+        timeseries: entries yielded so far, saved so a resumed run can
+            return a complete result
+    """
+    stream.final()  # write columnar state back onto the agents
+    pool = None if stream.pool is None else tuple(stream.pool)
+    checkpoint = Checkpoint(
+        replace(stream.config), stream.engine, stream.world, pool, timeseries
+    )
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as fh:
+        fh.write(encode_checkpoint(checkpoint))
+    tmp.replace(path)
+
+
+def encode_checkpoint(checkpoint: Checkpoint) -> bytes:
+    """Serialize a checkpoint to the bytes of a checkpoint file."""
+    data = zlib.compress(pickle.dumps(checkpoint, protocol=pickle.HIGHEST_PROTOCOL))
+    return _MAGIC + bytes([CHECKPOINT_VERSION]) + data
+
+
+def decode_checkpoint(raw: bytes, path: object = "data") -> Checkpoint:
+    """Deserialize bytes written by `encode_checkpoint`.
+
+    `path` names the source in error messages. Every call returns a new
+    copy of the world, so decoded checkpoints can be advanced independently.
+
+    Raises:
+        ValueError: if the data is not a checkpoint of this version
+    """
+    header = len(_MAGIC) + 1
+    if raw[: len(_MAGIC)] != _MAGIC:
+        raise ValueError(f"{path} is not a simulation checkpoint")
+    if raw[len(_MAGIC)] != CHECKPOINT_VERSION:
+        raise ValueError(
+            f"Checkpoint version {raw[len(_MAGIC)]} is not supported "
+            f"(expected {CHECKPOINT_VERSION})"
+        )
+    try:
+        checkpoint = pickle.loads(zlib.decompress(raw[header:]))  # noqa: S301
+    except (zlib.error, pickle.UnpicklingError, EOFError) as exc:
+        raise ValueError(f"Corrupt checkpoint {path}: {exc}") from None
+    return checkpoint
+
+
+def load_checkpoint(path: os.PathLike) -> Checkpoint:
+    """Read a checkpoint written by `save_checkpoint`.
+
+    Raises:
+        ValueError: if the file is not a checkpoint of this version
+    """
+    return decode_checkpoint(Path(path).read_bytes(), path)
+
+
+def resume_simulation(
+    path: os.PathLike,
+    config: Optional[SimulationConfig] = None,
+    engine: Optional[str] = None,
+) -> SimulationResult:
+    """Run a checkpoint to the end of its (or the given) config.
+
+    The result's timeseries starts with the entries saved in the checkpoint,
+    so resuming an uninterrupted run's checkpoint returns the same result as
+    the uninterrupted run. See `Checkpoint.stream` for the parameters.
+    """
+    checkpoint = load_checkpoint(path)
+    stream = checkpoint.stream(config, engine)
+    timeseries = list(checkpoint.timeseries or [])
+    timeseries.extend(stream)
+    stream.final()
+    return build_result(stream.config, stream.world, timeseries)
@@ -0,0 +1,249 @@
+"""Columnar (struct-of-arrays) engine mode.
+
+The object engine in `engine.py` walks `WorldState.agents` once per phase per
+tick. This module keeps the per-agent scalars (Prism, boosters, collection
+size, RNG seed, collector trait, deck score and deck qualities) in contiguous
+NumPy arrays indexed by agent row, so the buy, open, play and aging phases are
+driven by whole-population masks. All of a tick's booster packs are sampled
+in one `BoosterSampler.open_batch` call and price points are recorded as one
+block per tick (see `WorldState.record_price_points`). Python-level work is
+limited to the agents a phase actually selects: the per-agent RNG draws,
+creating the opened card instances and logging events.
+
+Agent objects remain the home of collections, card instances and names; their
+scalars go stale while the engine runs and are written back by `sync()`.
+Output is identical to the object engine for the same seed.
+"""
+
+import random
+from typing import Dict, List
+
+import numpy as np
+
+from .booster import BoosterSampler
+from .engine import (
+    BOOSTER_COST,
+    BUY_COUNT,
+    DEFAULT_OPEN,
+    calculate_card_price,
+    maintain_decks,
+    pack_age_event,
+    purchase_event,
+    resolve_matches,
+)
+from .types import AgentCardInstance, CardInstance
+from .world import DECK_SIZE, Agent, WorldState
+
+
+class ColumnarEngine:
+    """Advance a `WorldState` using population-wide array operations.
+
+    Parameters:
+        world: tick-0 world created by `engine.create_world`
+        sampler: compiled booster sampler packs are opened from
+    """
+
+    def __init__(self, world: WorldState, sampler: BoosterSampler) -> None:
+        self.world = world
+        self.sampler = sampler
+        self.agents: List[Agent] = list(world.agents.values())
+        n = len(self.agents)
+
+        self.prism = np.array([a.prism for a in self.agents], dtype=np.float64)
+        self.boosters = np.array([a.boosters for a in self.agents], dtype=np.int64)
+        self.collection_size = np.array(
+            [len(a.collection) for a in self.agents], dtype=np.int64
+        )
+        self.rng_seed = np.array([a.rng_seed for a in self.agents], dtype=np.int64)
+        self.has_traits = np.array(
+            [a.traits is not None for a in self.agents], dtype=bool
+        )
+        self.collector_trait = np.array(
+            [a.traits.collector_trait if a.traits else 0.0 for a in self.agents],
+            dtype=np.float64,
+        )
+
+        # Deck state is only meaningful once an agent holds a full deck; the
+        # first 40 cards of a collection never change, so the score is fixed.
+        self.has_deck = np.zeros(n, dtype=bool)
+        self.deck_score = np.zeros(n, dtype=np.float64)
+        self.deck_quality = np.zeros((n, DECK_SIZE), dtype=np.float64)
+        self._init_decks()
+
+        # Price and quality of a fresh copy of every card of the pool
+        self._card_prices = [calculate_card_price(ref) for ref in sampler.cards]
+        self._card_qualities = [float(ref.quality_score) for ref in sampler.cards]
+
+    def _init_decks(self) -> None:
+        """Score and load qualities for agents that just reached a full deck."""
+        rows = np.flatnonzero(~self.has_deck & (self.collection_size >= DECK_SIZE))
+        for r in rows:
+            agent = self.agents[r]
+            deck = agent.collection[:DECK_SIZE]
+            self.deck_score[r] = agent.deck_stats().score
+            self.deck_quality[r] = [c.effective_quality() for c in deck]
+        self.has_deck[rows] = True
+
+    def _tick_rolls(
+        self, rows: np.ndarray, t: int, cache: Dict[int, float]
+    ) -> np.ndarray:
+        """Return each row's `Random(rng_seed + t + 2000).random()` draw.
+
+        The buy and play phases both consume this draw, so it is computed at
+        most once per agent per tick.
+        """
+        rolls = np.empty(len(rows), dtype=np.float64)
+        for i, r in enumerate(rows.tolist()):
+            roll = cache.get(r)
+            if roll is None:
+                roll = random.Random(int(self.rng_seed[r]) + t + 2000).random()
+                cache[r] = roll
+            rolls[i] = roll
+        return rolls
+
+    def _open_boosters(self, rows: np.ndarray, counts: np.ndarray, t: int) -> None:
+        """Open `counts[r]` boosters for every row in `rows` as one batch.
+
+        Every agent's packs are drawn from its own generator exactly as in
+        `open_agent_boosters`, but all of the tick's packs are sampled with a
+        single `BoosterSampler.open_batch` call, and card prices and qualities
+        come from per-card tables instead of being computed per copy.
+        """
+        if not len(rows):
+            return
+        packs = counts[rows].tolist()
+        indices, holograms = self.sampler.open_batch(
+            [
+                (random.Random(int(self.rng_seed[r]) + t + 1000), n)
+                for r, n in zip(rows.tolist(), packs, strict=True)
+            ]
+        )
+        cards = self.sampler.cards
+        prices, qualities = self._card_prices, self._card_qualities
+        opened = indices.ravel().tolist()
+        holo = holograms.ravel().tolist()
+        start = 0
+        for r, n in zip(rows.tolist(), packs, strict=True):
+            agent = self.agents[r]
+            stop = start + n * self.sampler.pack_size
+            picked = opened[start:stop]
+            agent.add_cards(
+                [
+                    CardInstance(ref=cards[i], is_hologram=h)
+                    for i, h in zip(picked, holo[start:stop], strict=True)
+                ]
+            )
+            for i in picked:
+                agent.add_card_instance(
+                    AgentCardInstance(
+                        card_instance_id=agent.next_card_serial(),
+                        ref=cards[i],
+                        agent_id=agent.id,
+                        acquisition_tick=t,
+                        acquisition_price=prices[i],
+                        current_price=prices[i],
+                        quality_score=qualities[i],
+                        desirability=5.0,
+                        win_count=0,
+                        loss_count=0,
+                    )
+                )
+            self.collection_size[r] = len(agent.collection)
+            start = stop
+
+    def step(self, t: int) -> None:
+        """Advance the world by one tick."""
+        world = self.world
+        world.tick = t
+        rolls: Dict[int, float] = {}
+
+        # Buying phase: under 60 cards always buy; afterwards only when the
+        # collector trait roll triggers. Stock goes to buyers in agent order.
+        cost = BUY_COUNT * BOOSTER_COST
+        gated = (self.collection_size >= 60) & self.has_traits
+        gated_rows = np.flatnonzero(gated)
+        wants = ~gated
+        wants[gated_rows] = (
+            self._tick_rolls(gated_rows, t, rolls) < self.collector_trait[gated_rows]
+        )
+        candidates = np.flatnonzero(wants & (self.prism >= cost))
+        buyers = candidates[: world.distributor_boosters // BUY_COUNT]
+        if len(buyers):
+            self.boosters[buyers] += BUY_COUNT
+            world.distributor_boosters -= BUY_COUNT * len(buyers)
+            # Python's round, as the object engine (np.round can differ on
+            # binary half-way values)
+            self.prism[buyers] = [
+                round(prism - cost, 2) for prism in self.prism[buyers].tolist()
+            ]
+            for r in buyers.tolist():
+                roll = rolls[r] if gated[r] else None
+                world.add_event(purchase_event(self.agents[r], t, roll))
+
+        # Opening phase: agents open up to DEFAULT_OPEN boosters
+        open_counts = np.minimum(DEFAULT_OPEN, self.boosters)
+        self._open_boosters(np.flatnonzero(open_counts > 0), open_counts, t)
+        self.boosters -= np.maximum(open_counts, 0)
+        self._init_decks()
+
+        # Play phase: agents with a deck play on a roll below 0.5 against a
+        # random other deck holder; the tick's matches are resolved in one
+        # batch and every deck that plays degrades by 1%
+        eligible = np.flatnonzero(self.has_deck)
+        players = eligible[self._tick_rolls(eligible, t, rolls) < 0.5]
+        opponents = np.full(len(players), -1, dtype=np.int64)
+        if len(eligible) > 1:
+            # Same draw as `choice()` over the other deck holders in order
+            own = np.searchsorted(eligible, players)
+            for i, r in enumerate(players.tolist()):
+                opponent_rng = random.Random(int(self.rng_seed[r]) + t + 2001)
+                k = opponent_rng.randrange(len(eligible) - 1)
+                opponents[i] = eligible[k + (k >= own[i])]
+        matched = opponents >= 0
+        scores = np.zeros((len(players), 2), dtype=np.float64)
+        scores[:, 0] = self.deck_score[players]
+        scores[matched, 1] = self.deck_score[opponents[matched]]
+        matches = [
+            (self.agents[r], self.agents[o] if o >= 0 else None)
+            for r, o in zip(players.tolist(), opponents.tolist(), strict=True)
+        ]
+        resolve_matches(world, matches, t, scores)
+        played = np.concatenate([players, opponents[matched]])
+        if len(played):
+            np.multiply.at(self.deck_quality, played, 1.0 - 0.01)
+
+        # Aging phase: unopened boosters age every 180 ticks
+        if t > 0 and t % 180 == 0:
+            for r in np.flatnonzero(self.boosters > 0).tolist():
+                boosters = int(self.boosters[r])
+                world.add_event(pack_age_event(self.agents[r], boosters, t))
+
+        # Deck maintenance: every 20 ticks, replace low-feasibility deck cards
+        if t > 0 and t % 20 == 0:
+            rows = eligible.tolist()
+            maintain_decks(world, (self.agents[r] for r in rows), t)
+            for r in rows:
+                self.deck_score[r] = self.agents[r].deck_stats().score
+
+    def summary(self) -> Dict:
+        """Return the same counters as `WorldState.summary` from the arrays."""
+        return {
+            "tick": self.world.tick,
+            "agent_count": len(self.agents),
+            "total_cards": int(self.collection_size.sum()),
+            "distributor_boosters": self.world.distributor_boosters,
+            "total_unopened_boosters": int(self.boosters.sum()),
+        }
+
+    def sync(self) -> None:
+        """Write the array state back onto the Agent objects and their decks."""
+        for r, agent in enumerate(self.agents):
+            agent.prism = float(self.prism[r])
+            agent.boosters = int(self.boosters[r])
+            if self.has_deck[r]:
+                for card, quality in zip(
+                    agent.collection[:DECK_SIZE],
+                    self.deck_quality[r].tolist(),
+                    strict=False,
+                ):
+                    card.quality_score = quality
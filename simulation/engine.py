@@ -5,17 +5,31 @@ unit tests. It follows the project's requirements for RNG seeding and
 reproducibility.
 """
 
+import os
 import random
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
 
 from .agents import generate_agent_traits
-from .booster import open_booster
-from .cards import large_card_pool
-from .world import Agent, Event, WorldState
+from .booster import BoosterSampler
+from .cards import card_indices, large_card_pool
+from .types import AgentCardInstance
+from .world import Agent, CardMetadataTable, DeckStats, Event, WorldState
 
 if TYPE_CHECKING:
-    from .types import CardRef, CardInstance
+    from .types import CardInstance, CardRef
 
 
 def round_price(price: float) -> float:
@@ -23,19 +37,6 @@ def round_price(price: float) -> float:
     return round(price, 2)
 
 
-def generate_card_instance_id(
-    card_id: str, agent_id: int, tick: int, rng: random.Random
-) -> str:
-    """Generate a unique card instance ID.
-
-    Format: INST_{card_id}_{agent_id}_{tick}_{random}
-
-    This ensures uniqueness while maintaining determinism with seeded RNG.
-    """
-    random_part = rng.randint(100000, 999999)
-    return f"INST_{card_id}_{agent_id}_{tick}_{random_part}"
-
-
 def calculate_card_price(card_ref: "CardRef") -> float:
     """Calculate market price for a card based on rarity, frequency, and quality.
 
@@ -209,28 +210,12 @@ def calculate_combat_score(deck: List["CardInstance"]) -> float:
 
     Returns:
         total combat score (can be positive or negative)
-    """
-    if not deck:
-        return 0.0
 
-    # Calculate total gems (gem_colored + gem_colorless)
-    total_gems = sum(
-        card.ref.gem_colored + card.ref.gem_colorless for card in deck
-    )
-    if total_gems == 0:
-        # Avoid division by zero; if no gems, score is average power - health
-        return sum(card.ref.power - card.ref.health for card in deck)
+    Agents cache this per deck; see `Agent.deck_stats`.
+    """
+    return DeckStats.from_cards(deck).score
 
-    # Calculate score: attack contribution minus defence contribution
-    score = 0.0
-    for card in deck:
-        # Attack (power) contributes positively
-        attack_contribution = card.ref.power / total_gems
-        # Defence (health) subtracts from opponent
-        defence_contribution = card.ref.health / total_gems
-        score += attack_contribution - defence_contribution
 
-    return score
 @dataclass
 class SimulationConfig:
     seed: int = 42
@@ -238,398 +223,759 @@ class SimulationConfig:
     ticks: int = 1
 
 
-def run_simulation(config: SimulationConfig) -> Dict:  # noqa: C901
-    """Run a minimal deterministic simulation.
+# Market parameters shared by every engine mode
+BOOSTER_COST = 12.0  # 12 Prism per booster pack
+BUY_COUNT = 5  # boosters bought per purchase
+DEFAULT_OPEN = 5  # boosters opened per tick
+STARTING_PRISM = 200.00  # Prism per agent at tick 0
+DISTRIBUTOR_STOCK = 10000  # boosters owned by the distributor at tick 0
 
-    The runner is intentionally small: it creates agents with realistic starting
-    Prism, advances `ticks` times with market logic. Agents buy boosters from
-    the distributor, open them, and track events.
+ENGINES = ("object", "columnar")
+
+
+def create_world(config: SimulationConfig) -> WorldState:
+    """Create the tick-0 world for a config.
 
-    Returns a dictionary containing summary time-series and final world state
-    metadata.
+    Agents get realistic starting Prism and deterministic per-agent RNG seeds
+    drawn from the config seed. Agent IDs start from 1 (not 0).
     """
     rng = random.Random(config.seed)
 
-    pool = large_card_pool()
-
-    world = WorldState()
+    # Card stats are indexed by catalogue position
+    world = WorldState(card_table=CardMetadataTable(card_indices()))
 
     # Distributor initially owns a large supply of boosters
     # (agents will buy from them each tick)
-    world.distributor_boosters = 10000
+    world.distributor_boosters = DISTRIBUTOR_STOCK
 
-    # Create agents with realistic starting Prism and deterministic per-agent RNG seeds
-    # Each agent starts with exactly 200.00 Prism
-    # Agent IDs start from 1 (not 0)
     for pid in range(1, config.initial_agents + 1):
         traits = generate_agent_traits(rng)
         seed = rng.randint(0, 2 ** 31 - 1)
-        starting_prism = 200.00  # 200.00 Prism per agent
         agent = Agent(
             id=pid,
-            prism=round(starting_prism, 2),
+            prism=round(STARTING_PRISM, 2),
             traits=traits,
             name=f"Agent-{pid}",
             nick=f"A{pid}",
             rng_seed=seed,
             boosters=0,
         )
-        world.agents[pid] = agent
+        world.add_agent(agent)
 
-    # Collect time-series (simple: only initial snapshot + tick summaries)
-    timeseries: List[Dict] = []
-    timeseries.append({"tick": 0, **world.summary()})
+    return world
 
-    # Cost parameters
-    BOOSTER_COST = 12.0  # 12 Prism per booster pack
 
-    # Advance ticks: agents buy boosters from distributor and open some
-    for t in range(1, config.ticks + 1):
-        world.tick = t
+def purchase_event(
+    agent: Agent, t: int, collector_roll: Optional[float]
+) -> Event:
+    """Build the event logged when an agent buys boosters.
 
-        # Buying phase: each agent buys boosters based on collector trait
-        # - Before 60 cards: always buy 5 packs
-        # - After 60 cards: only buy if collector trait triggers (random chance)
-        for agent in world.agents.values():
-            buy_count = 5
-
-            # Check if agent already has 60+ cards
-            if len(agent.collection) >= 60 and agent.traits is not None:
-                # After 60 cards, use collector trait to determine if they buy
-                a_rng = random.Random(agent.rng_seed + t + 2000)
-                collector_roll = a_rng.random()
-
-                if collector_roll >= agent.traits.collector_trait:
-                    # Collector trait did NOT trigger, skip purchase
-                    continue
-                # else: collector trait triggered, proceed with purchase
-            else:
-                collector_roll = None
-
-            cost = buy_count * BOOSTER_COST
-            # Only buy if agent has enough Prism and distributor has enough boosters
-            if world.distributor_boosters >= buy_count and agent.prism >= cost:
-                agent.add_boosters(buy_count)
-                world.distributor_boosters -= buy_count
-                agent.prism -= cost
-                agent.prism = round(agent.prism, 2)  # Round to 2 decimals
-
-                # Log event with trait info if applicable
-                triggered = None  # neutral for purchases before 60 cards
-                if (
-                    len(agent.collection) >= 60
-                    and agent.traits is not None
-                    and collector_roll is not None
-                ):
-                    trait_str = f"{agent.traits.collector_trait:.0%}"
-                    roll_str = f"{collector_roll:.0%}"
-                    description = (
-                        f"{agent.name} bought {buy_count} booster"
-                        f"{'s' if buy_count > 1 else ''} for {cost} Prism "
-                        f"(collector trait triggered: {trait_str} with {roll_str})"
-                    )
-                    triggered = True  # trait triggered, purchase happened
-                else:
-                    description = (
-                        f"{agent.name} bought {buy_count} booster"
-                        f"{'s' if buy_count > 1 else ''} for {cost} Prism"
-                    )
-
-                event = Event(
-                    tick=t,
-                    agent_id=agent.id,
-                    event_type="booster_purchase",
-                    description=description,
-                    agent_ids=[agent.id],
-                    triggered=triggered,
-                )
-                world.add_event(event)
+    `collector_roll` is the collector-trait roll that allowed the purchase, or
+    None when the agent bought unconditionally (fewer than 60 cards).
+    """
+    cost = BUY_COUNT * BOOSTER_COST
+    plural = "s" if BUY_COUNT > 1 else ""
+    triggered = None  # neutral for purchases before 60 cards
+    if collector_roll is not None and agent.traits is not None:
+        trait_str = f"{agent.traits.collector_trait:.0%}"
+        roll_str = f"{collector_roll:.0%}"
+        description = (
+            f"{agent.name} bought {BUY_COUNT} booster{plural} for {cost} Prism "
+            f"(collector trait triggered: {trait_str} with {roll_str})"
+        )
+        triggered = True  # trait triggered, purchase happened
+    else:
+        description = (
+            f"{agent.name} bought {BUY_COUNT} booster{plural} for {cost} Prism"
+        )
 
-        # Opening phase: agents open some of their boosters
-        default_open = 5
-        for agent in world.agents.values():
-            open_count = min(default_open, agent.boosters)
-            if open_count <= 0:
-                continue
-            a_rng = random.Random(agent.rng_seed + t + 1000)
-            for _ in range(open_count):
-                cards = open_booster(pool, a_rng)
-                agent.add_cards(cards)
-
-                # Also create tracked card instances
-                for card in cards:
-                    card_price = calculate_card_price(card.ref)
-                    card_instance_id = generate_card_instance_id(
-                        card.ref.card_id, agent.id, t, a_rng
-                    )
-
-                    from .types import AgentCardInstance
-                    agent_card = AgentCardInstance(
-                        card_instance_id=card_instance_id,
-                        card_id=card.ref.card_id,
-                        card_name=card.ref.name,
-                        flavor_text=card.ref.flavor_text,
-                        card_color=card.ref.color,
-                        card_rarity=card.ref.rarity.value,
-                        agent_id=agent.id,
-                        acquisition_tick=t,
-                        acquisition_price=card_price,
-                        current_price=card_price,
-                        quality_score=card.effective_quality(),
-                        desirability=5.0,
-                        win_count=0,
-                        loss_count=0,
-                        gem_colored=card.ref.gem_colored,
-                        gem_colorless=card.ref.gem_colorless,
-                    )
-                    agent.add_card_instance(agent_card)
-
-                agent.remove_boosters(1)
-
-        # Play phase: agents play games with their decks, degrading card quality
-        for agent in world.agents.values():
-            if len(agent.collection) < 40:
-                # Can't play without a deck
-                continue
+    return Event(
+        tick=t,
+        agent_id=agent.id,
+        event_type="booster_purchase",
+        description=description,
+        agent_ids=[agent.id],
+        triggered=triggered,
+    )
 
-            # Use seeded RNG to decide if agent plays this tick
-            a_rng = random.Random(agent.rng_seed + t + 2000)
-            play_chance = a_rng.random()
-
-            # Play if random roll is less than 0.5 (50% chance per tick)
-            if play_chance < 0.5:
-                # Pick a random opponent from other agents
-                other_agents = [a for a in world.agents.values()
-                                if a.id != agent.id and len(a.collection) >= 40]
-
-                if other_agents:
-                    # Use seeded RNG for opponent selection
-                    opponent_rng = random.Random(agent.rng_seed + t + 2001)
-                    opponent = opponent_rng.choice(other_agents)
-
-                    # Build decks (40 cards)
-                    if len(agent.collection) >= 40:
-                        player1_deck = agent.collection[:40]
-                    else:
-                        player1_deck = agent.collection
-
-                    if len(opponent.collection) >= 40:
-                        player2_deck = opponent.collection[:40]
-                    else:
-                        player2_deck = opponent.collection
-
-                    # Calculate combat scores
-                    player1_score = calculate_combat_score(player1_deck)
-                    player2_score = calculate_combat_score(player2_deck)
-
-                    # Determine winner
-                    if player1_score > player2_score:
-                        winner = agent
-                        loser = opponent
-                        winner_score = player1_score
-                        loser_score = player2_score
-                        winner_deck = player1_deck
-                        loser_deck = player2_deck
-                        is_tie = False
-                    elif player2_score > player1_score:
-                        winner = opponent
-                        loser = agent
-                        winner_score = player2_score
-                        loser_score = player1_score
-                        winner_deck = player2_deck
-                        loser_deck = player1_deck
-                        is_tie = False
-                    else:
-                        # Tie - no winner/loser
-                        winner = None
-                        loser = None
-                        winner_score = player1_score
-                        loser_score = player2_score
-                        winner_deck = player1_deck
-                        loser_deck = player2_deck
-                        is_tie = True
-
-                    # Boost/penalize attractiveness and price based on outcome
-                    if not is_tie:
-                        for card in winner_deck:
-                            world.boost_card_stats(card.ref.card_id, 0.01)
-                        for card in loser_deck:
-                            world.penalize_card_stats(card.ref.card_id, 0.01)
-
-                    # Degrade cards in both decks by 1%
-                    for card in player1_deck:
-                        degrade_card_quality(card, 0.01)  # 1% degradation
-                    for card in player2_deck:
-                        degrade_card_quality(card, 0.01)  # 1% degradation
-
-                    # Log combat event
-                    if is_tie:
-                        description = (
-                            f"{agent.name} tied with {opponent.name} "
-                            f"({player1_score:.2f} vs {player2_score:.2f})"
-                        )
-                        event = Event(
-                            tick=t,
-                            agent_id=agent.id,
-                            event_type="combat",
-                            description=description,
-                            agent_ids=[agent.id, opponent.id],
-                            triggered=True,  # tie is considered triggered
-                        )
-                    else:
-                        if winner is None or loser is None:
-                            continue  # Skip if tie logic failed
-                        description = (
-                            f"{winner.name} defeated {loser.name} "
-                            f"({winner_score:.2f} vs {loser_score:.2f})"
-                        )
-                        event = Event(
-                            tick=t,
-                            agent_id=winner.id,
-                            event_type="combat",
-                            description=description,
-                            agent_ids=[winner.id, loser.id],
-                            triggered=True,
-                        )
-                    world.add_event(event)
-                else:
-                    # No opponent available, just degrade cards
-                    if len(agent.collection) >= 40:
-                        deck_sample = agent.collection[:40]
-                    else:
-                        deck_sample = agent.collection
-                    for card in deck_sample:
-                        degrade_card_quality(card, 0.01)
-
-                    description = f"{agent.name} played a game (no opponent)"
-                    event = Event(
-                        tick=t,
-                        agent_id=agent.id,
-                        event_type="play",
-                        description=description,
-                        agent_ids=[agent.id],
-                        triggered=False,  # play without opponent is not triggered
-                    )
-                    world.add_event(event)
-
-        # Degrade unopened packs by 1% every 180 ticks
-        for agent in world.agents.values():
-            if agent.boosters > 0 and t > 0 and t % 180 == 0:
-                # Pack degradation happens at tick 180, 360, 540, etc.
-                # For now, we log this but don't degrade anything physical
-                # (packs don't have quality_score, only opened cards do)
-                plural = "s" if agent.boosters > 1 else ""
-                description = (
-                    f"{agent.name}'s {agent.boosters} unopened booster{plural} aged"
+
+def open_agent_boosters(
+    agent: Agent, sampler: BoosterSampler, count: int, t: int
+) -> None:
+    """Open `count` boosters for an agent and track every card it receives.
+
+    Only cards and card instances are touched; the caller is responsible for
+    decrementing the agent's booster count.
+    """
+    a_rng = random.Random(agent.rng_seed + t + 1000)
+    for _ in range(count):
+        cards = sampler.open_pack(a_rng)
+        agent.add_cards(cards)
+
+        # Also create tracked card instances
+        for card in cards:
+            card_price = calculate_card_price(card.ref)
+            agent_card = AgentCardInstance(
+                card_instance_id=agent.next_card_serial(),
+                ref=card.ref,
+                agent_id=agent.id,
+                acquisition_tick=t,
+                acquisition_price=card_price,
+                current_price=card_price,
+                quality_score=card.effective_quality(),
+                desirability=5.0,
+                win_count=0,
+                loss_count=0,
+            )
+            agent.add_card_instance(agent_card)
+
+
+def resolve_matches(
+    world: WorldState,
+    matches: Sequence[Tuple[Agent, Optional[Agent]]],
+    t: int,
+    scores: Optional[np.ndarray] = None,
+) -> None:
+    """Resolve every match of a tick in one batch.
+
+    Outcomes are decided for all pairings at once and logged in pairing
+    order: the winner of each match is recorded in a combat event (ties are
+    logged too), and a pairing without an opponent logs a solo play event.
+    Win and loss counts are then aggregated per card id and applied through
+    `WorldState.apply_card_results`: each winning deck slot adds 1%
+    attractiveness and price, each losing slot removes 1%, and ties change
+    nothing. Deck degradation is left to the caller so each engine can apply
+    it in its own storage.
+
+    Parameters:
+        world: world the matches are played in
+        matches: (agent, opponent) pairings in play order; opponent is None
+            for solo games
+        t: current tick
+        scores: optional (len(matches), 2) array of agent and opponent deck
+            scores; read from `Agent.deck_stats` when omitted
+    """
+    if not matches:
+        return
+    if scores is None:
+        scores = np.array(
+            [
+                (
+                    agent.deck_stats().score,
+                    opponent.deck_stats().score if opponent is not None else 0.0,
                 )
-                event = Event(
+                for agent, opponent in matches
+            ],
+            dtype=np.float64,
+        )
+    agent_wins = (scores[:, 0] > scores[:, 1]).tolist()
+    opponent_wins = (scores[:, 1] > scores[:, 0]).tolist()
+
+    won: Dict[int, int] = {}
+    lost: Dict[int, int] = {}
+    for i, (agent, opponent) in enumerate(matches):
+        if opponent is None:
+            world.add_event(solo_play_event(agent, t))
+            continue
+        agent_score, opponent_score = scores[i].tolist()
+        if agent_wins[i]:
+            winner, loser = agent, opponent
+            winner_score, loser_score = agent_score, opponent_score
+        elif opponent_wins[i]:
+            winner, loser = opponent, agent
+            winner_score, loser_score = opponent_score, agent_score
+        else:
+            # Tie - no winner/loser
+            description = (
+                f"{agent.name} tied with {opponent.name} "
+                f"({agent_score:.2f} vs {opponent_score:.2f})"
+            )
+            world.add_event(
+                Event(
                     tick=t,
                     agent_id=agent.id,
-                    event_type="pack_age",
+                    event_type="combat",
                     description=description,
-                    agent_ids=[agent.id],
+                    agent_ids=[agent.id, opponent.id],
+                    triggered=True,  # tie is considered triggered
                 )
-                world.add_event(event)
-
-        # Deck maintenance: every 20 ticks, replace low-feasibility deck cards
-        if t > 0 and t % 20 == 0:
-            for agent in world.agents.values():
-                if len(agent.collection) >= 40:
-                    # Build current deck to evaluate feasibility
-                    a_rng = random.Random(agent.rng_seed + t + 5000)
-                    current_deck = build_deck(agent.collection, a_rng)
-                    
-                    # Get cards available for replacement (exclude current deck)
-                    deck_card_ids = set(c["card_id"] for c in current_deck)
-                    replacement_pool = [
-                        c for c in agent.collection 
-                        if c.ref.card_id not in deck_card_ids
-                    ]
-                    
-                    # Replace low-feasibility cards (score < 1.0)
-                    if replacement_pool:
-                        agent.replace_low_feasibility_deck_cards(
-                            deck=current_deck,
-                            feasibility_threshold=1.0,
-                            replacement_pool=replacement_pool,
-                            rng=a_rng,
-                        )
-
-        # Collect events that occurred this tick
-        tick_events = [e.to_dict() for e in world.events if e.tick == t]
-
-        # Record price points for all card instances
-        world.record_price_points()
-
-        # Capture market snapshot
-        world.capture_market_snapshot()
-
-        # Get latest market snapshot if available
-        market_snapshot = None
-        if world.market_snapshots:
-            market_snapshot = world.market_snapshots[-1].to_dict()
-
-        tick_summary = {"tick": t, **world.summary(), "events": tick_events}
-        if market_snapshot:
-            tick_summary["market_snapshot"] = market_snapshot
-        timeseries.append(tick_summary)
-
-    # Build a serializable agents summary to expose to the frontend/backend.
-    agents_summary = []
-    for _pid, agent in world.agents.items():
-        # Full collection for detailed view
-        full_collection = []
-        for ci in agent.collection:
-            full_collection.append(
-                {
-                    "card_id": ci.ref.card_id,
-                    "name": ci.ref.name,
-                    "color": ci.ref.color,
-                    "rarity": ci.ref.rarity.value,
-                    "is_hologram": ci.is_hologram,
-                    "quality_score": ci.effective_quality(),
-                    "price": world.get_card_price(ci.ref.card_id),
-                    "attractiveness": world.get_card_attractiveness(ci.ref.card_id),
-                    "power": ci.ref.power,
-                    "health": ci.ref.health,
-                    "gem_colored": ci.ref.gem_colored,
-                    "gem_colorless": ci.ref.gem_colorless,
-                }
             )
+            continue
+
+        won[winner.id] = won.get(winner.id, 0) + 1
+        lost[loser.id] = lost.get(loser.id, 0) + 1
+        description = (
+            f"{winner.name} defeated {loser.name} "
+            f"({winner_score:.2f} vs {loser_score:.2f})"
+        )
+        world.add_event(
+            Event(
+                tick=t,
+                agent_id=winner.id,
+                event_type="combat",
+                description=description,
+                agent_ids=[winner.id, loser.id],
+                triggered=True,
+            )
+        )
+
+    world.apply_card_results(
+        _deck_card_counts(world, won), _deck_card_counts(world, lost)
+    )
+
+
+def _deck_card_counts(world: WorldState, games: Dict[int, int]) -> Dict[str, int]:
+    """Count deck slots per card id over agents weighted by games played."""
+    counts: Dict[str, int] = {}
+    for agent_id, n in games.items():
+        for card_id in world.agents[agent_id].deck_stats().card_ids:
+            counts[card_id] = counts.get(card_id, 0) + n
+    return counts
+
+
+def degrade_deck(deck: List["CardInstance"], games: int) -> None:
+    """Degrade every card of a deck by 1% per game played this tick.
+
+    Same result as calling `degrade_card_quality(card, 0.01)` once per game.
+    """
+    factor = 1.0 - 0.01
+    for card in deck:
+        quality = card.effective_quality()
+        for _ in range(games):
+            quality *= factor
+        card.quality_score = quality
+
+
+def solo_play_event(agent: Agent, t: int) -> Event:
+    """Build the event logged when an agent plays without an opponent."""
+    return Event(
+        tick=t,
+        agent_id=agent.id,
+        event_type="play",
+        description=f"{agent.name} played a game (no opponent)",
+        agent_ids=[agent.id],
+        triggered=False,  # play without opponent is not triggered
+    )
+
+
+def pack_age_event(agent: Agent, boosters: int, t: int) -> Event:
+    """Build the event logged when an agent's unopened boosters age."""
+    plural = "s" if boosters > 1 else ""
+    return Event(
+        tick=t,
+        agent_id=agent.id,
+        event_type="pack_age",
+        description=f"{agent.name}'s {boosters} unopened booster{plural} aged",
+        agent_ids=[agent.id],
+    )
+
+
+def maintain_decks(world: WorldState, agents: Iterable[Agent], t: int) -> None:
+    """Replace low-feasibility deck cards for agents holding a full deck."""
+    for agent in agents:
+        if len(agent.collection) >= 40:
+            # Build current deck to evaluate feasibility
+            a_rng = random.Random(agent.rng_seed + t + 5000)
+            current_deck = build_deck(agent.collection, a_rng)
+
+            # Get cards available for replacement (exclude current deck)
+            deck_card_ids = set(c["card_id"] for c in current_deck)
+            replacement_pool = [
+                c for c in agent.collection
+                if c.ref.card_id not in deck_card_ids
+            ]
+
+            # Replace low-feasibility cards (score < 1.0)
+            if replacement_pool:
+                replaced = agent.replace_low_feasibility_deck_cards(
+                    deck=current_deck,
+                    feasibility_threshold=1.0,
+                    replacement_pool=replacement_pool,
+                    rng=a_rng,
+                )
+                if replaced:
+                    agent.invalidate_deck()
+
+
+def step_world(  # noqa: C901
+    world: WorldState, sampler: BoosterSampler, t: int
+) -> None:
+    """Advance the object engine by one tick.
+
+    Agents buy boosters from the distributor, open them, play matches and age
+    their unopened packs; every 20 ticks decks are maintained.
+    """
+    world.tick = t
+
+    # Buying phase: each agent buys boosters based on collector trait
+    # - Before 60 cards: always buy 5 packs
+    # - After 60 cards: only buy if collector trait triggers (random chance)
+    cost = BUY_COUNT * BOOSTER_COST
+    for agent in world.agents.values():
+        # Check if agent already has 60+ cards
+        if len(agent.collection) >= 60 and agent.traits is not None:
+            # After 60 cards, use collector trait to determine if they buy
+            a_rng = random.Random(agent.rng_seed + t + 2000)
+            collector_roll: Optional[float] = a_rng.random()
+
+            if collector_roll >= agent.traits.collector_trait:
+                # Collector trait did NOT trigger, skip purchase
+                continue
+            # else: collector trait triggered, proceed with purchase
+        else:
+            collector_roll = None
+
+        # Only buy if agent has enough Prism and distributor has enough boosters
+        if world.distributor_boosters >= BUY_COUNT and agent.prism >= cost:
+            agent.add_boosters(BUY_COUNT)
+            world.distributor_boosters -= BUY_COUNT
+            agent.prism -= cost
+            agent.prism = round(agent.prism, 2)  # Round to 2 decimals
+            world.add_event(purchase_event(agent, t, collector_roll))
+
+    # Opening phase: agents open some of their boosters
+    for agent in world.agents.values():
+        open_count = min(DEFAULT_OPEN, agent.boosters)
+        if open_count <= 0:
+            continue
+        open_agent_boosters(agent, sampler, open_count, t)
+        agent.remove_boosters(open_count)
+
+    # Play phase: agents with a deck play on a roll below 0.5 against a
+    # random other deck holder; all of the tick's matches are resolved in one
+    # batch and every deck degrades by 1% per game it played
+    matches: List[Tuple[Agent, Optional[Agent]]] = []
+    for agent in world.agents.values():
+        if len(agent.collection) < 40:
+            # Can't play without a deck
+            continue
+
+        # Use seeded RNG to decide if agent plays this tick
+        a_rng = random.Random(agent.rng_seed + t + 2000)
+        play_chance = a_rng.random()
+
+        # Play if random roll is less than 0.5 (50% chance per tick)
+        if play_chance >= 0.5:
+            continue
+
+        # Pick a random opponent from the other deck holders
+        opponent_rng = random.Random(agent.rng_seed + t + 2001)
+        matches.append((agent, world.players.choose_opponent(agent, opponent_rng)))
+
+    resolve_matches(world, matches, t)
+
+    games: Dict[int, int] = {}
+    for agent, opponent in matches:
+        games[agent.id] = games.get(agent.id, 0) + 1
+        if opponent is not None:
+            games[opponent.id] = games.get(opponent.id, 0) + 1
+    for agent_id, n in games.items():
+        degrade_deck(world.agents[agent_id].collection[:40], n)
+
+    # Degrade unopened packs by 1% every 180 ticks
+    # Pack degradation happens at tick 180, 360, 540, etc.
+    # For now, we log this but don't degrade anything physical
+    # (packs don't have quality_score, only opened cards do)
+    if t > 0 and t % 180 == 0:
+        for agent in world.agents.values():
+            if agent.boosters > 0:
+                world.add_event(pack_age_event(agent, agent.boosters, t))
+
+    # Deck maintenance: every 20 ticks, replace low-feasibility deck cards
+    if t > 0 and t % 20 == 0:
+        maintain_decks(world, world.agents.values(), t)
 
-        # Build a deck from the collection
-        a_rng = random.Random(agent.rng_seed + 5000)
-        deck = build_deck(agent.collection, a_rng)
 
-        traits_dict = agent.traits.to_dict() if agent.traits else {}
+def finish_tick(world: WorldState, t: int, summary: Dict) -> Dict:
+    """Close a tick: record prices, capture the market snapshot and summarize.
 
-        # Agent-specific events (events where this agent is the primary actor)
-        agent_events = [e.to_dict() for e in world.events if e.agent_id == agent.id]
+    Parameters:
+        world: world state after every phase of tick `t` ran
+        t: the tick being closed
+        summary: world summary counters for the tick
+
+    Returns:
+        the timeseries entry for the tick
+    """
+    # Collect events that occurred this tick
+    tick_events = [e.to_dict() for e in world.events.for_tick(t)]
+
+    # Record price points for all card instances
+    world.record_price_points()
+
+    # Capture market snapshot
+    world.capture_market_snapshot()
+
+    # Get latest market snapshot if available
+    market_snapshot = None
+    if world.market_snapshots:
+        market_snapshot = world.market_snapshots[-1].to_dict()
+
+    tick_summary = {"tick": t, **summary, "events": tick_events}
+    if market_snapshot:
+        tick_summary["market_snapshot"] = market_snapshot
+    return tick_summary
 
-        # Build card instances list
-        card_instances = [ci.to_dict() for ci in agent.card_instances.values()]
 
-        agents_summary.append(
+def summarize_agents(world: WorldState) -> List[Dict]:
+    """Build a serializable agents summary to expose to the frontend/backend."""
+    return [summarize_agent(world, agent) for agent in world.agents.values()]
+
+
+def summarize_agent(world: WorldState, agent: Agent, detail: bool = True) -> Dict:
+    """Build the serializable summary of one agent (see `summarize_agents`).
+
+    Without `detail` the "card_instances" and "agent_events" are left out,
+    for callers that read those separately.
+    """
+    # Full collection for detailed view
+    full_collection = []
+    indices = world.card_table.indices(ci.ref.card_id for ci in agent.collection)
+    attractiveness, prices = world.card_table.read(indices)
+    for ci, price, attract in zip(
+        agent.collection, prices.tolist(), attractiveness.tolist(), strict=True
+    ):
+        full_collection.append(
             {
-                "id": agent.id,
-                "prism": agent.prism,
-                "name": agent.name,
-                "nick": agent.nick,
-                "rng_seed": agent.rng_seed,
-                "collection_count": len(agent.collection),
-                "booster_count": agent.boosters,
-                "full_collection": full_collection,
-                "card_instances": card_instances,
-                "deck": deck,
-                "traits": traits_dict,
-                "agent_events": agent_events,
+                "card_id": ci.ref.card_id,
+                "name": ci.ref.name,
+                "color": ci.ref.color,
+                "rarity": ci.ref.rarity.value,
+                "is_hologram": ci.is_hologram,
+                "quality_score": ci.effective_quality(),
+                "price": price,
+                "attractiveness": attract,
+                "power": ci.ref.power,
+                "health": ci.ref.health,
+                "gem_colored": ci.ref.gem_colored,
+                "gem_colorless": ci.ref.gem_colorless,
             }
         )
 
-    return {
-        "config": config.__dict__,
-        "timeseries": timeseries,
-        "final": world.summary(),
-        "agents": agents_summary,
-        "events": [e.to_dict() for e in world.events],
+    # Build a deck from the collection
+    a_rng = random.Random(agent.rng_seed + 5000)
+    deck = build_deck(agent.collection, a_rng)
+
+    traits_dict = agent.traits.to_dict() if agent.traits else {}
+
+    # card_instances and agent_events are filled in last; the placeholders
+    # keep the payload's key order
+    summary = {
+        "id": agent.id,
+        "prism": agent.prism,
+        "name": agent.name,
+        "nick": agent.nick,
+        "rng_seed": agent.rng_seed,
+        "collection_count": len(agent.collection),
+        "booster_count": agent.boosters,
+        "full_collection": full_collection,
+        "card_instances": None,
+        "deck": deck,
+        "traits": traits_dict,
+        "agent_events": None,
     }
+    if not detail:
+        del summary["card_instances"], summary["agent_events"]
+        return summary
+
+    # Build card instances list
+    summary["card_instances"] = [ci.to_dict() for ci in agent.card_instances.values()]
+    # Agent-specific events (events where this agent is the primary actor)
+    summary["agent_events"] = [
+        e.to_dict() for e in world.events.for_agent(agent.id, primary_only=True)
+    ]
+    return summary
+
+
+class SimulationStream:
+    """Iterator over the tick summaries of a simulation as it runs.
+
+    Each `next()` advances the world by one tick and returns that tick's
+    timeseries entry (world summary, events and market snapshot); the first
+    entry is the tick-0 snapshot. Nothing but the world itself is retained,
+    so consumers can process or forward ticks with bounded memory. The
+    final world and agent summaries are available once iteration finishes.
+
+    Parameters:
+        config: run parameters
+        engine: "object" walks the Agent objects phase by phase; "columnar"
+            keeps agent scalars in NumPy arrays and runs each phase as
+            population-wide array operations. Both produce identical output.
+        pool: card pool to open boosters from (defaults to the full pool)
+        world: world to continue instead of a fresh `create_world(config)`;
+            its `tick` must be the last completed tick (see `checkpoint.py`)
+    """
+
+    def __init__(
+        self,
+        config: SimulationConfig,
+        engine: str = "object",
+        pool: Optional[Sequence["CardRef"]] = None,
+        world: Optional[WorldState] = None,
+    ) -> None:
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+        self.config = config
+        self.engine = engine
+        self.pool = pool
+        self.world = create_world(config) if world is None else world
+        self._sampler = BoosterSampler(large_card_pool() if pool is None else pool)
+        self._columnar = None
+        if engine == "columnar":
+            from .columnar import ColumnarEngine
+
+            self._columnar = ColumnarEngine(self.world, self._sampler)
+        self._next_tick = 0 if world is None else world.tick + 1
+
+    @property
+    def finished(self) -> bool:
+        """True once every tick of the config has been yielded."""
+        return self._next_tick > self.config.ticks
+
+    def __iter__(self) -> "SimulationStream":
+        return self
+
+    def __next__(self) -> Dict:
+        t = self._next_tick
+        if t > self.config.ticks:
+            raise StopIteration
+        self._next_tick = t + 1
+
+        if t == 0:
+            entry = {"tick": 0, **self._summary()}
+        else:
+            if self._columnar is not None:
+                self._columnar.step(t)
+            else:
+                step_world(self.world, self._sampler, t)
+            entry = finish_tick(self.world, t, self._summary())
+
+        if self.finished:
+            self._sync()
+        return entry
+
+    def _summary(self) -> Dict:
+        if self._columnar is not None:
+            return self._columnar.summary()
+        return self.world.summary()
+
+    def _sync(self) -> None:
+        if self._columnar is not None:
+            self._columnar.sync()
+
+    def final(self) -> Dict:
+        """Return the world summary for the latest completed tick."""
+        self._sync()
+        return self.world.summary()
+
+    def agents(self) -> List[Dict]:
+        """Return the serializable agent summaries for the latest completed tick."""
+        self._sync()
+        return summarize_agents(self.world)
+
+    def extend(self, ticks: int) -> None:
+        """Schedule `ticks` more ticks after the last one yielded.
+
+        Lets a finished stream keep going: the config's `ticks` moves to the
+        new final tick and iteration resumes where it stopped.
+        """
+        self.config = replace(self.config, ticks=self._next_tick - 1 + ticks)
+
+    def checkpoint(
+        self, path: os.PathLike, timeseries: Optional[List[Dict]] = None
+    ) -> None:
+        """Save the world after the latest completed tick (see `checkpoint.py`)."""
+        from .checkpoint import save_checkpoint
+
+        save_checkpoint(self, path, timeseries)
+
+
+def iter_simulation(
+    config: SimulationConfig,
+    engine: str = "object",
+    pool: Optional[Sequence["CardRef"]] = None,
+) -> SimulationStream:
+    """Run a simulation lazily, yielding each tick summary as it completes.
+
+    Example:
+        stream = iter_simulation(SimulationConfig(seed=1, ticks=1000))
+        for entry in stream:
+            forward(entry)
+        agents = stream.agents()
+
+    See `SimulationStream` for the parameters.
+    """
+    return SimulationStream(config, engine=engine, pool=pool)
+
+
+def simulate(
+    config: SimulationConfig,
+    engine: str = "object",
+    pool: Optional[Sequence["CardRef"]] = None,
+) -> Tuple[WorldState, List[Dict]]:
+    """Advance a fresh world through every tick of `config`.
+
+    See `SimulationStream` for the parameters.
+
+    Returns:
+        (world, timeseries): the final world state and the per-tick summaries
+        starting with the tick-0 snapshot
+    """
+    stream = iter_simulation(config, engine=engine, pool=pool)
+    timeseries = list(stream)
+    return stream.world, timeseries
+
+
+def run_simulation(
+    config: SimulationConfig,
+    engine: str = "object",
+    pool: Optional[Sequence["CardRef"]] = None,
+) -> "SimulationResult":
+    """Run a minimal deterministic simulation.
+
+    The runner is intentionally small: it creates agents with realistic starting
+    Prism, advances `ticks` times with market logic. Agents buy boosters from
+    the distributor, open them, and track events. See `simulate` for the
+    `engine` and `pool` parameters.
+
+    Returns a `SimulationResult`: a read-only mapping containing summary
+    time-series and final world state metadata whose agent and event views
+    are built on first access (`to_dict()` gives the plain payload).
+    """
+    world, timeseries = simulate(config, engine=engine, pool=pool)
+    return build_result(config, world, timeseries)
+
+
+def build_result(
+    config: SimulationConfig, world: WorldState, timeseries: List[Dict]
+) -> "SimulationResult":
+    """Wrap a finished world in the (lazy) `run_simulation` result."""
+    return SimulationResult(config, world, timeseries)
+
+
+class SimulationResult(Mapping):
+    """Result of a finished run; a read-only mapping with the payload keys.
+
+    "config", "timeseries" and "final" are held directly. The heavy views,
+    "agents" (collections, card instances with price history, decks, agent
+    events) and "events", are serialized from the final world on first
+    access and cached, so callers that only read the timeseries never pay
+    for them. The world must not be advanced further once wrapped, unless
+    the views were built first with `materialize()`.
+
+    Parameters:
+        config: the run's config
+        world: final world state
+        timeseries: per-tick summaries starting with the tick-0 snapshot
+    """
+
+    KEYS = ("config", "timeseries", "final", "agents", "events")
+
+    def __init__(
+        self, config: SimulationConfig, world: WorldState, timeseries: List[Dict]
+    ) -> None:
+        self.config = config
+        self.world = world
+        self.timeseries = timeseries
+        self.final = world.summary()
+        self._agents: Dict[int, Dict] = {}
+        self._agent_list: Optional[List[Dict]] = None
+        self._overview: Optional[List[Dict]] = None
+        self._events: Optional[List[Dict]] = None
+
+    def __getitem__(self, key: str) -> object:
+        if key == "config":
+            return self.config.__dict__
+        if key == "timeseries":
+            return self.timeseries
+        if key == "final":
+            return self.final
+        if key == "agents":
+            return self.agents()
+        if key == "events":
+            return self.events()
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def __repr__(self) -> str:
+        return (
+            f"SimulationResult(config={self.config!r}, "
+            f"ticks={len(self.timeseries)}, agents={len(self.world.agents)})"
+        )
+
+    def agent(self, agent_id: int) -> Optional[Dict]:
+        """Return one agent's summary, serializing only that agent."""
+        summary = self._agents.get(agent_id)
+        if summary is None:
+            agent = self.world.agents.get(agent_id)
+            if agent is None:
+                return None
+            summary = self._agents[agent_id] = summarize_agent(self.world, agent)
+        return summary
+
+    def agents(self) -> List[Dict]:
+        """Return every agent's summary (the "agents" payload)."""
+        if self._agent_list is None:
+            self._agent_list = [self.agent(agent_id) for agent_id in self.world.agents]
+        return self._agent_list
+
+    def events(self) -> List[Dict]:
+        """Return every event of the run (the "events" payload)."""
+        if self._events is None:
+            self._events = [e.to_dict() for e in self.world.events]
+        return self._events
+
+    def iter_agents(self) -> Iterator[Dict]:
+        """Yield every agent's summary without caching the ones not built yet.
+
+        For one-pass consumers such as the run store, so persisting a run
+        does not leave the full "agents" payload cached on the result.
+        """
+        if self._agent_list is not None:
+            yield from self._agent_list
+            return
+        for agent_id, agent in list(self.world.agents.items()):
+            summary = self._agents.get(agent_id)
+            if summary is None:
+                summary = summarize_agent(self.world, agent)
+            yield summary
+
+    def iter_events(self) -> Iterator[Dict]:
+        """Yield every event of the run, like `iter_agents`."""
+        if self._events is not None:
+            yield from self._events
+            return
+        for event in list(self.world.events):
+            yield event.to_dict()
+
+    def overview(self) -> List[Dict]:
+        """Return lightweight per-agent rows without collections or events."""
+        if self._overview is None:
+            self._overview = [
+                {
+                    "id": agent.id,
+                    "prism": agent.prism,
+                    "name": agent.name,
+                    "nick": agent.nick,
+                    "collection_count": len(agent.collection),
+                    "booster_count": agent.boosters,
+                }
+                for agent in self.world.agents.values()
+            ]
+        return self._overview
+
+    def materialize(self) -> "SimulationResult":
+        """Build and cache every lazy view, so the world may be advanced."""
+        self.agents()
+        self.overview()
+        self.events()
+        return self
+
+    def to_dict(self) -> Dict:
+        """Return the full payload as a plain dict."""
+        return {key: self[key] for key in self.KEYS}
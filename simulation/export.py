@@ -0,0 +1,431 @@
+"""Export runs as typed columnar tables for offline analytics.
+
+A run is written as one file per table instead of the nested `/run`
+payload, so analysts can load it straight into pandas or any Arrow-aware
+tool:
+
+- `ticks`: the scalar world summary of every tick
+- `market`: the market snapshot of every tick after tick 0
+- `events`: every event, with its `agent_ids` as a list column
+- `agents`: the final agents with their traits as columns
+- `card_instances`: every agent's card instances at the end of the run
+- `price_points`: one row per recorded price of every card instance
+
+Columns are typed (int32 ticks and ids, float64 prices) and repeated strings
+such as card_id, event_type, rarity and traits are dictionary-encoded; each
+column keeps one dictionary that later batches only extend, written as
+dictionary deltas in Arrow files.
+Files are Parquet (`.parquet`) or Arrow IPC (`.arrow`, i.e. Feather v2). A
+`run.json` manifest next to them records the config, the final world
+summary and each table's row count.
+
+Rows are buffered into record batches of `batch_rows` and written as they
+fill: ticks, market snapshots and events tick by tick while the simulation
+runs, price points straight from each card's typed history arrays. Memory
+stays bounded by the batch size rather than growing with the run.
+
+Usage:
+    python -m simulation.export --seed 42 --agents 10 --ticks 1000 \\
+        --output exports/seed42
+    python -m simulation.export --json run.json --output exports/run
+
+Needs `pyarrow`; `read_run` loads an export back as pandas DataFrames.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .engine import ENGINES, SimulationConfig, iter_simulation
+from .world import WorldState
+
+FORMATS = ("parquet", "arrow")
+# Rows buffered per table before a record batch is written
+BATCH_ROWS = 65536
+
+_CATEGORY = pa.dictionary(pa.int32(), pa.string())
+
+SCHEMAS: Dict[str, pa.Schema] = {
+    "ticks": pa.schema(
+        [
+            ("tick", pa.int32()),
+            ("agent_count", pa.int32()),
+            ("total_cards", pa.int64()),
+            ("distributor_boosters", pa.int64()),
+            ("total_unopened_boosters", pa.int64()),
+        ]
+    ),
+    "market": pa.schema(
+        [
+            ("tick", pa.int32()),
+            ("total_volume_traded", pa.float64()),
+            ("cards_traded_count", pa.int64()),
+            ("price_index", pa.float64()),
+            ("volatility", pa.float64()),
+            ("unique_cards_in_circulation", pa.int64()),
+            ("total_card_instances", pa.int64()),
+        ]
+    ),
+    "events": pa.schema(
+        [
+            ("tick", pa.int32()),
+            ("agent_id", pa.int32()),
+            ("event_type", _CATEGORY),
+            ("description", pa.string()),
+            ("agent_ids", pa.list_(pa.int32())),
+            ("triggered", pa.bool_()),
+        ]
+    ),
+    "agents": pa.schema(
+        [
+            ("id", pa.int32()),
+            ("name", pa.string()),
+            ("nick", pa.string()),
+            ("prism", pa.float64()),
+            ("rng_seed", pa.int64()),
+            ("collection_count", pa.int32()),
+            ("booster_count", pa.int32()),
+            ("primary_trait", _CATEGORY),
+            ("risk_aversion", _CATEGORY),
+            ("time_horizon", _CATEGORY),
+            ("collector_trait", pa.float64()),
+            ("competitor_trait", pa.float64()),
+            ("gambler_trait", pa.float64()),
+            ("scavenger_trait", pa.float64()),
+        ]
+    ),
+    "card_instances": pa.schema(
+        [
+            ("card_instance_id", pa.string()),
+            ("card_id", _CATEGORY),
+            ("card_name", _CATEGORY),
+            ("card_color", _CATEGORY),
+            ("card_rarity", _CATEGORY),
+            ("agent_id", pa.int32()),
+            ("acquisition_tick", pa.int32()),
+            ("acquisition_price", pa.float64()),
+            ("current_price", pa.float64()),
+            ("quality_score", pa.float64()),
+            ("desirability", pa.float64()),
+            ("win_count", pa.int32()),
+            ("loss_count", pa.int32()),
+            ("condition", _CATEGORY),
+            ("gem_colored", pa.int32()),
+            ("gem_colorless", pa.int32()),
+        ]
+    ),
+    "price_points": pa.schema(
+        [
+            ("card_instance_id", _CATEGORY),
+            ("card_id", _CATEGORY),
+            ("agent_id", pa.int32()),
+            ("tick", pa.int32()),
+            ("price", pa.float64()),
+            ("quality_score", pa.float64()),
+            ("desirability", pa.float64()),
+        ]
+    ),
+}
+
+# A card's price history as (ticks, prices, qualities, desirability)
+History = Tuple[Sequence[int], Sequence[float], Sequence[float], Sequence[float]]
+
+
+class _TableWriter:
+    """Buffer the rows of one table and write them as record batches.
+
+    Dictionary-encoded columns share one growing dictionary across batches,
+    since an Arrow IPC file allows only one dictionary per field (extended
+    by deltas).
+    """
+
+    def __init__(
+        self, path: Path, schema: pa.Schema, fmt: str, batch_rows: int
+    ) -> None:
+        self.path = path
+        self.schema = schema
+        self.rows = 0
+        self._batch_rows = batch_rows
+        self._columns: Dict[str, list] = {name: [] for name in schema.names}
+        self._buffered = 0
+        # value -> code of every dictionary-encoded column, in code order
+        self._codes: Dict[str, Dict[str, int]] = {
+            f.name: {} for f in schema if pa.types.is_dictionary(f.type)
+        }
+        if fmt == "parquet":
+            self._writer = pq.ParquetWriter(str(path), schema)
+        else:
+            options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+            self._writer = pa.ipc.new_file(str(path), schema, options=options)
+
+    def append(self, row: Mapping) -> None:
+        for name, values in self._columns.items():
+            values.append(row.get(name))
+        self._added(1)
+
+    def extend(self, columns: Mapping[str, Sequence], count: int) -> None:
+        """Add `count` rows given as columns (every schema field)."""
+        for name, values in self._columns.items():
+            values.extend(columns[name])
+        self._added(count)
+
+    def _added(self, count: int) -> None:
+        self.rows += count
+        self._buffered += count
+        if self._buffered >= self._batch_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffered:
+            return
+        arrays = [self._array(f) for f in self.schema]
+        batch = pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+        self._writer.write_table(pa.Table.from_batches([batch], self.schema))
+        for values in self._columns.values():
+            values.clear()
+        self._buffered = 0
+
+    def _array(self, field: pa.Field) -> pa.Array:
+        values = self._columns[field.name]
+        codes = self._codes.get(field.name)
+        if codes is None:
+            return pa.array(values, type=field.type)
+        indices = [
+            None if value is None else codes.setdefault(value, len(codes))
+            for value in values
+        ]
+        return pa.DictionaryArray.from_arrays(
+            pa.array(indices, type=field.type.index_type),
+            pa.array(list(codes), type=field.type.value_type),
+        )
+
+    def close(self, flush: bool = True) -> None:
+        """Finish the file, writing the buffered rows unless `flush` is off."""
+        if flush:
+            self.flush()
+        self._writer.close()
+
+
+class RunExporter:
+    """Write a run's tables incrementally (see the module docstring).
+
+    Feed it timeseries entries with `add_tick` as they are produced, then
+    the final agents with `add_world` (or `add_agent`/`add_card`), and
+    `close` it to finish the files and write the manifest. Usable as a
+    context manager.
+
+    Parameters:
+        directory: output directory, created if missing
+        fmt: "parquet" or "arrow"
+        batch_rows: rows buffered per table before they are written
+    """
+
+    def __init__(
+        self, directory: Path, fmt: str = "parquet", batch_rows: int = BATCH_ROWS
+    ) -> None:
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format {fmt!r}; expected one of {FORMATS}")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.fmt = fmt
+        self.config: Optional[Dict] = None
+        self.final: Optional[Dict] = None
+        self.tables = {
+            name: _TableWriter(
+                self.directory / f"{name}.{fmt}", schema, fmt, batch_rows
+            )
+            for name, schema in SCHEMAS.items()
+        }
+
+    def __enter__(self) -> "RunExporter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if exc_info[0] is None:
+            self.close()
+            return
+        # keep the original error: close the files without writing more rows
+        for table in self.tables.values():
+            table.close(flush=False)
+
+    def add_tick(self, entry: Mapping) -> None:
+        """Add one timeseries entry: its summary, market snapshot and events."""
+        self.tables["ticks"].append(entry)
+        if "market_snapshot" in entry:
+            self.tables["market"].append(entry["market_snapshot"])
+        for event in entry.get("events", ()):
+            self.tables["events"].append(event)
+
+    def add_agent(self, agent: Mapping) -> None:
+        """Add an agent summary row; `traits` may be nested or flattened."""
+        self.tables["agents"].append({**agent, **agent.get("traits", {})})
+
+    def add_card(self, card: Mapping, history: History) -> None:
+        """Add a card instance row and the price points of its history."""
+        self.tables["card_instances"].append(card)
+        ticks, prices, qualities, desirability = history
+        count = len(ticks)
+        self.tables["price_points"].extend(
+            {
+                "card_instance_id": [card["card_instance_id"]] * count,
+                "card_id": [card["card_id"]] * count,
+                "agent_id": [card["agent_id"]] * count,
+                "tick": ticks,
+                "price": prices,
+                "quality_score": qualities,
+                "desirability": desirability,
+            },
+            count,
+        )
+
+    def add_world(self, world: WorldState) -> None:
+        """Add the agents and card instances of a finished world.
+
+        Price points are read from the typed history arrays without building
+        the per-point dicts of the JSON payload.
+        """
+        self.final = world.summary()
+        after_end = world.tick + 1  # skips the history in to_dict
+        for agent in world.agents.values():
+            self.add_agent(
+                {
+                    "id": agent.id,
+                    "name": agent.name,
+                    "nick": agent.nick,
+                    "prism": agent.prism,
+                    "rng_seed": agent.rng_seed,
+                    "collection_count": len(agent.collection),
+                    "booster_count": agent.boosters,
+                    "traits": agent.traits.to_dict() if agent.traits else {},
+                }
+            )
+            for card in agent.card_instances.values():
+                if card.history is None:
+                    history: History = ((), (), (), ())
+                else:
+                    ticks, prices, *rest = (
+                        column.tolist()
+                        for column in card.history.columns(card.history_index)
+                    )
+                    history = (ticks, [round(p, 2) for p in prices], *rest)
+                self.add_card(card.to_dict(history_from=after_end), history)
+
+    def close(self) -> None:
+        """Finish every file and write the `run.json` manifest."""
+        for table in self.tables.values():
+            table.close()
+        manifest = {
+            "format": self.fmt,
+            "config": self.config,
+            "final": self.final,
+            "tables": {
+                name: {"path": table.path.name, "rows": table.rows}
+                for name, table in self.tables.items()
+            },
+        }
+        (self.directory / "run.json").write_text(json.dumps(manifest, indent=2))
+
+
+def export_run(
+    config: SimulationConfig,
+    directory: Path,
+    fmt: str = "parquet",
+    engine: str = "object",
+    batch_rows: int = BATCH_ROWS,
+) -> Dict[str, int]:
+    """Simulate `config` and export it tick by tick.
+
+    Returns:
+        rows written per table
+    """
+    stream = iter_simulation(config, engine=engine)
+    with RunExporter(directory, fmt, batch_rows) as exporter:
+        exporter.config = dict(config.__dict__)
+        for entry in stream:
+            exporter.add_tick(entry)
+        stream.final()
+        exporter.add_world(stream.world)
+    return {name: table.rows for name, table in exporter.tables.items()}
+
+
+def export_payload(
+    payload: Mapping,
+    directory: Path,
+    fmt: str = "parquet",
+    batch_rows: int = BATCH_ROWS,
+) -> Dict[str, int]:
+    """Export a `/run` payload, e.g. one saved from the API as JSON.
+
+    Returns:
+        rows written per table
+    """
+    with RunExporter(directory, fmt, batch_rows) as exporter:
+        exporter.config = payload.get("config")
+        exporter.final = payload.get("final")
+        for entry in payload["timeseries"]:
+            exporter.add_tick(entry)
+        for agent in payload.get("agents", ()):
+            exporter.add_agent(agent)
+            for card in agent["card_instances"]:
+                points = card["price_history"]
+                history = tuple(
+                    [p[name] for p in points]
+                    for name in ("tick", "price", "quality_score", "desirability")
+                )
+                exporter.add_card(card, history)
+    return {name: table.rows for name, table in exporter.tables.items()}
+
+
+def read_run(directory: Path, tables: Optional[Iterable[str]] = None) -> Dict:
+    """Load an export as pandas DataFrames keyed by table name.
+
+    Dictionary-encoded columns become pandas categoricals.
+    """
+    directory = Path(directory)
+    manifest = json.loads((directory / "run.json").read_text())
+    frames = {}
+    for name in tables or manifest["tables"]:
+        path = directory / manifest["tables"][name]["path"]
+        if manifest["format"] == "parquet":
+            table = pq.read_table(path)
+        else:
+            with pa.memory_map(str(path)) as source:
+                table = pa.ipc.open_file(source).read_all()
+        frames[name] = table.to_pandas()
+    return frames
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m simulation.export",
+        description="Export a Polydros run as Parquet or Arrow tables.",
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--seed", type=int, help="simulate a run with this seed")
+    source.add_argument("--json", type=Path, help="a saved /run JSON payload")
+    parser.add_argument("--agents", type=int, default=10)
+    parser.add_argument("--ticks", type=int, default=1)
+    parser.add_argument("--engine", choices=ENGINES, default="object")
+    parser.add_argument("--format", choices=FORMATS, default="parquet")
+    parser.add_argument("--output", type=Path, required=True, help="directory")
+    args = parser.parse_args(argv)
+
+    if args.json is not None:
+        payload = json.loads(args.json.read_text())
+        rows = export_payload(payload, args.output, args.format)
+    else:
+        config = SimulationConfig(
+            seed=args.seed, initial_agents=args.agents, ticks=args.ticks
+        )
+        rows = export_run(config, args.output, args.format, args.engine)
+    for name, count in rows.items():
+        print(f"{name}: {count} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Parallel parameter sweeps over SimulationConfig variants.
+
+Runs many configs (seeds x agent counts x tick counts) on a
+`ProcessPoolExecutor`. Every worker loads the card pool once and sends back a
+reduced per-run summary instead of the full agent payload; summaries are
+yielded as runs complete and can be streamed to a JSON-lines file. Each run is
+fully determined by its config, so results match a serial run exactly.
+
+Usage:
+    python -m simulation.sweep --seeds 1-20 --agents 10,50 --ticks 100 \\
+        --workers 4 --output sweep.jsonl
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .cards import large_card_pool
+from .engine import ENGINES, SimulationConfig, simulate
+from .types import CardRef
+from .world import WorldState
+
+# Card pool loaded once per worker process by _init_worker
+_WORKER_POOL: Optional[List[CardRef]] = None
+
+
+def sweep_configs(
+    seeds: Iterable[int], agents: Iterable[int], ticks: Iterable[int]
+) -> List[SimulationConfig]:
+    """Return the cartesian product of seeds x agent counts x tick counts."""
+    return [
+        SimulationConfig(seed=seed, initial_agents=n_agents, ticks=n_ticks)
+        for seed, n_agents, n_ticks in product(seeds, agents, ticks)
+    ]
+
+
+def _stats(values: Sequence[float]) -> Dict[str, float]:
+    if not values:
+        return {"mean": 0.0, "min": 0.0, "max": 0.0}
+    return {
+        "mean": sum(values) / len(values),
+        "min": min(values),
+        "max": max(values),
+    }
+
+
+def summarize_run(
+    config: SimulationConfig, world: WorldState, timeseries: List[Dict]
+) -> Dict:
+    """Reduce a finished run to a small, deterministic summary.
+
+    Parameters:
+        config: the run's config
+        world: final world state returned by `engine.simulate`
+        timeseries: per-tick summaries returned by `engine.simulate`
+
+    Returns:
+        dict with the config, final world summary, last market snapshot,
+        event counts by type and Prism/collection distribution statistics
+    """
+    agents = list(world.agents.values())
+    market = timeseries[-1].get("market_snapshot") if timeseries else None
+    event_counts = Counter(e.event_type for e in world.events)
+    return {
+        "config": dict(config.__dict__),
+        "final": world.summary(),
+        "market_snapshot": market,
+        "event_counts": dict(sorted(event_counts.items())),
+        "prism": _stats([a.prism for a in agents]),
+        "collection_count": _stats([len(a.collection) for a in agents]),
+    }
+
+
+def _init_worker() -> None:
+    """Load the card pool once for every run executed by this process."""
+    global _WORKER_POOL
+    _WORKER_POOL = large_card_pool()
+
+
+def _run_one(index: int, config: SimulationConfig, engine: str) -> Dict:
+    pool = _WORKER_POOL if _WORKER_POOL is not None else large_card_pool()
+    world, timeseries = simulate(config, engine=engine, pool=pool)
+    return {"index": index, **summarize_run(config, world, timeseries)}
+
+
+def run_sweep(
+    configs: Iterable[SimulationConfig],
+    max_workers: Optional[int] = None,
+    engine: str = "object",
+    output: Optional[Path] = None,
+) -> Iterator[Dict]:
+    """Run configs in parallel and yield run summaries as they complete.
+
+    Parameters:
+        configs: configs to run
+        max_workers: worker processes (defaults to the CPU count)
+        engine: engine mode passed to `simulate`
+        output: optional JSON-lines file; one summary is written (and flushed)
+            per completed run
+
+    Yields:
+        `summarize_run` dicts with an extra "index" key giving the config's
+        position in `configs` (completion order is not config order)
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+    configs = list(configs)
+    out = output.open("w", encoding="utf-8") if output is not None else None
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker
+        ) as executor:
+            futures = [
+                executor.submit(_run_one, index, config, engine)
+                for index, config in enumerate(configs)
+            ]
+            for future in as_completed(futures):
+                summary = future.result()
+                if out is not None:
+                    out.write(json.dumps(summary) + "\n")
+                    out.flush()
+                yield summary
+    finally:
+        if out is not None:
+            out.close()
+
+
+def _int_list(text: str) -> List[int]:
+    """Parse "1,2,5" and inclusive ranges like "1-20" (or mixes of both)."""
+    values: List[int] = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, sep, stop = part.partition("-")
+        if sep and start:
+            values.extend(range(int(start), int(stop) + 1))
+        else:
+            values.append(int(part))
+    return values
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m simulation.sweep",
+        description="Run a parallel parameter sweep of Polydros simulations.",
+    )
+    parser.add_argument("--seeds", type=_int_list, required=True, help="e.g. 1-20")
+    parser.add_argument("--agents", type=_int_list, default=[10], help="e.g. 10,50")
+    parser.add_argument("--ticks", type=_int_list, default=[1], help="e.g. 100")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--engine", choices=ENGINES, default="object")
+    parser.add_argument(
+        "--output", type=Path, default=None, help="JSON-lines results file"
+    )
+    args = parser.parse_args(argv)
+
+    configs = sweep_configs(args.seeds, args.agents, args.ticks)
+    done = 0
+    for summary in run_sweep(configs, args.workers, args.engine, args.output):
+        done += 1
+        if args.output is None:
+            print(json.dumps(summary), flush=True)
+        else:
+            cfg = summary["config"]
+            print(
+                f"[{done}/{len(configs)}] seed={cfg['seed']} "
+                f"agents={cfg['initial_agents']} ticks={cfg['ticks']}",
+                file=sys.stderr,
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""Shared test configuration."""
+
+import os
+import tempfile
+
+# Keep the backend's persistent run store out of the working tree
+os.environ.setdefault(
+    "POLYDROS_RUN_DB", os.path.join(tempfile.mkdtemp(prefix="polydros-"), "runs.db")
+)
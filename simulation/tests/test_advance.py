@@ -0,0 +1,162 @@
+"""Tests for advancing stored runs incrementally (`/runs/{id}/advance`)."""
+
+import json
+import sqlite3
+
+from fastapi.testclient import TestClient
+
+from backend import main as bm
+from backend.live import LiveRuns
+from simulation.engine import SimulationConfig, iter_simulation, run_simulation
+
+client = TestClient(bm.app)
+
+RUN = {"seed": 7, "agents": 6, "ticks": 0}
+
+
+def _start() -> str:
+    r = client.post("/run", json=RUN)
+    assert r.status_code == 200
+    return r.headers["x-run-id"]
+
+
+def _advance(run_id: str, ticks: int, **params) -> dict:
+    r = client.post(f"/runs/{run_id}/advance", params={"ticks": ticks, **params})
+    assert r.status_code == 200
+    return r.json()
+
+
+def _labels(agent: dict) -> list:
+    return [card["card_instance_id"] for card in agent["card_instances"]]
+
+
+def _fresh(ticks: int) -> dict:
+    return client.post("/run", json={**RUN, "ticks": ticks}).json()
+
+
+def test_stepping_matches_a_fresh_run():
+    run_id = _start()
+    timeseries = client.get(f"/runs/{run_id}/timeseries").json()["timeseries"]
+    for ticks in (3, 1, 21):
+        body = _advance(run_id, ticks)
+        assert body["timeseries"][0]["tick"] == timeseries[-1]["tick"] + 1
+        timeseries += body["timeseries"]
+    assert body["tick"] == 25
+
+    # a view of the advanced run is the last run until another one starts
+    last = bm.LAST_RUN
+    assert last["final"]["tick"] == 25
+    assert len(last["timeseries"]) == 26
+    live = bm.LIVE.get(run_id)
+    assert last.timeseries is not live.timeseries
+
+    fresh = _fresh(25)
+    assert timeseries == fresh["timeseries"]
+    stored = client.get(f"/runs/{run_id}/result").json()
+    assert json.dumps(stored) == json.dumps(fresh)
+
+    body = _advance(run_id, 2, include_agents=True)
+    assert body["agents"] == _fresh(27)["agents"]
+
+    # advancing again leaves the earlier view untouched: the run moved on
+    # with a copy of the world
+    assert last["final"]["tick"] == 25
+    assert len(last["timeseries"]) == 26
+    assert last.world.tick == 25
+    assert last.world is not live.stream.world
+
+
+def test_views_nothing_else_holds_are_not_copied():
+    run_id = _start()
+    _advance(run_id, 1)
+    live = bm.LIVE.get(run_id)
+    world = live.stream.world
+    assert bm.LAST_RUN.world is world
+    for _ in range(3):
+        _advance(run_id, 1)
+    assert live.stream.world is world
+    assert bm.LAST_RUN["final"]["tick"] == 4
+
+
+def test_cards_that_leave_a_collection_leave_the_stored_run():
+    run_id = _start()
+    _advance(run_id, 2)
+    world = bm.LIVE.get(run_id).stream.world
+    agent = next(iter(world.agents.values()))
+    removed = next(iter(agent.card_instances.values()))
+    agent.remove_card_instance(removed.card_instance_id)
+    _advance(run_id, 1)
+
+    stored = client.get(f"/runs/{run_id}/result").json()
+    expected = bm.LAST_RUN.to_dict()
+    assert removed.label not in _labels(stored["agents"][0])
+    for agent, live_agent in zip(stored["agents"], expected["agents"], strict=True):
+        assert _labels(agent) == _labels(live_agent)
+    same = json.dumps(stored) == json.dumps(expected)  # keeps failures readable
+    assert same
+    # its price history went with it
+    with sqlite3.connect(bm.STORE.path) as conn:
+        orphans = conn.execute(
+            "SELECT COUNT(*) FROM price_points "
+            "WHERE run_id = ? AND card_instance_id = ?",
+            (run_id, removed.label),
+        ).fetchone()[0]
+    assert orphans == 0
+
+
+def test_only_advanced_runs_are_kept_live():
+    r = client.post("/run", json=RUN, params={"fields": "timeseries,final"})
+    run_id = r.headers["x-run-id"]
+    assert bm.LIVE.get(run_id) is None
+    assert bm.LAST_RUN._agent_list is None  # /run leaves the result lazy
+    _advance(run_id, 1)
+    assert bm.LIVE.get(run_id).tick == 1
+
+
+def test_evicted_and_lost_runs_can_still_advance(monkeypatch):
+    monkeypatch.setattr(bm.LIVE, "capacity", 1)
+    first = _start()
+    _advance(first, 4)
+    second = _start()
+    _advance(second, 1)  # evicts the first run to a checkpoint
+    bm.LIVE.wait()
+    assert (bm.LIVE.checkpoint_dir / f"{first}.ckpt").exists()
+
+    assert _advance(first, 2)["tick"] == 6
+    assert not (bm.LIVE.checkpoint_dir / f"{first}.ckpt").exists()
+
+    # neither live nor checkpointed: re-simulated once from the stored config
+    bm.LIVE.discard(second)
+    body = _advance(second, 6)
+    assert body["timeseries"] == _fresh(7)["timeseries"][2:]
+
+
+def test_only_the_newest_checkpoints_are_kept(tmp_path):
+    live = LiveRuns(tmp_path, capacity=1, max_checkpoints=2)
+    run_ids = [f"run{n}" for n in range(4)]
+    for run_id in run_ids:
+        live.keep(run_id, run_simulation(SimulationConfig(seed=3, ticks=2)))
+        live.wait()
+    # run3 is live, run0 was checkpointed first and dropped
+    assert sorted(p.stem for p in tmp_path.glob("*.ckpt")) == ["run1", "run2"]
+    assert live.get("run0") is None
+    assert live.get("run2").tick == 2
+
+
+def test_advance_errors():
+    assert "error" in _advance("missing", 1)
+    run_id = _start()
+    zero = client.post(f"/runs/{run_id}/advance", params={"ticks": 0})
+    assert zero.status_code == 422
+    client.delete(f"/runs/{run_id}")
+    assert "error" in _advance(run_id, 1)
+
+
+def test_stream_extend_continues_a_finished_stream():
+    stream = iter_simulation(SimulationConfig(seed=2, initial_agents=4, ticks=3))
+    head = list(stream)
+    stream.extend(4)
+    tail = list(stream)
+    assert [e["tick"] for e in tail] == [4, 5, 6, 7]
+    full = list(iter_simulation(SimulationConfig(seed=2, initial_agents=4, ticks=7)))
+    assert head + tail == full
@@ -0,0 +1,133 @@
+"""API tests for the paginated, filtered agent list endpoints."""
+
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.query import paginate, sort_items
+from simulation.types import AgentCardInstance
+
+client = TestClient(app)
+
+RUN = {"seed": 21, "agents": 6, "packs_per_agent": 1, "ticks": 8}
+
+
+def _run() -> dict:
+    r = client.post("/run", json=RUN)
+    assert r.status_code == 200
+    return {a["id"]: a for a in r.json()["agents"]}
+
+
+def test_agents_list_is_minimal_and_paged():
+    agents = _run()
+    body = client.get("/agents", params={"limit": 4}).json()
+    assert body["total"] == 6
+    assert [a["id"] for a in body["agents"]] == list(agents)[:4]
+    assert "card_instances" not in body["agents"][0]
+    assert body["agents"][0]["collection_count"] == agents[1]["collection_count"]
+
+    rest = client.get("/agents", params={"cursor": body["next_cursor"]}).json()
+    assert [a["id"] for a in rest["agents"]] == list(agents)[4:]
+    assert rest["next_cursor"] is None
+
+    by_size = client.get(
+        "/agents", params={"sort": "collection_count", "order": "desc"}
+    ).json()["agents"]
+    counts = [a["collection_count"] for a in by_size]
+    assert counts == sorted(counts, reverse=True)
+
+
+def test_agents_filter_by_prism_range():
+    agents = _run()
+    low = sorted(a["prism"] for a in agents.values())[2]
+    body = client.get("/agents", params={"prism_min": low}).json()
+    expected = [a["id"] for a in agents.values() if a["prism"] >= low]
+    assert [a["id"] for a in body["agents"]] == expected
+    assert body["total"] == len(expected)
+
+    capped = client.get("/agents", params={"prism_max": low}).json()["agents"]
+    assert all(a["prism"] <= low for a in capped)
+    assert len(capped) + len(expected) >= len(agents)
+
+
+def test_cards_filter_sort_and_count():
+    agent = _run()[2]
+    cards = agent["card_instances"]
+    rarity = cards[0]["card_rarity"]
+
+    body = client.get(
+        "/agents/2/cards",
+        params={"rarity": rarity.lower(), "sort": "current_price", "limit": 5},
+    ).json()
+    matching = [c for c in cards if c["card_rarity"] == rarity]
+    assert body["total"] == len(matching)
+    assert body["collection_count"] == agent["collection_count"]
+    assert all(c["card_rarity"] == rarity for c in body["cards"])
+    prices = [c["current_price"] for c in body["cards"]]
+    assert prices == sorted(c["current_price"] for c in matching)[:5]
+
+    # without parameters the whole inventory is returned as before
+    full = client.get("/agents/2/cards").json()
+    assert full["cards"] == cards
+    assert full["next_cursor"] is None
+
+
+def test_card_pages_serialize_only_their_rows(monkeypatch):
+    cards = _run()[2]["card_instances"]
+    rendered = []
+    to_dict = AgentCardInstance.to_dict
+
+    def counting(card: AgentCardInstance, *args: object) -> dict:
+        rendered.append(card.label)
+        return to_dict(card, *args)
+
+    monkeypatch.setattr(AgentCardInstance, "to_dict", counting)
+    body = client.get(
+        "/agents/2/cards", params={"sort": "quality_score", "limit": 3}
+    ).json()
+    assert len(rendered) == 3
+    expected = sorted(cards, key=lambda c: c["quality_score"])[:3]
+    assert body["cards"] == expected
+
+
+def test_events_filter_by_type_and_tick_range():
+    agent = _run()[1]
+    events = agent["agent_events"]
+    event_type = events[-1]["event_type"]
+
+    body = client.get(
+        "/agents/1/events",
+        params={"event_type": event_type, "tick_min": 2, "tick_max": 5},
+    ).json()
+    expected = [
+        e for e in events if e["event_type"] == event_type and 2 <= e["tick"] <= 5
+    ]
+    assert body["events"] == expected
+    assert body["total"] == len(expected)
+
+    newest = client.get("/agents/1/events", params={"order": "desc", "limit": 1})
+    assert newest.json()["events"] == [events[-1]]
+
+
+def test_invalid_queries_return_errors():
+    _run()
+    assert "error" in client.get("/agents", params={"sort": "bogus"}).json()
+    assert "error" in client.get("/agents/1/cards", params={"cursor": "x"}).json()
+    assert "error" in client.get("/agents/1/events", params={"order": "up"}).json()
+    assert "error" in client.get("/agents/999/cards").json()
+    assert client.get("/agents", params={"limit": 0}).status_code == 422
+
+
+def test_paginate_and_sort_helpers():
+    rows = [{"n": 3, "s": "b"}, {"n": 1, "s": None}, {"n": 2, "s": "A"}]
+    assert [r["n"] for r in sort_items(rows, "s", "asc", ("n", "s"))] == [2, 3, 1]
+    assert [r["n"] for r in sort_items(rows, None, "desc", ())] == [2, 1, 3]
+
+    page = paginate(rows, "rows", offset=1, limit=1)
+    assert page == {
+        "rows": [rows[1]],
+        "total": 3,
+        "offset": 1,
+        "limit": 1,
+        "next_cursor": "2",
+    }
+    assert paginate(rows, "rows", cursor="2")["rows"] == [rows[2]]
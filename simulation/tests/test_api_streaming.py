@@ -0,0 +1,67 @@
+"""API tests for the live tick streaming endpoints."""
+
+import json
+
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from simulation import SimulationConfig, run_simulation
+
+client = TestClient(app)
+
+
+def test_ndjson_stream_matches_run():
+    payload = {"seed": 31, "agents": 3, "ticks": 4}
+    expected = run_simulation(SimulationConfig(seed=31, initial_agents=3, ticks=4))
+
+    with client.stream("POST", "/run/stream", json=payload) as r:
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("application/x-ndjson")
+        messages = [json.loads(line) for line in r.iter_lines() if line]
+
+    ticks = [m["data"] for m in messages if m["type"] == "tick"]
+    assert ticks == expected["timeseries"]
+    assert messages[-1]["type"] == "result"
+    assert messages[-1]["data"]["final"] == expected["final"]
+    assert messages[-1]["data"]["agents"] == expected["agents"]
+
+
+def test_stream_stores_last_run():
+    client.post("/run/stream", json={"seed": 5, "agents": 2, "ticks": 1})
+    body = client.get("/agents").json()
+    assert len(body["agents"]) == 2
+
+
+def test_sse_stream():
+    r = client.post(
+        "/run/stream",
+        json={"seed": 2, "agents": 2, "ticks": 2},
+        headers={"Accept": "text/event-stream"},
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/event-stream")
+    blocks = [b for b in r.text.split("\n\n") if b]
+    assert [b.splitlines()[0] for b in blocks] == [
+        "event: tick",
+        "event: tick",
+        "event: tick",
+        "event: result",
+    ]
+    first = json.loads(blocks[0].splitlines()[1][len("data: "):])
+    assert first["tick"] == 0
+
+
+def test_websocket_stream():
+    with client.websocket_connect("/ws/run") as ws:
+        ws.send_json({"seed": 9, "agents": 2, "ticks": 2})
+        messages = [ws.receive_json() for _ in range(4)]
+
+    assert [m["type"] for m in messages] == ["tick", "tick", "tick", "result"]
+    assert [m["data"]["tick"] for m in messages[:3]] == [0, 1, 2]
+
+
+def test_websocket_rejects_bad_config():
+    with client.websocket_connect("/ws/run") as ws:
+        ws.send_json({"seed": "not a number"})
+        message = ws.receive_json()
+    assert message["type"] == "error"
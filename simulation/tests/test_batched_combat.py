@@ -0,0 +1,98 @@
+"""Tests for batched combat resolution."""
+
+import math
+import random
+
+import numpy as np
+
+from simulation.booster import open_booster
+from simulation.cards import large_card_pool
+from simulation.engine import degrade_card_quality, degrade_deck, resolve_matches
+from simulation.world import DECK_SIZE, Agent, WorldState
+
+
+def _world(n_agents: int, seed: int = 8) -> WorldState:
+    rng = random.Random(seed)
+    pool = large_card_pool()
+    world = WorldState()
+    for agent_id in range(1, n_agents + 1):
+        agent = Agent(id=agent_id, name=f"Agent {agent_id}")
+        cards = []
+        while len(cards) < DECK_SIZE:
+            cards.extend(open_booster(pool, rng))
+        agent.add_cards(cards)
+        world.add_agent(agent)
+    return world
+
+
+def _resolve_one_by_one(world: WorldState, matches, t: int) -> list:
+    """Reference: resolve each match in turn with per-card stat updates."""
+    events = []
+    for agent, opponent in matches:
+        if opponent is None:
+            events.append(("play", agent.id))
+            continue
+        a = agent.deck_stats().score
+        o = opponent.deck_stats().score
+        if a == o:
+            events.append(("tie", agent.id, opponent.id))
+            continue
+        winner, loser = (agent, opponent) if a > o else (opponent, agent)
+        for card in winner.collection[:DECK_SIZE]:
+            world.boost_card_stats(card.ref.card_id, 0.01)
+        for card in loser.collection[:DECK_SIZE]:
+            world.penalize_card_stats(card.ref.card_id, 0.01)
+        events.append(("win", winner.id, loser.id))
+    return events
+
+
+def test_batch_matches_sequential_resolution():
+    world = _world(6)
+    reference = _world(6)
+    agents = list(world.agents.values())
+    rng = random.Random(2)
+    pairs = [(rng.randrange(6), rng.randrange(6)) for _ in range(30)]
+    pairs = [(i, j) for i, j in pairs if i != j] + [(0, None)]
+
+    matches = [(agents[i], agents[j] if j is not None else None) for i, j in pairs]
+    resolve_matches(world, matches, t=1)
+
+    ref_agents = list(reference.agents.values())
+    ref_matches = [
+        (ref_agents[i], ref_agents[j] if j is not None else None) for i, j in pairs
+    ]
+    expected = _resolve_one_by_one(reference, ref_matches, t=1)
+
+    assert [e.agent_id for e in world.events] == [e[1] for e in expected]
+    assert world.events[-1].event_type == "play"
+    assert world.card_metadata.keys() == reference.card_metadata.keys()
+    for card_id, stats in world.card_metadata.items():
+        for key, value in stats.items():
+            assert math.isclose(value, reference.card_metadata[card_id][key])
+
+
+def test_scores_array_overrides_deck_stats():
+    world = _world(2)
+    a, b = world.agents[1], world.agents[2]
+    resolve_matches(world, [(a, b)], t=3, scores=np.array([[1.0, 2.0]]))
+    event = world.events[0]
+    assert event.agent_id == 2
+    assert event.description.endswith("(2.00 vs 1.00)")
+
+
+def test_apply_card_results_floors_penalties():
+    world = WorldState()
+    world.card_table.set("C1", 0.02, 0.02)
+    world.apply_card_results({"C2": 3}, {"C1": 500})
+    assert world.card_metadata["C1"] == {"attractiveness": 0.01, "price": 0.01}
+    assert math.isclose(world.card_metadata["C2"]["price"], 1.01 ** 3)
+
+
+def test_degrade_deck_matches_repeated_degradation():
+    deck = _world(1).agents[1].collection[:DECK_SIZE]
+    reference = _world(1).agents[1].collection[:DECK_SIZE]
+    degrade_deck(deck, 3)
+    for card in reference:
+        for _ in range(3):
+            degrade_card_quality(card, 0.01)
+    assert [c.quality_score for c in deck] == [c.quality_score for c in reference]
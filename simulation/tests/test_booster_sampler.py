@@ -0,0 +1,101 @@
+"""Tests for the precompiled BoosterSampler."""
+
+import random
+from typing import List, Sequence
+
+from simulation.booster import DEFAULT_PACK_TEMPLATE, BoosterSampler
+from simulation.cards import large_card_pool
+from simulation.types import CardInstance, CardRef, Rarity
+
+
+def _reference_open_booster(
+    pool: Sequence[CardRef], rng: random.Random
+) -> List[CardInstance]:
+    """Per-call implementation the sampler must reproduce draw for draw."""
+    instances: List[CardInstance] = []
+    for rarity, count in DEFAULT_PACK_TEMPLATE.items():
+        candidates = [c for c in pool if c.rarity == rarity]
+        if not candidates:
+            continue
+        weights = [c.pack_weight for c in candidates]
+        for c in rng.choices(candidates, weights=weights, k=count):
+            instances.append(CardInstance(ref=c, is_hologram=rng.random() < 0.02))
+
+    if rng.random() < 0.05:
+        mythics = [c for c in pool if c.rarity == Rarity.MYTHIC]
+        rares = [i for i in instances if i.ref.rarity == Rarity.RARE]
+        if mythics and rares:
+            replace_idx = rng.randrange(len(rares))
+            new_ref = rng.choice(mythics)
+            for idx, inst in enumerate(instances):
+                if inst is rares[replace_idx]:
+                    instances[idx] = CardInstance(
+                        ref=new_ref, is_hologram=rng.random() < 0.05
+                    )
+                    break
+    return instances
+
+
+def test_open_pack_matches_reference_draws():
+    pool = large_card_pool()
+    sampler = BoosterSampler(pool)
+    expected_rng = random.Random(2024)
+    actual_rng = random.Random(2024)
+
+    for _ in range(300):
+        assert sampler.open_pack(actual_rng) == _reference_open_booster(
+            pool, expected_rng
+        )
+    # Both generators must end in the same state
+    assert actual_rng.random() == expected_rng.random()
+
+
+def test_open_many_matches_open_pack():
+    sampler = BoosterSampler(large_card_pool())
+    rng = random.Random(7)
+    packs = [sampler.open_pack(rng) for _ in range(200)]
+
+    indices, holograms = sampler.open_many(200, random.Random(7))
+
+    assert indices.shape == (200, sampler.pack_size)
+    assert holograms.shape == (200, sampler.pack_size)
+    for p, pack in enumerate(packs):
+        assert [sampler.cards[i] for i in indices[p]] == [c.ref for c in pack]
+        assert holograms[p].tolist() == [c.is_hologram for c in pack]
+
+
+def test_open_batch_draws_each_generator_like_open_pack():
+    sampler = BoosterSampler(large_card_pool())
+    seeds_and_packs = [(11, 3), (12, 0), (13, 5)]
+    expected = []
+    for seed, n in seeds_and_packs:
+        rng = random.Random(seed)
+        expected += [sampler.open_pack(rng) for _ in range(n)]
+
+    indices, holograms = sampler.open_batch(
+        [(random.Random(seed), n) for seed, n in seeds_and_packs]
+    )
+
+    assert indices.shape == (8, sampler.pack_size)
+    for p, pack in enumerate(expected):
+        assert [sampler.cards[i] for i in indices[p]] == [c.ref for c in pack]
+        assert holograms[p].tolist() == [c.is_hologram for c in pack]
+    assert sampler.open_batch([])[0].shape == (0, sampler.pack_size)
+
+
+def test_open_many_includes_mythic_upgrades():
+    sampler = BoosterSampler(large_card_pool())
+    indices, _ = sampler.open_many(500, random.Random(3))
+    rarities = {sampler.cards[i].rarity for i in indices.ravel()}
+    assert Rarity.MYTHIC in rarities
+
+
+def test_missing_rarity_shrinks_pack():
+    pool = [
+        CardRef("C1", "Common", "Ruby", Rarity.COMMON, pack_weight=2.0),
+        CardRef("C2", "Common 2", "Ruby", Rarity.COMMON, pack_weight=1.0),
+    ]
+    sampler = BoosterSampler(pool)
+    assert sampler.pack_size == DEFAULT_PACK_TEMPLATE[Rarity.COMMON]
+    indices, _ = sampler.open_many(10, random.Random(1))
+    assert set(indices.ravel().tolist()) <= {0, 1}
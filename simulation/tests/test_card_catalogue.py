@@ -0,0 +1,106 @@
+"""Tests for the cached, compiled card catalogue."""
+
+import json
+import os
+
+import pytest
+
+from simulation import cards
+
+
+def _card(card_id: str, pack_weight: float = 1.0) -> dict:
+    return {
+        "id": card_id,
+        "name": f"Card {card_id}",
+        "color": "Ruby",
+        "type": "Creature",
+        "rarity": "COMMON",
+        "pack_weight": pack_weight,
+    }
+
+
+def _write(path, raw, mtime_ns=None):
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def catalogue_path(tmp_path, monkeypatch):
+    path = tmp_path / "cards.json"
+    monkeypatch.setattr(cards, "_CARDS_PATH", path)
+    monkeypatch.setattr(cards, "_COMPILED_PATH", path.with_suffix(".pickle"))
+    cards.clear_card_cache()
+    yield path
+    cards.clear_card_cache()
+
+
+def test_repeated_loads_reuse_the_cached_catalogue(catalogue_path, monkeypatch):
+    _write(catalogue_path, [_card("1"), _card("2", pack_weight=6.0)])
+    first = cards.large_card_pool()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("catalogue was re-parsed")
+
+    monkeypatch.setattr(cards.json, "loads", fail)
+    assert cards.large_card_pool() == first
+    assert cards.large_card_pool() is not first
+    assert [c.card_id for c in cards.sample_card_pool()] == ["2"]
+
+
+def test_rewriting_the_json_invalidates_the_cache(catalogue_path):
+    _write(catalogue_path, [_card("1")], mtime_ns=1_000_000_000)
+    assert [c.card_id for c in cards.load_all_cards()] == ["1"]
+
+    _write(catalogue_path, [_card("1"), _card("9")], mtime_ns=2_000_000_000)
+    assert [c.card_id for c in cards.load_all_cards()] == ["1", "9"]
+
+
+def test_compiled_artifact_skips_json_parsing(catalogue_path, monkeypatch):
+    _write(catalogue_path, [_card("1"), _card("2", pack_weight=7.0)])
+    compiled = cards.compile_catalogue()
+    assert compiled.exists()
+    expected = cards.load_all_cards()
+
+    cards.clear_card_cache()
+    monkeypatch.setattr(cards.json, "loads", None)
+    assert cards.load_all_cards() == expected
+    assert [c.card_id for c in cards.sample_card_pool()] == ["2"]
+
+
+def test_stale_artifact_is_ignored(catalogue_path):
+    _write(catalogue_path, [_card("1")], mtime_ns=1_000_000_000)
+    cards.compile_catalogue()
+
+    compiled = catalogue_path.with_suffix(".pickle").read_bytes()
+    _write(catalogue_path, [_card("5")], mtime_ns=2_000_000_000)
+    assert [c.card_id for c in cards.load_all_cards()] == ["5"]
+
+    # loading leaves the artifact alone; only compile_catalogue rewrites it
+    assert catalogue_path.with_suffix(".pickle").read_bytes() == compiled
+
+
+def test_loading_never_writes_the_artifact(catalogue_path):
+    _write(catalogue_path, [_card("1")])
+    assert [c.card_id for c in cards.load_all_cards()] == ["1"]
+    assert not catalogue_path.with_suffix(".pickle").exists()
+
+
+def test_artifact_with_another_digest_is_not_unpickled(catalogue_path, monkeypatch):
+    _write(catalogue_path, [_card("1")])
+    cards.compile_catalogue()
+    _write(catalogue_path, [_card("2")])
+    cards.clear_card_cache()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("stale artifact was unpickled")
+
+    monkeypatch.setattr(cards.pickle, "load", fail)
+    assert [c.card_id for c in cards.load_all_cards()] == ["2"]
+
+
+def test_real_catalogue_matches_json():
+    cards.clear_card_cache()
+    with cards._CARDS_PATH.open(encoding="utf-8") as fh:
+        raw = json.load(fh)
+    assert [c.card_id for c in cards.large_card_pool()] == [d["id"] for d in raw]
@@ -0,0 +1,139 @@
+"""Tests for the slotted, flyweight card instance types."""
+
+import pickle
+
+import pytest
+
+from simulation.engine import SimulationConfig, simulate
+from simulation.types import (
+    AgentCardInstance,
+    CardInstance,
+    CardRef,
+    Rarity,
+    format_card_instance_id,
+    parse_card_instance_id,
+)
+from simulation.world import Agent
+
+REF = CardRef(
+    "C042",
+    "Ember Drake",
+    "Ruby",
+    Rarity.RARE,
+    gem_colored=2,
+    gem_colorless=1,
+    flavor_text="Hot.",
+)
+
+
+def _instance() -> AgentCardInstance:
+    return AgentCardInstance(
+        card_instance_id=7,
+        ref=REF,
+        agent_id=1,
+        acquisition_tick=1,
+        acquisition_price=3.0,
+        current_price=3.0,
+    )
+
+
+def test_instances_have_no_per_instance_dict():
+    assert not hasattr(_instance(), "__dict__")
+    assert not hasattr(CardInstance(ref=REF), "__dict__")
+
+
+def test_definition_fields_come_from_the_shared_ref():
+    card = _instance()
+    assert card.card_id == "C042"
+    assert card.card_name == "Ember Drake"
+    assert card.card_color == "Ruby"
+    assert card.card_rarity == "Rare"
+    assert card.flavor_text == "Hot."
+    assert (card.gem_colored, card.gem_colorless) == (2, 1)
+
+    serialized = card.to_dict()
+    assert serialized["card_name"] == "Ember Drake"
+    assert serialized["card_rarity"] == "Rare"
+    assert serialized["gem_colored"] == 2
+
+
+def test_serialized_keys_are_unchanged():
+    assert list(_instance().to_dict()) == [
+        "card_instance_id",
+        "card_id",
+        "card_name",
+        "flavor_text",
+        "card_color",
+        "card_rarity",
+        "agent_id",
+        "acquisition_tick",
+        "acquisition_price",
+        "current_price",
+        "quality_score",
+        "desirability",
+        "win_count",
+        "loss_count",
+        "condition",
+        "price_history",
+        "gem_colored",
+        "gem_colorless",
+    ]
+
+
+def test_instances_pickle():
+    card = _instance()
+    card.record_price_point(1)
+    copy = pickle.loads(pickle.dumps(card))
+    assert copy.to_dict() == card.to_dict()
+
+
+def test_run_shares_card_refs():
+    world, _ = simulate(SimulationConfig(seed=3, initial_agents=2, ticks=3))
+    agent = world.agents[1]
+    refs = {id(c.ref) for c in agent.collection}
+    assert {id(ci.ref) for ci in agent.card_instances.values()} <= refs
+
+
+def test_low_feasibility_replacement_shares_the_ref():
+    agent = Agent(id=1)
+    agent.add_card_instance(_instance())
+    other = CardRef("C043", "Frost Drake", "Sapphire", Rarity.RARE, quality_score=6.5)
+
+    replaced = agent.replace_low_feasibility_deck_cards(
+        deck=[{"card_id": 7, "feasibility_score": 0.5}],
+        replacement_pool=[CardInstance(ref=other)],
+    )
+
+    assert replaced == [7]
+    (card,) = agent.card_instances.values()
+    assert card.ref is other
+    assert card.quality_score == 6.5
+    assert card.current_price == 3.0
+    assert card.to_dict()["card_name"] == "Frost Drake"
+
+
+def test_textual_id_is_rendered_and_parsed():
+    card = _instance()
+    assert card.label == "INST_C042_1_1_7"
+    assert card.to_dict()["card_instance_id"] == "INST_C042_1_1_7"
+    assert parse_card_instance_id("INST_C042_1_1_7") == 7
+    assert parse_card_instance_id(format_card_instance_id("A_B", 3, 9, 12)) == 12
+    for bad in ("C042_1_1_7", "INST_C042_x", "7"):
+        with pytest.raises(ValueError):
+            parse_card_instance_id(bad)
+
+
+def test_instance_ids_are_unique_serials():
+    world, _ = simulate(SimulationConfig(seed=5, initial_agents=4, ticks=6))
+    ids = [
+        ci.card_instance_id
+        for agent in world.agents.values()
+        for ci in agent.card_instances.values()
+    ]
+    assert sorted(ids) == list(range(1, len(ids) + 1))
+    assert world.card_serials.next_serial == len(ids) + 1
+
+    agent = world.agents[2]
+    card = next(iter(agent.card_instances.values()))
+    assert agent.get_card_instance(card.label) is card
+    assert agent.get_card_instance(card.card_instance_id) is card
@@ -0,0 +1,53 @@
+"""Tests for the dense card metadata table."""
+
+import numpy as np
+
+from simulation.cards import card_indices, large_card_pool
+from simulation.engine import SimulationConfig, create_world
+from simulation.world import CardMetadataTable, WorldState
+
+
+def test_catalogue_cards_use_their_catalogue_index():
+    world = create_world(SimulationConfig(seed=1, initial_agents=1, ticks=0))
+    pool = large_card_pool()
+    assert card_indices()[pool[3].card_id] == 3
+    assert world.card_table.index_of(pool[3].card_id) == 3
+    assert len(world.card_table) == 0
+
+
+def test_accessors_keep_dict_semantics():
+    world = WorldState()
+    assert world.card_metadata == {}
+
+    assert world.get_card_attractiveness("A", default=2.5) == 2.5
+    assert world.get_card_price("B", default=4.0) == 4.0
+    world.boost_card_stats("A", 0.5)
+    world.penalize_card_stats("C", 0.999)
+
+    assert world.card_metadata == {
+        "A": {"attractiveness": 3.75, "price": 1.5},
+        "B": {"attractiveness": 1.0, "price": 4.0},
+        "C": {"attractiveness": 0.01, "price": 0.01},
+    }
+
+
+def test_bulk_read_and_scale():
+    table = CardMetadataTable({"X": 0, "Y": 1})
+    idx = table.indices(["Y", "Z", "X"])
+    assert idx.tolist() == [1, 2, 0]
+
+    table.scale(np.array([0, 1]), np.array([2.0, 0.001]), np.array([np.nan, 0.01]))
+    attractiveness, price = table.read(idx)
+    assert attractiveness.tolist() == [0.01, 1.0, 2.0]
+    assert price.tolist() == [0.01, 1.0, 2.0]
+    assert set(table.to_dict()) == {"X", "Y", "Z"}
+
+
+def test_table_grows_past_initial_capacity():
+    table = CardMetadataTable()
+    ids = [f"card{i}" for i in range(100)]
+    idx = table.indices(ids)
+    assert idx.tolist() == list(range(100))
+    table.scale(idx, np.full(100, 3.0))
+    assert table.price.tolist() == [3.0] * 100
+    assert len(table) == 100
@@ -0,0 +1,75 @@
+"""Tests for checkpointing, resuming and forking simulations."""
+
+import json
+from dataclasses import replace
+
+import pytest
+
+from simulation.checkpoint import load_checkpoint, resume_simulation
+from simulation.engine import SimulationConfig, iter_simulation, run_simulation
+
+CONFIG = SimulationConfig(seed=5, initial_agents=8, ticks=30)
+
+
+def _checkpoint(path, config, tick, engine="object"):
+    stream = iter_simulation(config, engine=engine)
+    timeseries = [next(stream) for _ in range(tick + 1)]
+    stream.checkpoint(path, timeseries)
+    return stream
+
+
+def _dump(result) -> str:
+    return json.dumps(result.to_dict())
+
+
+@pytest.mark.parametrize("engine", ["object", "columnar"])
+@pytest.mark.parametrize("tick", [0, 21])
+def test_resume_matches_an_uninterrupted_run(tmp_path, engine, tick):
+    path = tmp_path / "run.ckpt"
+    _checkpoint(path, CONFIG, tick, engine)
+    expected = _dump(run_simulation(CONFIG, engine=engine))
+    assert _dump(resume_simulation(path)) == expected
+
+
+def test_chunked_run_and_checkpointed_stream_keep_going(tmp_path):
+    path = tmp_path / "run.ckpt"
+    stream = _checkpoint(path, CONFIG, 10)
+    rest = list(stream)  # checkpointing does not disturb the live stream
+
+    checkpoint = load_checkpoint(path)
+    assert checkpoint.tick == 10
+    assert len(checkpoint.timeseries) == 11
+    resumed = checkpoint.stream()
+    chunk = [next(resumed) for _ in range(15)]
+    resumed.checkpoint(path, checkpoint.timeseries + chunk)
+
+    result = resume_simulation(path)
+    assert result["timeseries"][11:] == rest
+    assert _dump(result) == _dump(run_simulation(CONFIG))
+
+
+def test_fork_with_more_ticks_or_a_new_seed(tmp_path):
+    path = tmp_path / "run.ckpt"
+    _checkpoint(path, replace(CONFIG, ticks=18), 18)
+
+    longer = resume_simulation(path, replace(CONFIG, ticks=30))
+    assert _dump(longer) == _dump(run_simulation(CONFIG))
+
+    forked = resume_simulation(path, replace(CONFIG, seed=6))
+    again = resume_simulation(path, replace(CONFIG, seed=6))
+    assert _dump(forked) == _dump(again)
+    assert forked["timeseries"][:19] == longer["timeseries"][:19]
+    assert forked["agents"] != longer["agents"]
+
+    switched = resume_simulation(path, CONFIG, engine="columnar")
+    assert _dump(switched) == _dump(longer)
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "bogus.ckpt"
+    path.write_bytes(b"not a checkpoint")
+    with pytest.raises(ValueError):
+        load_checkpoint(path)
+    path.write_bytes(b"PLYCKPT\x01garbage")
+    with pytest.raises(ValueError):
+        load_checkpoint(path)
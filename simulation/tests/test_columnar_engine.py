@@ -0,0 +1,44 @@
+"""Tests for the columnar (struct-of-arrays) engine mode."""
+
+import pytest
+
+from simulation.engine import SimulationConfig, run_simulation
+
+
+@pytest.mark.parametrize(
+    "seed,agents,ticks",
+    [(42, 5, 30), (7, 12, 25), (1, 1, 15), (3, 0, 2)],
+)
+def test_columnar_matches_object_engine(seed, agents, ticks):
+    """Both engine modes must produce identical output for the same seed."""
+    config = SimulationConfig(seed=seed, initial_agents=agents, ticks=ticks)
+
+    expected = run_simulation(config)
+    actual = run_simulation(config, engine="columnar")
+
+    assert actual == expected
+
+
+def test_columnar_respects_distributor_stock():
+    """Buyers beyond the distributor's stock are skipped in agent order."""
+    config = SimulationConfig(seed=11, initial_agents=3, ticks=1)
+
+    from simulation import engine
+
+    original = engine.DISTRIBUTOR_STOCK
+    engine.DISTRIBUTOR_STOCK = 10  # enough for two buyers
+    try:
+        expected = run_simulation(config)
+        actual = run_simulation(config, engine="columnar")
+    finally:
+        engine.DISTRIBUTOR_STOCK = original
+
+    assert actual == expected
+    assert actual["final"]["distributor_boosters"] == 0
+    purchases = [e for e in actual["events"] if e["event_type"] == "booster_purchase"]
+    assert [e["agent_id"] for e in purchases] == [1, 2]
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        run_simulation(SimulationConfig(ticks=0), engine="vectorised")
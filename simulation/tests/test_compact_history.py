@@ -0,0 +1,75 @@
+"""Tests for the compact price history transport and response compression."""
+
+import json
+
+from fastapi.testclient import TestClient
+
+from backend import main as bm
+from simulation import SimulationConfig, run_simulation
+from simulation.types import decode_price_history, encode_price_history
+
+client = TestClient(bm.app)
+
+RUN = {"seed": 21, "agents": 4, "ticks": 30}
+
+
+def _decoded(cards):
+    return [
+        {**card, "price_history": decode_price_history(card["price_history"])}
+        for card in cards
+    ]
+
+
+def test_encoding_round_trips_exactly():
+    ticks = [3, 4, 5, 6, 9, 10, 11]
+    prices = [1.004, 1.0, 1.0, 1.25, 1.25, 1.25, 0.335]
+    qualities = [10.0, 10.0, 10.0, 9.7, 9.7, 9.7, 9.7]
+    desirability = [7.0] * 7
+    encoded = encode_price_history(ticks, prices, qualities, desirability)
+    # runs break on a changed point and on a tick gap
+    assert encoded["runs"] == [3, 1, 2, 1]
+    assert encoded["ticks"] == [3, 1, 3, 1]
+    assert encoded["price"] == [100, 25, 0, -91]
+    expected = [
+        {"tick": t, "price": round(p, 2), "quality_score": q, "desirability": d}
+        for t, p, q, d in zip(ticks, prices, qualities, desirability, strict=True)
+    ]
+    assert decode_price_history(json.loads(json.dumps(encoded))) == expected
+    assert decode_price_history(encode_price_history([], [], [], [])) == []
+
+    result = run_simulation(SimulationConfig(21, 4, 30))
+    for agent in result.world.agents.values():
+        for card in agent.card_instances.values():
+            compact = card.history.to_compact(card.history_index)
+            full = card.history.to_dicts(card.history_index)
+            assert decode_price_history(compact) == full
+
+
+def test_compact_run_payload():
+    full = client.post("/run", json=RUN).json()
+    r = client.post("/run", json=RUN, params={"history": "compact"})
+    compact = r.json()
+    for full_agent, agent in zip(full["agents"], compact["agents"], strict=True):
+        assert _decoded(agent["card_instances"]) == full_agent["card_instances"]
+    assert len(json.dumps(compact)) < len(json.dumps(full)) / 2
+
+    run_id = r.headers["x-run-id"]
+    cards = client.get(
+        f"/runs/{run_id}/agents/2/cards", params={"history": "compact", "limit": 5}
+    ).json()["cards"]
+    assert _decoded(cards) == full["agents"][1]["card_instances"][:5]
+    agent = client.get("/agents/2", params={"history": "compact"}).json()["agent"]
+    assert _decoded(agent["card_instances"]) == full["agents"][1]["card_instances"]
+
+    bad = client.post("/run", json=RUN, params={"history": "zip"})
+    assert bad.status_code == 422
+
+
+def test_responses_are_compressed_when_accepted():
+    r = client.post("/run", json=RUN, headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in r.headers["vary"]
+    plain = client.post("/run", json=RUN, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert r.json() == plain.json()
+    assert int(r.headers["content-length"]) < len(plain.content) / 5
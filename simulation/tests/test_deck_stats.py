@@ -0,0 +1,73 @@
+"""Tests for the cached per-deck combat statistics."""
+
+import random
+
+from simulation.booster import open_booster
+from simulation.cards import large_card_pool
+from simulation.engine import SimulationConfig, calculate_combat_score, simulate
+from simulation.world import DECK_SIZE, Agent, DeckStats
+
+
+def _cards(n: int, seed: int = 3):
+    rng = random.Random(seed)
+    pool = large_card_pool()
+    cards = []
+    while len(cards) < n:
+        cards.extend(open_booster(pool, rng))
+    return cards[:n]
+
+
+def _reference_score(deck) -> float:
+    """The original per-card formula of calculate_combat_score."""
+    if not deck:
+        return 0.0
+    total_gems = sum(c.ref.gem_colored + c.ref.gem_colorless for c in deck)
+    if total_gems == 0:
+        return sum(c.ref.power - c.ref.health for c in deck)
+    score = 0.0
+    for c in deck:
+        score += c.ref.power / total_gems - c.ref.health / total_gems
+    return score
+
+
+def test_stats_match_the_reference_formula():
+    deck = _cards(DECK_SIZE)
+    stats = DeckStats.from_cards(deck)
+
+    assert stats.size == DECK_SIZE
+    gems = sum(c.ref.gem_colored + c.ref.gem_colorless for c in deck)
+    assert stats.total_gems == gems
+    assert stats.power == sum(c.ref.power for c in deck)
+    assert stats.health == sum(c.ref.health for c in deck)
+    assert stats.score == _reference_score(deck)
+    assert calculate_combat_score(deck) == stats.score
+    assert calculate_combat_score([]) == 0.0
+
+
+def test_agent_caches_until_the_deck_changes():
+    cards = _cards(DECK_SIZE + 10)
+    agent = Agent(id=1)
+    agent.add_cards(cards[:30])
+    partial = agent.deck_stats()
+    assert partial.size == 30
+    assert agent.deck_stats() is partial
+
+    agent.add_cards(cards[30:DECK_SIZE])
+    full = agent.deck_stats()
+    assert full.size == DECK_SIZE
+    assert full.score == _reference_score(cards[:DECK_SIZE])
+
+    # cards beyond the deck do not touch the cached stats
+    agent.add_cards(cards[DECK_SIZE:])
+    assert agent.deck_stats() is full
+
+    agent.invalidate_deck()
+    assert agent.deck_stats() is not full
+    assert agent.deck_stats() == full
+
+
+def test_cached_scores_match_recomputation_after_a_run():
+    world, _ = simulate(SimulationConfig(seed=17, initial_agents=6, ticks=30))
+    for agent in world.agents.values():
+        deck = agent.collection[:DECK_SIZE]
+        assert agent.deck_stats().score == _reference_score(deck)
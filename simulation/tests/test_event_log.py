@@ -0,0 +1,71 @@
+"""Tests for the tick- and agent-indexed EventLog."""
+
+from simulation.engine import SimulationConfig, create_world, run_simulation
+from simulation.world import Event, EventLog, WorldState
+
+
+def _event(tick: int, agent_id: int, *others: int, kind: str = "play") -> Event:
+    return Event(
+        tick=tick,
+        agent_id=agent_id,
+        event_type=kind,
+        description=f"{agent_id} at {tick}",
+        agent_ids=[agent_id, *others],
+    )
+
+
+def test_event_log_behaves_like_a_list():
+    events = [_event(1, 1), _event(1, 2), _event(2, 1)]
+    log = EventLog(events)
+
+    assert len(log) == 3
+    assert list(log) == events
+    assert log[-1] is events[-1]
+    assert log[:2] == events[:2]
+    assert events[1] in log
+
+
+def test_lookups_by_tick_and_range():
+    log = EventLog()
+    for tick in (1, 1, 2, 4, 4, 4):
+        log.append(_event(tick, tick))
+
+    assert [e.tick for e in log.for_tick(4)] == [4, 4, 4]
+    assert log.for_tick(3) == []
+    assert [e.tick for e in log.for_ticks(2, 4)] == [2, 4, 4, 4]
+    assert [e.tick for e in log.for_ticks(0, 1)] == [1, 1]
+
+
+def test_out_of_order_ticks_stay_sorted_in_ranges():
+    log = EventLog([_event(5, 1), _event(2, 1), _event(3, 1)])
+    assert [e.tick for e in log.for_ticks(1, 5)] == [2, 3, 5]
+
+
+def test_agent_index_covers_bilateral_events():
+    combat = _event(3, 2, 7, kind="combat")
+    log = EventLog([_event(1, 7), combat, _event(4, 2)])
+
+    assert log.for_agent(7) == [log[0], combat]
+    assert log.for_agent(7, primary_only=True) == [log[0]]
+    assert log.for_agent(2, primary_only=True) == [combat, log[2]]
+    assert log.for_agent(99) == []
+
+
+def test_world_state_uses_event_log():
+    world = create_world(SimulationConfig(seed=1, initial_agents=2, ticks=0))
+    assert isinstance(world.events, EventLog)
+    world.add_event(_event(1, 1))
+    assert world.events.for_agent(1) == [world.events[0]]
+    assert isinstance(WorldState().events, EventLog)
+
+
+def test_engine_tick_and_agent_events_match_full_scan():
+    result = run_simulation(SimulationConfig(seed=5, initial_agents=4, ticks=15))
+    events = result["events"]
+
+    for entry in result["timeseries"][1:]:
+        assert entry["events"] == [e for e in events if e["tick"] == entry["tick"]]
+    for agent in result["agents"]:
+        assert agent["agent_events"] == [
+            e for e in events if e["agent_id"] == agent["id"]
+        ]
@@ -0,0 +1,72 @@
+"""Tests for the Parquet/Arrow run export (`simulation/export.py`)."""
+
+import json
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from simulation.engine import SimulationConfig, run_simulation  # noqa: E402
+from simulation.export import (  # noqa: E402
+    RunExporter,
+    export_payload,
+    export_run,
+    read_run,
+)
+
+CONFIG = SimulationConfig(seed=3, initial_agents=5, ticks=15)
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_export_matches_the_payload(tmp_path, fmt):
+    # a small batch size makes every table span several record batches
+    rows = export_run(CONFIG, tmp_path, fmt, batch_rows=50)
+    payload = run_simulation(CONFIG).to_dict()
+    frames = read_run(tmp_path)
+
+    assert frames["ticks"]["tick"].tolist() == list(range(16))
+    assert frames["market"]["tick"].tolist() == list(range(1, 16))
+    events = frames["events"]
+    assert rows["events"] == len(payload["events"])
+    assert events["event_type"].tolist() == [
+        e["event_type"] for e in payload["events"]
+    ]
+    assert str(events["event_type"].dtype) == "category"
+
+    cards = [c for a in payload["agents"] for c in a["card_instances"]]
+    instances = frames["card_instances"]
+    assert instances["card_instance_id"].tolist() == [
+        c["card_instance_id"] for c in cards
+    ]
+    assert instances["current_price"].tolist() == [c["current_price"] for c in cards]
+    assert str(instances["card_rarity"].dtype) == "category"
+
+    points = frames["price_points"]
+    expected = [p["price"] for c in cards for p in c["price_history"]]
+    assert points["price"].tolist() == expected
+    assert frames["agents"]["id"].tolist() == [a["id"] for a in payload["agents"]]
+    assert frames["agents"]["gambler_trait"].tolist() == [
+        a["traits"]["gambler_trait"] for a in payload["agents"]
+    ]
+
+    manifest = json.loads((tmp_path / "run.json").read_text())
+    assert manifest["config"] == payload["config"]
+    assert manifest["tables"]["price_points"]["rows"] == len(expected)
+
+
+def test_saved_payload_exports_the_same_tables(tmp_path):
+    export_run(CONFIG, tmp_path / "run")
+    export_payload(run_simulation(CONFIG).to_dict(), tmp_path / "payload")
+    simulated = read_run(tmp_path / "run")
+    saved = read_run(tmp_path / "payload")
+    for name, frame in simulated.items():
+        assert frame.equals(saved[name]), name
+
+
+def test_errors_inside_the_exporter_propagate(tmp_path):
+    # the bad buffered row would fail a final flush and hide the error
+    with pytest.raises(RuntimeError, match="interrupted"):
+        with RunExporter(tmp_path, "arrow") as exporter:
+            exporter.add_tick({"tick": 0, "events": [{"event_type": 1}]})
+            raise RuntimeError("interrupted")
+    assert not (tmp_path / "run.json").exists()
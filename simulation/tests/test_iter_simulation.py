@@ -0,0 +1,47 @@
+"""Tests for the streaming iter_simulation API."""
+
+import pytest
+
+from simulation import SimulationConfig, iter_simulation, run_simulation
+
+
+def test_stream_yields_same_ticks_as_run_simulation():
+    config = SimulationConfig(seed=8, initial_agents=4, ticks=12)
+    expected = run_simulation(config)
+
+    stream = iter_simulation(config)
+    ticks = list(stream)
+
+    assert ticks == expected["timeseries"]
+    assert stream.finished
+    assert stream.final() == expected["final"]
+    assert stream.agents() == expected["agents"]
+
+
+def test_stream_yields_each_tick_before_the_next_runs():
+    stream = iter_simulation(SimulationConfig(seed=2, initial_agents=2, ticks=3))
+
+    first = next(stream)
+    assert first["tick"] == 0
+    assert stream.world.tick == 0
+
+    second = next(stream)
+    assert second["tick"] == 1
+    assert "market_snapshot" in second
+    assert stream.world.tick == 1
+    assert not stream.finished
+
+
+@pytest.mark.parametrize("engine", ["object", "columnar"])
+def test_stream_engines_agree(engine):
+    config = SimulationConfig(seed=14, initial_agents=5, ticks=6)
+    stream = iter_simulation(config, engine=engine)
+    assert list(stream) == run_simulation(config)["timeseries"]
+    assert stream.agents() == run_simulation(config)["agents"]
+
+
+def test_exhausted_stream_stops():
+    stream = iter_simulation(SimulationConfig(seed=1, initial_agents=1, ticks=0))
+    assert [entry["tick"] for entry in stream] == [0]
+    with pytest.raises(StopIteration):
+        next(stream)
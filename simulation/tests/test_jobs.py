@@ -0,0 +1,102 @@
+"""Tests for background simulation jobs and the /jobs endpoints."""
+
+import time
+
+from fastapi.testclient import TestClient
+
+from backend.jobs import CANCELLED, COMPLETED, QUEUED, RUNNING, JobManager
+from backend.main import app
+from simulation import SimulationConfig, run_simulation
+
+client = TestClient(app)
+
+
+def _wait(manager: JobManager, job_id: str, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = manager.get(job_id)
+        if job.status not in (QUEUED, RUNNING):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_job_result_matches_run_simulation():
+    config = SimulationConfig(seed=12, initial_agents=3, ticks=5)
+    completed = []
+    manager = JobManager(max_workers=1, on_complete=completed.append)
+    try:
+        job = _wait(manager, manager.submit(config).id)
+    finally:
+        manager.shutdown()
+
+    assert job.status == COMPLETED
+    assert job.to_dict()["tick"] == 5
+    assert job.to_dict()["progress"] == 1.0
+    assert job.result == run_simulation(config)
+    assert completed == [job.result]
+
+
+def test_cancel_stops_at_tick_boundary():
+    manager = JobManager(max_workers=1)
+    try:
+        long_config = SimulationConfig(seed=1, initial_agents=20, ticks=10000)
+        running = manager.submit(long_config)
+        queued = manager.submit(SimulationConfig(seed=2, initial_agents=2, ticks=5))
+        while manager.get(running.id).tick < 1:
+            time.sleep(0.01)
+
+        manager.cancel(queued.id)
+        manager.cancel(running.id)
+        running = _wait(manager, running.id)
+    finally:
+        manager.shutdown()
+
+    assert running.status == CANCELLED
+    assert 1 <= running.tick < 10000
+    assert running.result is None
+    assert manager.get(queued.id).status == CANCELLED
+    assert manager.get(queued.id).tick == -1
+
+
+def test_unknown_job_returns_none():
+    manager = JobManager(max_workers=1)
+    assert manager.get("missing") is None
+    assert manager.cancel("missing") is None
+    manager.shutdown()
+
+
+def test_jobs_endpoints():
+    r = client.post("/jobs", json={"seed": 4, "agents": 2, "ticks": 3})
+    assert r.status_code == 200
+    job_id = r.json()["job"]["id"]
+    assert r.json()["job"]["total"] == 3
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        status = client.get(f"/jobs/{job_id}").json()["job"]
+        if status["status"] == COMPLETED:
+            break
+        time.sleep(0.01)
+    assert status["tick"] == 3
+
+    result = client.get(f"/jobs/{job_id}/result").json()
+    assert result["final"]["tick"] == 3
+    assert len(client.get("/agents").json()["agents"]) == 2
+    assert job_id in {j["id"] for j in client.get("/jobs").json()["jobs"]}
+
+    # cancelling a finished job leaves it completed
+    assert client.delete(f"/jobs/{job_id}").json()["job"]["status"] == COMPLETED
+    assert client.get("/jobs/nope").json() == {"error": "Job not found"}
+
+
+def test_cancel_endpoint():
+    payload = {"seed": 6, "agents": 20, "ticks": 10000}
+    job_id = client.post("/jobs", json=payload).json()["job"]["id"]
+    client.delete(f"/jobs/{job_id}")
+
+    deadline = time.monotonic() + 60
+    while client.get(f"/jobs/{job_id}").json()["job"]["status"] != CANCELLED:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert "error" in client.get(f"/jobs/{job_id}/result").json()
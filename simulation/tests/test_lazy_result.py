@@ -0,0 +1,59 @@
+"""Tests for the lazily materialized run result."""
+
+import json
+from collections.abc import Mapping
+
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from simulation import SimulationConfig, SimulationResult, run_simulation
+from simulation import engine
+
+client = TestClient(app)
+
+
+def test_result_is_a_mapping_with_the_payload_keys():
+    result = run_simulation(SimulationConfig(seed=4, initial_agents=3, ticks=3))
+    assert isinstance(result, SimulationResult)
+    assert isinstance(result, Mapping)
+    assert list(result) == ["config", "timeseries", "final", "agents", "events"]
+    assert result["final"]["tick"] == 3
+    assert result.get("missing") is None
+
+    payload = result.to_dict()
+    assert type(payload) is dict
+    assert json.loads(json.dumps(payload)) == payload
+    assert result == payload
+
+
+def test_agent_views_are_built_on_demand(monkeypatch):
+    calls = []
+    original = engine.summarize_agent
+
+    def counting(world, agent):
+        calls.append(agent.id)
+        return original(world, agent)
+
+    monkeypatch.setattr(engine, "summarize_agent", counting)
+    result = run_simulation(SimulationConfig(seed=6, initial_agents=4, ticks=2))
+    assert len(result["timeseries"]) == 3
+    assert calls == []
+
+    assert result.agent(2)["id"] == 2
+    assert result.agent(99) is None
+    assert calls == [2]
+
+    agents = result["agents"]
+    assert [a["id"] for a in agents] == [1, 2, 3, 4]
+    assert result["agents"] is agents
+    assert sorted(calls) == [1, 2, 3, 4]
+
+
+def test_run_endpoint_can_skip_heavy_fields():
+    payload = {"seed": 3, "agents": 2, "ticks": 2}
+    r = client.post("/run", params={"fields": "timeseries,final"}, json=payload)
+    assert set(r.json()) == {"timeseries", "final"}
+    assert r.json()["final"]["tick"] == 2
+
+    full = client.post("/run", json=payload).json()
+    assert set(full) == {"config", "timeseries", "final", "agents", "events"}
@@ -0,0 +1,107 @@
+"""Tests for incremental market snapshot aggregates."""
+
+import math
+import random
+
+from simulation.booster import BoosterSampler
+from simulation.cards import large_card_pool
+from simulation.engine import SimulationConfig, create_world, finish_tick, step_world
+from simulation.types import AgentCardInstance, CardRef, Rarity
+from simulation.world import Agent, MarketAggregates, WorldState
+
+
+def _full_scan(world: WorldState) -> tuple:
+    """Reference statistics computed over every card instance."""
+    prices = [
+        ci.current_price
+        for agent in world.agents.values()
+        for ci in agent.card_instances.values()
+    ]
+    unique = {
+        ci.card_id
+        for agent in world.agents.values()
+        for ci in agent.card_instances.values()
+    }
+    mean = sum(prices) / max(1, len(prices))
+    if len(prices) > 1:
+        volatility = (sum((p - mean) ** 2 for p in prices) / len(prices)) ** 0.5
+    else:
+        volatility = 0.0
+    return len(prices), mean, volatility, len(unique)
+
+
+def _assert_matches_scan(world: WorldState) -> None:
+    count, mean, volatility, unique = _full_scan(world)
+    assert world.market.count == count
+    assert world.market.unique_cards == unique
+    assert math.isclose(world.market.price_index, mean, rel_tol=1e-9, abs_tol=1e-9)
+    assert math.isclose(world.market.volatility, volatility, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def _card(instance_id: int, card_id: str, price: float) -> AgentCardInstance:
+    return AgentCardInstance(
+        card_instance_id=instance_id,
+        ref=CardRef(card_id, card_id, "Ruby", Rarity.COMMON),
+        agent_id=1,
+        acquisition_tick=0,
+        acquisition_price=price,
+        current_price=price,
+    )
+
+
+def test_aggregates_track_add_remove_and_reprice():
+    world = WorldState()
+    rng = random.Random(4)
+    for agent_id in (1, 2, 3):
+        world.add_agent(Agent(id=agent_id))
+
+    for n in range(200):
+        agent = world.agents[rng.choice([1, 2, 3])]
+        agent.add_card_instance(
+            _card(n, f"C{rng.randrange(15)}", round(rng.uniform(0.1, 80.0), 2))
+        )
+    _assert_matches_scan(world)
+
+    for agent in world.agents.values():
+        for instance_id in list(agent.card_instances)[::3]:
+            agent.remove_card_instance(instance_id)
+        for instance_id in list(agent.card_instances)[::4]:
+            agent.reprice_card_instance(instance_id, rng.uniform(0.1, 200.0))
+    _assert_matches_scan(world)
+
+
+def test_removing_everything_resets_statistics():
+    market = MarketAggregates()
+    market.add("C1", 3.0)
+    market.add("C1", 5.0)
+    market.remove("C1", 3.0)
+    market.remove("C1", 5.0)
+
+    assert market.count == 0
+    assert market.unique_cards == 0
+    assert market.price_index == 0.0
+    assert market.volatility == 0.0
+
+
+def test_add_agent_counts_existing_instances():
+    agent = Agent(id=5)
+    agent.add_card_instance(_card(1, "C1", 2.0))
+    world = WorldState()
+    world.add_agent(agent)
+
+    assert agent.market is world.market
+    _assert_matches_scan(world)
+
+
+def test_snapshots_match_full_scan_during_a_run():
+    world = create_world(SimulationConfig(seed=21, initial_agents=6, ticks=0))
+    sampler = BoosterSampler(large_card_pool())
+    for t in range(1, 8):
+        step_world(world, sampler, t)
+        finish_tick(world, t, world.summary())
+        count, mean, volatility, unique = _full_scan(world)
+        snapshot = world.market_snapshots[-1]
+        assert snapshot.total_card_instances == count
+        assert snapshot.unique_cards_in_circulation == unique
+        assert math.isclose(snapshot.price_index, mean, rel_tol=1e-9)
+        assert math.isclose(snapshot.volatility, volatility, rel_tol=1e-9)
@@ -0,0 +1,82 @@
+"""Tests for the eligible-opponent index used by matchmaking."""
+
+import random
+
+from simulation.booster import open_booster
+from simulation.cards import large_card_pool
+from simulation.engine import SimulationConfig, simulate
+from simulation.world import DECK_SIZE, Agent, PlayerIndex, WorldState
+
+
+def _cards(n: int):
+    rng = random.Random(5)
+    pool = large_card_pool()
+    cards = []
+    while len(cards) < n:
+        cards.extend(open_booster(pool, rng))
+    return cards[:n]
+
+
+def _ids(index: PlayerIndex):
+    return [a.id for a in index.agents]
+
+
+def test_agents_join_in_world_order_when_crossing_the_threshold():
+    world = WorldState()
+    for agent_id in range(1, 6):
+        world.add_agent(Agent(id=agent_id))
+    cards = _cards(DECK_SIZE)
+
+    world.agents[4].add_cards(cards)
+    world.agents[2].add_cards(cards[:20])
+    assert _ids(world.players) == [4]
+
+    world.agents[2].add_cards(cards[20:])
+    world.agents[5].add_cards(cards)
+    world.agents[1].add_cards(cards)
+    assert _ids(world.players) == [1, 2, 4, 5]
+    assert world.players.position == {1: 0, 2: 1, 4: 2, 5: 3}
+
+    # replacing an agent keeps its place in world order
+    world.add_agent(Agent(id=2))
+    assert _ids(world.players) == [1, 4, 5]
+    world.agents[2].add_cards(cards)
+    assert _ids(world.players) == [1, 2, 4, 5]
+
+
+def test_add_agent_indexes_existing_deck_holders():
+    agent = Agent(id=7)
+    agent.add_cards(_cards(DECK_SIZE))
+    world = WorldState()
+    world.add_agent(agent)
+    assert 7 in world.players
+    assert world.players.choose_opponent(agent, random.Random(1)) is None
+
+
+def test_choose_opponent_consumes_the_same_draw_as_choice():
+    world = WorldState()
+    cards = _cards(DECK_SIZE)
+    for agent_id in range(10):
+        agent = Agent(id=agent_id)
+        if agent_id % 3:
+            agent.add_cards(cards)
+        world.add_agent(agent)
+
+    for agent in world.players.agents:
+        others = [
+            a for a in world.agents.values()
+            if a.id != agent.id and len(a.collection) >= DECK_SIZE
+        ]
+        for seed in range(50):
+            expected_rng = random.Random(seed)
+            rng = random.Random(seed)
+            assert world.players.choose_opponent(agent, rng) is expected_rng.choice(
+                others
+            )
+            assert rng.random() == expected_rng.random()
+
+
+def test_index_matches_collections_after_a_run():
+    world, _ = simulate(SimulationConfig(seed=11, initial_agents=12, ticks=25))
+    expected = [a.id for a in world.agents.values() if len(a.collection) >= DECK_SIZE]
+    assert _ids(world.players) == expected
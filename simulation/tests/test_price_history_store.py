@@ -0,0 +1,164 @@
+"""Tests for the columnar price history store."""
+
+import pickle
+
+import numpy as np
+
+from simulation.engine import SimulationConfig, create_world, finish_tick
+from simulation.types import (
+    AgentCardInstance,
+    CardRef,
+    PriceDataPoint,
+    PriceHistoryStore,
+    Rarity,
+)
+
+
+def _instance(instance_id: int = 1) -> AgentCardInstance:
+    return AgentCardInstance(
+        card_instance_id=instance_id,
+        ref=CardRef("C001", "Card", "Ruby", Rarity.COMMON),
+        agent_id=1,
+        acquisition_tick=1,
+        acquisition_price=2.345,
+        current_price=2.345,
+        quality_score=8.0,
+    )
+
+
+def test_store_append_and_slice():
+    store = PriceHistoryStore()
+    a = store.register()
+    b = store.register()
+    for tick in range(1, 6):
+        store.append(a, tick, 1.0 * tick, 9.0, 5.0)
+    store.append(b, 3, 7.5, 8.0, 4.0)
+
+    assert len(store) == 2
+    assert store.length(a) == 5
+    ticks, prices, _, _ = store.columns(a, start_tick=2, stop_tick=4)
+    assert list(ticks) == [2, 3, 4]
+    assert list(prices) == [2.0, 3.0, 4.0]
+    assert store.point(b, 0) == PriceDataPoint(3, 7.5, 8.0, 4.0)
+
+
+def test_blocks_merge_with_single_points():
+    store = PriceHistoryStore()
+    a, b, c = store.register(), store.register(), store.register()
+    store.append(b, 1, 4.0, 9.0, 5.0)
+    store.append_block(2, [a, b, c], [1.0, 4.5, 7.0], [9.0, 9.0, 8.0], [5, 5, 6])
+    assert store.length(b) == 2
+    store.append_block(3, [c, a], [7.25, 1.5], [8.0, 9.0], [6.0, 5.0])
+
+    ticks, prices, _, desirability = store.columns(a)
+    assert ticks.tolist() == [2, 3]
+    assert prices.tolist() == [1.0, 1.5]
+    assert store.columns(b)[1].tolist() == [4.0, 4.5]
+    assert store.columns(c, start_tick=3)[0].tolist() == [3]
+    assert desirability.tolist() == [5.0, 5.0]
+
+    restored = pickle.loads(pickle.dumps(store))
+    restored.append_block(4, [a], [2.0], [9.0], [5.0])
+    assert restored.to_dicts(a, start_tick=3) == [
+        {"tick": 3, "price": 1.5, "quality_score": 9.0, "desirability": 5.0},
+        {"tick": 4, "price": 2.0, "quality_score": 9.0, "desirability": 5.0},
+    ]
+    assert store.length(a) == 2
+
+
+def test_reads_between_appends_only_sort_the_new_points(monkeypatch):
+    store = PriceHistoryStore()
+    expected = {}
+    sorted_sizes = []
+    argsort = np.argsort
+
+    def counting(values, *args, **kwargs):
+        sorted_sizes.append(len(values))
+        return argsort(values, *args, **kwargs)
+
+    monkeypatch.setattr(np, "argsort", counting)
+    for tick in range(1, 30):
+        if tick % 3 == 1:  # instances keep arriving, as cards are opened
+            expected[store.register()] = []
+        indices = list(expected)[::-1] if tick % 2 else list(expected)
+        prices = [index + tick / 100 for index in indices]
+        store.append_block(tick, indices, prices, [9.0] * len(indices), prices)
+        for index in indices:
+            expected[index].append((tick, index + tick / 100))
+        store.append(0, tick, 0.5, 9.0, 0.5)
+        expected[0].append((tick, 0.5))
+        for index, points in expected.items():
+            ticks, prices = store.columns(index)[:2]
+            assert list(zip(ticks.tolist(), prices.tolist(), strict=True)) == points
+    # each merge sorted one tick's points, not the whole history
+    assert max(sorted_sizes) == len(expected) + 1
+
+
+def test_points_from_reads_the_tails_of_many_instances():
+    store = PriceHistoryStore()
+    a, b, c, empty = (store.register() for _ in range(4))
+    for tick in range(1, 9):
+        store.append_block(tick, [a, c], [tick, 10.0 + tick], [9.0] * 2, [5.0] * 2)
+    store.append(b, 2, 7.5, 8.0, 4.0)
+
+    owners, ticks, prices, _, _ = store.points_from([c, empty, b, a], 6)
+    assert owners.tolist() == [0, 0, 0, 3, 3, 3]
+    assert ticks.tolist() == [6, 7, 8, 6, 7, 8]
+    assert prices.tolist() == [16.0, 17.0, 18.0, 6.0, 7.0, 8.0]
+    for start in range(0, 10):
+        _, ticks, *_ = store.points_from([a, b], start)
+        expected = [t for t in range(1, 9) if t >= start] + [2] * (start <= 2)
+        assert ticks.tolist() == expected
+    assert len(store.points_from([], 1)[0]) == 0
+
+
+def test_instance_history_serializes_like_data_points():
+    card = _instance()
+    card.record_price_point(1)
+    card.record_price_point(2)
+
+    expected = [
+        PriceDataPoint(t, 2.345, 8.0, card.desirability).to_dict() for t in (1, 2)
+    ]
+    assert card.to_dict()["price_history"] == expected
+    assert len(card.price_history) == 2
+    assert card.price_history[-1].tick == 2
+    assert [p.tick for p in card.price_history[:1]] == [1]
+
+
+def test_attach_history_moves_existing_points():
+    card = _instance()
+    card.record_price_point(1)
+    store = PriceHistoryStore()
+    store.register()  # occupy index 0
+
+    card.attach_history(store)
+
+    assert card.history is store
+    assert card.history_index == 1
+    assert [p.tick for p in card.price_history] == [1]
+
+
+def test_world_records_into_shared_store():
+    world = create_world(SimulationConfig(seed=1, initial_agents=1, ticks=0))
+    agent = world.agents[1]
+    agent.add_card_instance(_instance(101))
+    agent.add_card_instance(_instance(102))
+
+    for t in (1, 2, 3):
+        world.tick = t
+        finish_tick(world, t, world.summary())
+
+    assert len(world.price_history) == 2
+    history = world.agent_price_history(1, start_tick=2)
+    assert set(history) == {"INST_C001_1_1_101", "INST_C001_1_1_102"}
+    assert history["INST_C001_1_1_101"]["tick"] == [2, 3]
+    assert world.agent_price_history(99) == {}
+
+    # bulk recording updates instances like record_price_point
+    card = world.agents[1].card_instances[101]
+    single = _instance(103)
+    single.record_price_point(3)
+    assert card.desirability == single.desirability
+    assert card.condition is single.condition
+    assert card.to_dict()["price_history"][-1] == single.to_dict()["price_history"][0]
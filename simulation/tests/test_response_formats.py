@@ -0,0 +1,109 @@
+"""Tests for content negotiation of run payloads (`backend/formats.py`)."""
+
+import importlib.util
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import main as bm
+from backend.formats import (
+    ARROW,
+    JSON,
+    MSGPACK,
+    UnsupportedFormat,
+    negotiate,
+    table_columns,
+)
+from simulation import SimulationConfig, run_simulation
+
+client = TestClient(bm.app)
+
+RUN = {"seed": 13, "agents": 4, "ticks": 8}
+HAS_MSGPACK = importlib.util.find_spec("msgpack") is not None
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def test_json_is_the_default_and_matches_the_payload():
+    expected = run_simulation(SimulationConfig(13, 4, 8)).to_dict()
+    r = client.post("/run", json=RUN, headers={"Accept": "text/html,*/*;q=0.8"})
+    assert r.headers["content-type"] == JSON
+    assert "Accept" in r.headers["vary"]
+    assert r.json() == expected
+
+    run_id = r.headers["x-run-id"]
+    stored = client.get(f"/runs/{run_id}/result")
+    assert json.dumps(stored.json()) == json.dumps(expected)
+    part = client.post("/run", json=RUN, params={"fields": "final"}).json()
+    assert part == {"final": expected["final"]}
+
+
+def test_negotiation_honours_quality_and_availability():
+    assert negotiate(None) == JSON
+    assert negotiate("text/plain") == JSON
+    assert negotiate(f"{JSON};q=0.5, {ARROW};q=0.1") == JSON
+    wanted = f"{JSON};q=0.5, application/x-msgpack"
+    assert negotiate(wanted) == (MSGPACK if HAS_MSGPACK else JSON)
+    if not HAS_MSGPACK:
+        with pytest.raises(UnsupportedFormat):
+            negotiate(MSGPACK)
+
+
+def test_tables_are_columns_of_the_payload():
+    payload = run_simulation(SimulationConfig(13, 4, 8)).to_dict()
+    timeseries = table_columns(payload)
+    assert timeseries["tick"] == list(range(9))
+    assert "events" not in timeseries
+
+    market = table_columns(payload, "market")
+    assert market["tick"] == list(range(1, 9))
+    events = table_columns(payload, "events")
+    assert events["event_type"] == [e["event_type"] for e in payload["events"]]
+
+    points = table_columns(payload, "price_points")
+    cards = [c for a in payload["agents"] for c in a["card_instances"]]
+    assert len(points["price"]) == sum(len(c["price_history"]) for c in cards)
+    assert set(points) >= {"agent_id", "card_instance_id", "tick", "price"}
+
+    with pytest.raises(UnsupportedFormat):
+        table_columns(payload, "nope")
+    with pytest.raises(UnsupportedFormat):
+        table_columns({"timeseries": []}, "price_points")
+
+
+@pytest.mark.skipif(HAS_MSGPACK, reason="msgpack is installed")
+def test_missing_binary_format_is_not_acceptable():
+    r = client.post("/run", json=RUN, headers={"Accept": MSGPACK})
+    assert r.status_code == 406
+    assert "msgpack" in r.json()["error"]
+
+
+@pytest.mark.skipif(not HAS_MSGPACK, reason="msgpack is not installed")
+def test_msgpack_round_trip():
+    import msgpack
+
+    r = client.post("/run", json=RUN, headers={"Accept": MSGPACK})
+    assert r.headers["content-type"] == MSGPACK
+    expected = client.post("/run", json=RUN).json()
+    assert msgpack.unpackb(r.content, strict_map_key=False) == expected
+
+
+@pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow is not installed")
+def test_arrow_tables():
+    import pyarrow as pa
+
+    run_id = client.post("/run", json=RUN).headers["x-run-id"]
+    r = client.get(
+        f"/runs/{run_id}/result",
+        params={"table": "price_points"},
+        headers={"Accept": ARROW},
+    )
+    assert r.headers["content-type"] == ARROW
+    table = pa.ipc.open_stream(r.content).read_all()
+    payload = client.get(f"/runs/{run_id}/result").json()
+    assert table.to_pydict() == table_columns(payload, "price_points")
+
+    r = client.get(f"/runs/{run_id}/timeseries", headers={"Accept": ARROW})
+    assert pa.ipc.open_stream(r.content).read_all().column("tick").to_pylist() == [
+        *range(9)
+    ]
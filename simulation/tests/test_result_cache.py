@@ -0,0 +1,102 @@
+"""Tests for the deterministic result cache (`simulation/cache.py`)."""
+
+import json
+import threading
+
+from fastapi.testclient import TestClient
+
+from backend import main as bm
+from simulation import cache as cache_module
+from simulation.cache import ResultCache
+from simulation.engine import SimulationConfig, run_simulation
+
+CONFIG = SimulationConfig(seed=4, initial_agents=6, ticks=12)
+
+
+def _dump(result) -> str:
+    return json.dumps(result.to_dict())
+
+
+def test_hits_and_prefixes_match_fresh_runs():
+    cache = ResultCache()
+    first = cache.run(CONFIG)
+    assert _dump(first) == _dump(run_simulation(CONFIG))
+
+    again = cache.run(CONFIG)
+    assert _dump(again) == _dump(first)
+    # every hit decodes its own world, so results can be advanced freely
+    again.world.agents[1].prism = -1.0
+    assert cache.run(CONFIG).world.agents[1].prism == first.world.agents[1].prism
+
+    longer = SimulationConfig(seed=4, initial_agents=6, ticks=20)
+    assert _dump(cache.run(longer, engine="columnar")) == _dump(run_simulation(longer))
+    cache.wait()
+    stats = cache.stats()
+    assert (stats["hits"], stats["prefix_hits"], stats["misses"]) == (2, 1, 1)
+    assert stats["entries"] == 2
+
+    # the longest cached prefix is used; other seeds and agent counts miss
+    stream, timeseries = cache.resume(SimulationConfig(4, 6, 30))
+    assert len(timeseries) == 21
+    assert [e["tick"] for e in stream][0] == 21
+    assert cache.resume(SimulationConfig(4, 7, 30))[1] == []
+    assert cache.resume(SimulationConfig(5, 6, 30))[1] == []
+
+
+def test_eviction_by_count_and_size(monkeypatch):
+    cache = ResultCache(max_entries=2)
+    for ticks in (1, 2, 3):
+        cache.run(SimulationConfig(seed=1, initial_agents=3, ticks=ticks))
+    cache.wait()
+    assert [key.ticks for key in cache._entries] == [2, 3]
+
+    size = cache.stats()["bytes"]
+    small = ResultCache(max_bytes=size // 2 + 1)
+    small.run(SimulationConfig(seed=1, initial_agents=3, ticks=2))
+    small.run(SimulationConfig(seed=1, initial_agents=3, ticks=3))
+    small.wait()
+    assert small.stats()["entries"] == 1
+    assert small.stats()["bytes"] <= small.max_bytes
+
+    # a changed catalogue never reuses runs of the old one
+    monkeypatch.setattr(cache_module, "catalogue_digest", lambda: "changed")
+    assert cache.resume(SimulationConfig(seed=1, initial_agents=3, ticks=3))[1] == []
+
+
+def test_runs_are_encoded_off_the_calling_thread(monkeypatch):
+    cache = ResultCache()
+    release = threading.Event()
+    encode = cache_module.encode_checkpoint
+
+    def blocked(checkpoint):
+        release.wait()
+        return encode(checkpoint)
+
+    monkeypatch.setattr(cache_module, "encode_checkpoint", blocked)
+    first = cache.run(CONFIG)  # returns while its entry is still queued
+    assert cache.stats()["entries"] == 0
+
+    # a lookup of the same world waits for the queued run instead of missing
+    threading.Timer(0.05, release.set).start()
+    again = cache.run(CONFIG)
+    assert _dump(again) == _dump(first)
+    assert cache.stats()["hits"] == 1
+
+
+def test_backend_reuses_cached_runs():
+    client = TestClient(bm.app)
+    cfg = {"seed": 77, "agents": 4, "ticks": 6}
+    before = bm.CACHE.stats()
+    first = client.post("/run", json=cfg).json()
+    assert client.post("/run", json=cfg).json() == first
+
+    # a longer stream replays the cached ticks, then runs the rest
+    longer = {**cfg, "ticks": 9}
+    lines = client.post("/run/stream", json=longer).text.splitlines()
+    ticks = [json.loads(line)["data"] for line in lines[:-1]]
+    expected = run_simulation(SimulationConfig(77, 4, 9))
+    assert ticks == expected["timeseries"]
+
+    after = client.get("/cache").json()["cache"]
+    assert after["hits"] == before["hits"] + 1
+    assert after["prefix_hits"] == before["prefix_hits"] + 1
@@ -0,0 +1,160 @@
+"""Tests for the persistent SQLite run store."""
+
+import json
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from backend import main as bm
+from backend.jobs import COMPLETED
+from backend.store import RunStore
+from simulation import SimulationConfig, run_simulation
+
+client = TestClient(bm.app)
+
+
+def test_round_trip_is_exact(tmp_path):
+    store = RunStore(tmp_path / "runs.db")
+    result = run_simulation(SimulationConfig(seed=9, initial_agents=6, ticks=12))
+    run_id = store.save(result)
+
+    payload = result.to_dict()
+    assert json.dumps(store.result(run_id)) == json.dumps(payload)
+    assert store.agent(run_id, 3) == result.agent(3)
+    assert store.timeseries(run_id, 4, 6) == payload["timeseries"][4:7]
+
+    # a second store on the same file sees the run, as after a restart
+    reopened = RunStore(tmp_path / "runs.db")
+    assert reopened.get_run(run_id)["final"] == payload["final"]
+    assert reopened.delete(run_id)
+    assert reopened.get_run(run_id) is None
+    assert not reopened.delete(run_id)
+
+
+def test_saves_are_queued_off_the_caller(tmp_path, monkeypatch):
+    store = RunStore(tmp_path / "runs.db")
+    result = run_simulation(SimulationConfig(seed=4, initial_agents=4, ticks=6))
+    release = threading.Event()
+    save = store.save
+
+    def gated_save(*args):
+        release.wait(10)
+        return save(*args)
+
+    monkeypatch.setattr(store, "save", gated_save)
+    run_id = store.save_async(result)
+    assert not release.is_set()  # returned while the write is held back
+    threading.Timer(0.1, release.set).start()
+
+    # reads wait for the queued save instead of missing the run
+    assert store.get_run(run_id)["final"] == result["final"]
+    assert store.agent(run_id, 2) == result.agent(2)
+    # the store serialized the agents without caching them on the result
+    assert result._agent_list is None
+
+
+def test_queries_filter_sort_and_count(tmp_path):
+    store = RunStore(tmp_path / "runs.db")
+    result = run_simulation(SimulationConfig(seed=2, initial_agents=5, ticks=10))
+    run_id = store.save(result)
+    agent = result.agent(2)
+
+    rarity = agent["card_instances"][0]["card_rarity"]
+    cards, total = store.cards(
+        run_id, 2, rarity=rarity.upper(), sort="current_price", order="desc", limit=4
+    )
+    matching = [c for c in agent["card_instances"] if c["card_rarity"] == rarity]
+    assert total == len(matching)
+    prices = sorted((c["current_price"] for c in matching), reverse=True)
+    assert [c["current_price"] for c in cards] == prices[:4]
+    assert all(c["price_history"] for c in cards)
+
+    events, total = store.events(run_id, agent_id=2, tick_min=3, tick_max=5)
+    expected = [e for e in agent["agent_events"] if 3 <= e["tick"] <= 5]
+    assert (events, total) == (expected, len(expected))
+
+    combats, total = store.events(run_id, event_types=["combat"], offset=1, limit=2)
+    all_combats = [e for e in result["events"] if e["event_type"] == "combat"]
+    assert combats == all_combats[1:3]
+    assert total == len(all_combats)
+
+    rows, total = store.agents(run_id, sort="name", order="desc")
+    assert total == 5
+    assert [r["id"] for r in rows] == [5, 4, 3, 2, 1]
+
+    prisms = sorted(a["prism"] for a in result["agents"])
+    rows, total = store.agents(run_id, prism_min=prisms[1], prism_max=prisms[3])
+    assert total == len(rows)
+    assert all(prisms[1] <= r["prism"] <= prisms[3] for r in rows)
+    assert total >= 3
+
+
+def test_runs_are_served_by_id():
+    cfg = {"seed": 31, "agents": 4, "ticks": 5}
+    first = client.post("/run", json=cfg)
+    second = client.post("/run", json={**cfg, "seed": 32})
+    first_id = first.headers["x-run-id"]
+    second_id = second.headers["x-run-id"]
+    assert first_id != second_id
+
+    # the earlier run is still available after a later one
+    assert client.get(f"/runs/{first_id}/result").json() == first.json()
+    listed = client.get("/runs", params={"limit": 2}).json()
+    assert [r["run_id"] for r in listed["runs"]] == [second_id, first_id]
+
+    agents = client.get(f"/runs/{first_id}/agents", params={"limit": 2}).json()
+    assert agents["total"] == 4
+    assert agents["agents"] == bm.STORE.agents(first_id, limit=2)[0]
+    agent = client.get(f"/runs/{first_id}/agents/1").json()["agent"]
+    assert agent == first.json()["agents"][0]
+
+    cards = client.get(f"/runs/{first_id}/agents/1/cards", params={"limit": 3}).json()
+    assert cards["cards"] == agent["card_instances"][:3]
+    assert cards["total"] == len(agent["card_instances"])
+
+    events = client.get(f"/runs/{first_id}/events", params={"agent_id": 1}).json()
+    assert events["events"] == agent["agent_events"]
+
+    assert client.delete(f"/runs/{first_id}").json() == {"deleted": first_id}
+    assert "error" in client.get(f"/runs/{first_id}").json()
+    assert "error" in client.get(f"/runs/{first_id}/agents/1").json()
+    bad_sort = client.get(f"/runs/{second_id}/agents", params={"sort": "x"})
+    assert "error" in bad_sort.json()
+
+
+def test_repeated_runs_are_stored_once():
+    cfg = {"seed": 33, "agents": 3, "ticks": 2}
+    before = client.get("/runs").json()["total"]
+    ids = {client.post("/run", json=cfg).headers["x-run-id"] for _ in range(3)}
+    assert len(ids) == 1
+    assert client.get("/runs").json()["total"] == before + 1
+
+    # an advanced run no longer matches its config and is not reused
+    (run_id,) = ids
+    client.post(f"/runs/{run_id}/advance", params={"ticks": 1})
+    assert client.post("/run", json=cfg).headers["x-run-id"] != run_id
+
+
+def test_oldest_runs_are_dropped(tmp_path):
+    store = RunStore(tmp_path / "runs.db", max_runs=2)
+    result = run_simulation(SimulationConfig(seed=2, initial_agents=3, ticks=1))
+    run_ids = [store.save(result) for _ in range(3)]
+    runs, total = store.list_runs()
+    assert total == 2
+    assert {run["run_id"] for run in runs} == set(run_ids[1:])
+    assert not store.exists(run_ids[0])
+    assert store.timeseries(run_ids[0]) == []
+
+
+def test_completed_jobs_are_stored():
+    job = client.post("/jobs", json={"seed": 5, "agents": 3, "ticks": 4}).json()["job"]
+    deadline = time.time() + 60
+    while True:
+        status = client.get(f"/jobs/{job['id']}").json()["job"]
+        if status["status"] == COMPLETED or time.time() > deadline:
+            break
+        time.sleep(0.05)
+    assert status["status"] == COMPLETED
+    run = client.get(f"/runs/{status['run_id']}").json()["run"]
+    assert run["config"] == {"seed": 5, "initial_agents": 3, "ticks": 4}
@@ -0,0 +1,55 @@
+"""Tests for the process-pool parameter sweep runner."""
+
+import json
+
+from simulation.engine import SimulationConfig, simulate
+from simulation.sweep import _int_list, main, run_sweep, summarize_run, sweep_configs
+
+
+def test_sweep_configs_is_cartesian_product():
+    configs = sweep_configs([1, 2], [3], [4, 5])
+    assert [(c.seed, c.initial_agents, c.ticks) for c in configs] == [
+        (1, 3, 4),
+        (1, 3, 5),
+        (2, 3, 4),
+        (2, 3, 5),
+    ]
+
+
+def test_int_list_parses_ranges_and_lists():
+    assert _int_list("1-3,7") == [1, 2, 3, 7]
+    assert _int_list("10") == [10]
+
+
+def test_parallel_sweep_matches_serial_runs(tmp_path):
+    configs = sweep_configs([3, 4, 5], [2, 4], [6])
+    output = tmp_path / "sweep.jsonl"
+
+    results = list(run_sweep(configs, max_workers=2, output=output))
+
+    assert sorted(r["index"] for r in results) == list(range(len(configs)))
+    for result in results:
+        config = configs[result["index"]]
+        expected = summarize_run(config, *simulate(config))
+        assert {k: v for k, v in result.items() if k != "index"} == expected
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == len(configs)
+    assert {json.loads(line)["index"] for line in lines} == set(range(len(configs)))
+
+
+def test_summary_is_reduced():
+    config = SimulationConfig(seed=9, initial_agents=3, ticks=4)
+    summary = summarize_run(config, *simulate(config))
+
+    assert summary["config"] == config.__dict__
+    assert summary["final"]["tick"] == 4
+    assert summary["event_counts"]["booster_purchase"] > 0
+    assert "agents" not in summary
+
+
+def test_cli_streams_json_lines(capsys):
+    main(["--seeds", "1-2", "--agents", "2", "--ticks", "2", "--workers", "2"])
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2
+    assert {json.loads(line)["config"]["seed"] for line in lines} == {1, 2}
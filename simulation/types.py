@@ -5,9 +5,14 @@ simulation. Keep these lightweight and documented so the rest of the engine
 can remain modular.
 """
 
+import threading
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import List, Optional, Tuple, overload
+
+import numpy as np
 
 
 class Rarity(str, Enum):
@@ -54,11 +59,13 @@ class CardRef:
     flavor_text: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CardInstance:
     """A specific owned card instance with visual flags.
 
     This represents a physical/virtual card an agent can hold, sell, or trade.
+    Instances are slotted and share their `CardRef`, so each copy only stores
+    its own flags and quality.
     """
 
     ref: CardRef
@@ -154,6 +161,382 @@ class PriceDataPoint:
         }
 
 
+class PriceHistoryStore:
+    """Columnar price history for many card instances.
+
+    Points are written in column blocks of (instance index, tick, price,
+    quality, desirability): `append_block` adds one tick's points for any
+    number of instances as a single block, and `append` buffers single
+    points. Reads merge the blocks into one set of arrays ordered by
+    instance index and every instance's history is a slice of those arrays.
+    A merge only sorts the points appended since the previous one and
+    inserts them after each instance's existing points, so reading between
+    appends costs O(new points log new points) plus a copy rather than a
+    full re-sort. A point costs 32 bytes. Ticks of an
+    instance are expected to be appended in increasing order, which makes
+    tick-range slicing a binary search.
+
+    Reads may run on several threads (e.g. serving and persisting a run);
+    merging is serialized with a lock. Appending must not overlap reads.
+    """
+
+    def __init__(self) -> None:
+        self._size = 0
+        self._lock = threading.Lock()
+        self._pending = _empty_buffers()
+        self._blocks: List[Tuple[np.ndarray, ...]] = []
+        self._merged: Tuple[np.ndarray, ...] = _empty_block()
+        # Start of every merged instance's points in the merged arrays
+        self._offsets = np.zeros(1, dtype=np.int64)
+        # Set while appended points or new instances wait to be merged
+        self._dirty = False
+
+    def __getstate__(self) -> dict:
+        self._merge()
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def register(self) -> int:
+        """Allocate an empty history and return its instance index."""
+        self._size += 1
+        self._dirty = True
+        return self._size - 1
+
+    def append(
+        self,
+        index: int,
+        tick: int,
+        price: float,
+        quality_score: float,
+        desirability: float,
+    ) -> None:
+        """Append one data point to an instance's history."""
+        values = (index, tick, price, quality_score, desirability)
+        for buffer, value in zip(self._pending, values, strict=True):
+            buffer.append(value)
+        self._dirty = True
+
+    def append_block(
+        self,
+        tick: int,
+        indices: Sequence[int],
+        prices: Sequence[float],
+        qualities: Sequence[float],
+        desirability: Sequence[float],
+    ) -> None:
+        """Append one point at `tick` to each of many instances' histories.
+
+        Args:
+            tick: tick of every point
+            indices: instance indices from `register`, at most one point each
+            prices, qualities, desirability: the points' values, in the
+                order of `indices`
+        """
+        indices = np.asarray(indices, dtype=np.int32)
+        self._flush()
+        self._blocks.append(
+            (
+                indices.copy(),
+                np.full(len(indices), tick, dtype=np.int32),
+                np.array(prices, dtype=np.float64),
+                np.array(qualities, dtype=np.float64),
+                np.array(desirability, dtype=np.float64),
+            )
+        )
+        self._dirty = True
+
+    def _flush(self) -> None:
+        """Move the buffered single points into a block."""
+        if self._pending[0]:
+            self._blocks.append(
+                tuple(
+                    np.array(buffer, dtype=dtype)
+                    for buffer, dtype in zip(self._pending, _DTYPES, strict=True)
+                )
+            )
+            self._pending = _empty_buffers()
+
+    def _merge(self) -> Tuple[Tuple[np.ndarray, ...], np.ndarray]:
+        """Return the merged columns and per-instance offsets."""
+        with self._lock:
+            if self._dirty:
+                self._flush()
+                counts = np.zeros(self._size, dtype=np.int64)
+                if self._blocks:
+                    new = [
+                        np.concatenate(column)
+                        for column in zip(*self._blocks, strict=True)
+                    ]
+                    # stable, so each instance keeps its append order
+                    order = np.argsort(new[0], kind="stable")
+                    new = [column[order] for column in new]
+                    at = np.searchsorted(self._merged[0], new[0], side="right")
+                    self._merged = tuple(
+                        np.insert(column, at, values)
+                        for column, values in zip(self._merged, new, strict=True)
+                    )
+                    self._blocks = []
+                    counts = np.bincount(new[0], minlength=self._size)
+                previous = self._offsets
+                offsets = np.full(self._size + 1, previous[-1], dtype=np.int64)
+                offsets[: len(previous)] = previous
+                offsets[1:] += np.cumsum(counts)
+                self._offsets = offsets
+                self._dirty = False
+            return self._merged, self._offsets
+
+    def __len__(self) -> int:
+        """Number of registered instances."""
+        return self._size
+
+    def length(self, index: int) -> int:
+        """Number of data points recorded for an instance."""
+        _, offsets = self._merge()
+        return int(offsets[index + 1] - offsets[index])
+
+    def columns(
+        self,
+        index: int,
+        start_tick: Optional[int] = None,
+        stop_tick: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return (ticks, prices, qualities, desirability) for an instance.
+
+        The arrays are read-only views of the merged columns.
+
+        Args:
+            index: instance index from `register`
+            start_tick: first tick to include (inclusive), default all
+            stop_tick: last tick to include (inclusive), default all
+        """
+        merged, offsets = self._merge()
+        base, end = int(offsets[index]), int(offsets[index + 1])
+        ticks = merged[1][base:end]
+        lo = 0 if start_tick is None else int(np.searchsorted(ticks, start_tick))
+        hi = (
+            len(ticks)
+            if stop_tick is None
+            else int(np.searchsorted(ticks, stop_tick, side="right"))
+        )
+        views = tuple(column[base:end][lo:hi] for column in merged[1:])
+        for view in views:
+            view.flags.writeable = False
+        return views  # type: ignore[return-value]
+
+    def points_from(
+        self, indices: Sequence[int], start_tick: int
+    ) -> Tuple[np.ndarray, ...]:
+        """Return the points of many instances from `start_tick` on.
+
+        The first point of every instance at or after `start_tick` is found
+        by one binary search over all instances at once, so the cost follows
+        the number of instances and of points returned rather than the
+        length of their histories.
+
+        Args:
+            indices: instance indices from `register`
+            start_tick: first tick to include (inclusive)
+
+        Returns:
+            (owners, ticks, prices, qualities, desirability): `owners` holds
+            the position in `indices` of each point's instance; points are
+            grouped in the order of `indices`, ticks ascending
+        """
+        merged, offsets = self._merge()
+        indices = np.asarray(indices, dtype=np.int64)
+        ticks = merged[1]
+        lo = offsets[indices]
+        end = offsets[indices + 1]
+        hi = end.copy()
+        while True:
+            active = lo < hi
+            if not active.any():
+                break
+            mid = (lo + hi) // 2
+            below = ticks[np.minimum(mid, len(ticks) - 1)] < start_tick
+            lo = np.where(active & below, mid + 1, lo)
+            hi = np.where(active & ~below, mid, hi)
+        counts = end - lo
+        # each group's points continue from its `lo`
+        starts = np.repeat(lo - np.cumsum(counts) + counts, counts)
+        positions = starts + np.arange(int(counts.sum()))
+        owners = np.repeat(np.arange(len(indices)), counts)
+        return (owners, *(column[positions] for column in merged[1:]))
+
+    def point(self, index: int, position: int) -> PriceDataPoint:
+        """Materialize a single data point."""
+        tick, price, quality_score, desirability = (
+            column[position] for column in self.columns(index)
+        )
+        return PriceDataPoint(
+            tick=int(tick),
+            price=float(price),
+            quality_score=float(quality_score),
+            desirability=float(desirability),
+        )
+
+    def to_dicts(self, index: int, start_tick: Optional[int] = None) -> List[dict]:
+        """Serialize an instance's history exactly like `PriceDataPoint.to_dict`.
+
+        Args:
+            index: instance index from `register`
+            start_tick: first tick to include (inclusive), default all
+        """
+        return [
+            {
+                "tick": tick,
+                "price": round(price, 2),
+                "quality_score": quality_score,
+                "desirability": desirability,
+            }
+            for tick, price, quality_score, desirability in zip(
+                *(column.tolist() for column in self.columns(index, start_tick)),
+                strict=True,
+            )
+        ]
+
+    def to_compact(self, index: int, start_tick: Optional[int] = None) -> dict:
+        """Serialize an instance's history with `encode_price_history`."""
+        columns = self.columns(index, start_tick)
+        return encode_price_history(*(column.tolist() for column in columns))
+
+
+# Column types of PriceHistoryStore blocks: index, tick, price, quality,
+# desirability
+_DTYPES = (np.int32, np.int32, np.float64, np.float64, np.float64)
+_TYPECODES = ("i", "i", "d", "d", "d")
+
+
+def _empty_buffers() -> Tuple[array, ...]:
+    return tuple(array(code) for code in _TYPECODES)
+
+
+def _empty_block() -> Tuple[np.ndarray, ...]:
+    return tuple(np.empty(0, dtype=dtype) for dtype in _DTYPES)
+
+
+class PriceHistoryView(Sequence):
+    """Read-only sequence of `PriceDataPoint` backed by a `PriceHistoryStore`.
+
+    Points are materialized on access only.
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: Optional[PriceHistoryStore], index: int) -> None:
+        self._store = store
+        self._index = index
+
+    def __len__(self) -> int:
+        if self._store is None:
+            return 0
+        return self._store.length(self._index)
+
+    @overload
+    def __getitem__(self, position: int) -> PriceDataPoint: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> List[PriceDataPoint]: ...
+
+    def __getitem__(
+        self, position: int | slice
+    ) -> PriceDataPoint | List[PriceDataPoint]:
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        length = len(self)
+        if position < 0:
+            position += length
+        if not 0 <= position < length or self._store is None:
+            raise IndexError("price history index out of range")
+        return self._store.point(self._index, position)
+
+
+# Tag of the compact price history wire format
+COMPACT_HISTORY = "delta-rle"
+
+
+def encode_price_history(
+    ticks: Sequence[int],
+    prices: Sequence[float],
+    qualities: Sequence[float],
+    desirability: Sequence[float],
+) -> dict:
+    """Encode a price history compactly for transport.
+
+    Consecutive points one tick apart with an unchanged price, quality and
+    desirability form a run; most histories are a handful of runs. Per run:
+
+    - "ticks": gap from the previous run's last tick (the first entry is
+      the first tick itself)
+    - "runs": number of points
+    - "price": change in cents from the previous run (the first entry is
+      absolute); prices are rounded to cents as in `to_dicts`
+    - "quality_score", "desirability": the run's values (floats, which
+      deltas would not round-trip exactly)
+
+    `decode_price_history` restores the `to_dicts` form exactly.
+    """
+    runs: dict = {
+        "encoding": COMPACT_HISTORY,
+        "ticks": [],
+        "runs": [],
+        "price": [],
+        "quality_score": [],
+        "desirability": [],
+    }
+    last_tick = last_cents = 0
+    previous = None
+    for tick, price, quality_score, point_desirability in zip(
+        ticks, prices, qualities, desirability, strict=True
+    ):
+        cents = round(round(price, 2) * 100)
+        values = (cents, quality_score, point_desirability)
+        if values == previous and tick == last_tick + 1:
+            runs["runs"][-1] += 1
+        else:
+            runs["ticks"].append(tick - last_tick)
+            runs["runs"].append(1)
+            runs["price"].append(cents - last_cents)
+            runs["quality_score"].append(quality_score)
+            runs["desirability"].append(point_desirability)
+            last_cents = cents
+            previous = values
+        last_tick = tick
+    return runs
+
+
+def decode_price_history(data: dict) -> List[dict]:
+    """Expand `encode_price_history` output into `to_dicts` points."""
+    points = []
+    tick = cents = 0
+    for gap, length, price_delta, quality_score, point_desirability in zip(
+        data["ticks"],
+        data["runs"],
+        data["price"],
+        data["quality_score"],
+        data["desirability"],
+        strict=True,
+    ):
+        tick += gap
+        cents += price_delta
+        for offset in range(length):
+            points.append(
+                {
+                    "tick": tick + offset,
+                    "price": cents / 100,
+                    "quality_score": quality_score,
+                    "desirability": point_desirability,
+                }
+            )
+        tick += length - 1
+    return points
+
+
 class CardCondition(str, Enum):
     """Physical condition of a card instance."""
 
@@ -163,19 +546,52 @@ class CardCondition(str, Enum):
     WORN = "worn"  # Heavy wear, barely playable
 
 
-@dataclass
+# Rendered card instance ids look like INST_{card_id}_{agent_id}_{tick}_{serial}
+CARD_INSTANCE_PREFIX = "INST_"
+
+
+def format_card_instance_id(card_id: str, agent_id: int, tick: int, serial: int) -> str:
+    """Render the textual id of a card instance from its parts."""
+    return f"{CARD_INSTANCE_PREFIX}{card_id}_{agent_id}_{tick}_{serial}"
+
+
+def parse_card_instance_id(card_instance_id: str) -> int:
+    """Return the integer serial of a rendered card instance id.
+
+    Raises:
+        ValueError: if the text is not a rendered card instance id
+    """
+    head, sep, serial = card_instance_id.rpartition("_")
+    if not sep or not head.startswith(CARD_INSTANCE_PREFIX) or not serial.isdigit():
+        raise ValueError(f"Not a card instance id: {card_instance_id!r}")
+    return int(serial)
+
+
+@dataclass(slots=True)
+class SerialCounter:
+    """Monotonic counter allocating card instance serials within a world."""
+
+    next_serial: int = 1
+
+    def allocate(self) -> int:
+        serial = self.next_serial
+        self.next_serial = serial + 1
+        return serial
+
+
+@dataclass(slots=True)
 class AgentCardInstance:
     """A specific card instance owned by an agent with individual tracking.
 
     This represents a unique copy of a card with its own stats, history, and metrics.
+    Card definition fields (name, color, rarity, gem costs, ...) are read from
+    the shared `ref` (flyweight); instances are slotted and only store
+    per-copy state.
 
     Attributes:
-        card_instance_id: unique identifier for this specific card copy
-        card_id: reference to the master card definition
-        card_name: card name (for display)
-        flavor_text: card flavor text
-        card_color: card color
-        card_rarity: card rarity
+        card_instance_id: integer serial, unique within the world; the textual
+            id (see `label`) is only rendered for serialization
+        ref: shared master card definition
         agent_id: current owner agent ID
         acquisition_tick: tick when this card was acquired
         acquisition_price: price paid when acquired
@@ -185,17 +601,13 @@ class AgentCardInstance:
         win_count: number of combat wins with this card
         loss_count: number of combat losses with this card
         condition: physical condition (mint, played, damaged, worn)
-        price_history: list of PriceDataPoint for this card across ticks
-        gem_colored: number of colored gems in cost
-        gem_colorless: number of colorless gems in cost
+        history: columnar store holding this card's price history; a private
+            store is created on the first recorded point if none is attached
+        history_index: this card's index in `history`
     """
 
-    card_instance_id: str
-    card_id: str
-    card_name: str
-    flavor_text: str
-    card_color: str
-    card_rarity: str
+    card_instance_id: int
+    ref: CardRef
     agent_id: int
     acquisition_tick: int
     acquisition_price: float
@@ -205,14 +617,74 @@ class AgentCardInstance:
     win_count: int = 0
     loss_count: int = 0
     condition: CardCondition = CardCondition.MINT
-    price_history: list = field(default_factory=list)  # List[PriceDataPoint]
-    gem_colored: int = 0
-    gem_colorless: int = 0
+    history: Optional[PriceHistoryStore] = field(
+        default=None, repr=False, compare=False
+    )
+    history_index: int = field(default=-1, repr=False, compare=False)
+
+    @property
+    def label(self) -> str:
+        """Textual id, INST_{card_id}_{agent_id}_{acquisition_tick}_{serial}."""
+        return format_card_instance_id(
+            self.ref.card_id,
+            self.agent_id,
+            self.acquisition_tick,
+            self.card_instance_id,
+        )
 
-    def to_dict(self) -> dict:
-        """Serialize to dictionary for API response."""
+    @property
+    def card_id(self) -> str:
+        return self.ref.card_id
+
+    @property
+    def card_name(self) -> str:
+        return self.ref.name
+
+    @property
+    def flavor_text(self) -> str:
+        return self.ref.flavor_text
+
+    @property
+    def card_color(self) -> str:
+        return self.ref.color
+
+    @property
+    def card_rarity(self) -> str:
+        return self.ref.rarity.value
+
+    @property
+    def gem_colored(self) -> int:
+        return self.ref.gem_colored
+
+    @property
+    def gem_colorless(self) -> int:
+        return self.ref.gem_colorless
+
+    @property
+    def price_history(self) -> PriceHistoryView:
+        """PriceDataPoint sequence for this card across ticks (read lazily)."""
+        return PriceHistoryView(self.history, self.history_index)
+
+    def attach_history(self, store: PriceHistoryStore) -> None:
+        """Keep this card's price history in `store`, moving existing points."""
+        if store is self.history:
+            return
+        index = store.register()
+        if self.history is not None:
+            columns = self.history.columns(self.history_index)
+            for point in zip(*(column.tolist() for column in columns), strict=True):
+                store.append(index, *point)
+        self.history = store
+        self.history_index = index
+
+    def to_dict(self, history_from: Optional[int] = None) -> dict:
+        """Serialize to dictionary for API response.
+
+        Args:
+            history_from: only include price points from this tick on
+        """
         return {
-            "card_instance_id": self.card_instance_id,
+            "card_instance_id": self.label,
             "card_id": self.card_id,
             "card_name": self.card_name,
             "flavor_text": self.flavor_text,
@@ -227,7 +699,11 @@ class AgentCardInstance:
             "win_count": self.win_count,
             "loss_count": self.loss_count,
             "condition": self.condition.value,
-            "price_history": [p.to_dict() for p in self.price_history],
+            "price_history": (
+                self.history.to_dicts(self.history_index, history_from)
+                if self.history is not None
+                else []
+            ),
             "gem_colored": self.gem_colored,
             "gem_colorless": self.gem_colorless,
         }
@@ -264,13 +740,55 @@ class AgentCardInstance:
         # Update condition
         self.update_condition()
         # Record price point
-        price_point = PriceDataPoint(
-            tick=tick,
-            price=self.current_price,
-            quality_score=self.quality_score,
-            desirability=self.desirability,
+        store = self.history
+        if store is None:
+            store = PriceHistoryStore()
+            self.attach_history(store)
+        store.append(
+            self.history_index,
+            tick,
+            self.current_price,
+            self.quality_score,
+            self.desirability,
         )
-        self.price_history.append(price_point)
+
+
+# Conditions by the codes of `card_conditions`
+_CONDITIONS = (
+    CardCondition.MINT,
+    CardCondition.PLAYED,
+    CardCondition.DAMAGED,
+    CardCondition.WORN,
+)
+
+
+def card_desirability(
+    quality_scores: np.ndarray, win_counts: np.ndarray, loss_counts: np.ndarray
+) -> np.ndarray:
+    """`AgentCardInstance.calculate_desirability` of many cards at once.
+
+    Performs the same float operations in the same order, so every value is
+    identical to the per-instance method.
+    """
+    desirability = 5.0 + win_counts * 0.5 - loss_counts * 0.3
+    desirability += (quality_scores / 10.0) * 2.0
+    return np.maximum(0.0, np.minimum(10.0, desirability))
+
+
+def card_conditions(
+    quality_scores: np.ndarray, loss_counts: np.ndarray
+) -> List[CardCondition]:
+    """`AgentCardInstance.update_condition` of many cards at once."""
+    codes = np.select(
+        [
+            quality_scores > 9.5,
+            (quality_scores > 7.5) & (loss_counts == 0),
+            quality_scores > 5.0,
+        ],
+        [0, 1, 2],
+        3,
+    )
+    return [_CONDITIONS[code] for code in codes.tolist()]
 
 
 @dataclass
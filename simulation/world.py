@@ -5,10 +5,24 @@ we only model opening packs and tracking counts.
 """
 
 import random
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, overload
 
-from .types import AgentCardInstance, AgentTraits, CardInstance
+import numpy as np
+
+from .types import (
+    AgentCardInstance,
+    AgentTraits,
+    CardInstance,
+    PriceHistoryStore,
+    SerialCounter,
+    card_conditions,
+    card_desirability,
+    parse_card_instance_id,
+)
 
 
 @dataclass
@@ -41,26 +55,356 @@ class Event:
         }
 
 
+class EventLog(Sequence):
+    """Append-only event list indexed by tick and by agent.
+
+    Behaves like the plain list it replaces (iteration, len, indexing, append)
+    while keeping per-tick, per-agent and per-primary-agent buckets so lookups
+    cost O(k) in the number of matching events instead of a full scan.
+    Participation covers every id in `agent_ids` as well as `agent_id`.
+    """
+
+    def __init__(self, events: Iterable[Event] = ()) -> None:
+        self._events: List[Event] = []
+        self._by_tick: Dict[int, List[Event]] = {}
+        self._ticks: List[int] = []  # sorted distinct ticks with events
+        self._by_agent: Dict[int, List[Event]] = {}
+        self._by_primary: Dict[int, List[Event]] = {}
+        for event in events:
+            self.append(event)
+
+    def append(self, event: Event) -> None:
+        """Record an event; O(1) for events appended in tick order."""
+        self._events.append(event)
+
+        bucket = self._by_tick.get(event.tick)
+        if bucket is None:
+            bucket = self._by_tick[event.tick] = []
+            if not self._ticks or event.tick > self._ticks[-1]:
+                self._ticks.append(event.tick)
+            else:
+                insort(self._ticks, event.tick)
+        bucket.append(event)
+
+        self._by_primary.setdefault(event.agent_id, []).append(event)
+        participants = dict.fromkeys([event.agent_id, *event.agent_ids])
+        for agent_id in participants:
+            self._by_agent.setdefault(agent_id, []).append(event)
+
+    def for_tick(self, tick: int) -> List[Event]:
+        """Return events of a tick in the order they were recorded."""
+        return list(self._by_tick.get(tick, ()))
+
+    def for_ticks(self, start: int, stop: int) -> List[Event]:
+        """Return events with `start <= tick <= stop`, ordered by tick."""
+        lo = bisect_left(self._ticks, start)
+        hi = bisect_right(self._ticks, stop)
+        return [e for tick in self._ticks[lo:hi] for e in self._by_tick[tick]]
+
+    def for_agent(self, agent_id: int, primary_only: bool = False) -> List[Event]:
+        """Return events an agent took part in, in the order they were recorded.
+
+        Args:
+            agent_id: agent to look up
+            primary_only: only events where the agent is the primary actor
+                (`Event.agent_id`), e.g. the winner of a combat
+        """
+        index = self._by_primary if primary_only else self._by_agent
+        return list(index.get(agent_id, ()))
+
+    @overload
+    def __getitem__(self, index: int) -> Event: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Event]: ...
+
+    def __getitem__(self, index: int | slice) -> Event | List[Event]:
+        return self._events[index]
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._events)
+
+    def __repr__(self) -> str:
+        return f"EventLog({self._events!r})"
+
+
+@dataclass
+class MarketAggregates:
+    """Running market statistics over every tracked card instance.
+
+    Updated as instances are added, removed or repriced so a market snapshot
+    costs O(1) instead of a scan over all instances. Prices are summarized
+    with a running sum (for the price index) and Welford's mean/M2 state (for
+    the population standard deviation); `card_counts` holds per-card_id
+    reference counts for the number of unique cards in circulation.
+    """
+
+    count: int = 0
+    total: float = 0.0
+    mean: float = 0.0
+    m2: float = 0.0
+    card_counts: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, card_id: str, price: float) -> None:
+        """Count a new instance."""
+        self.card_counts[card_id] = self.card_counts.get(card_id, 0) + 1
+        self._add_price(price)
+
+    def remove(self, card_id: str, price: float) -> None:
+        """Forget an instance previously passed to `add`."""
+        remaining = self.card_counts.get(card_id, 0) - 1
+        if remaining > 0:
+            self.card_counts[card_id] = remaining
+        else:
+            self.card_counts.pop(card_id, None)
+        self._remove_price(price)
+
+    def reprice(self, old_price: float, new_price: float) -> None:
+        """Move an existing instance from `old_price` to `new_price`."""
+        self._remove_price(old_price)
+        self._add_price(new_price)
+
+    def _add_price(self, price: float) -> None:
+        self.count += 1
+        self.total += price
+        delta = price - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (price - self.mean)
+
+    def _remove_price(self, price: float) -> None:
+        if self.count <= 1:
+            self.count = 0
+            self.total = self.mean = self.m2 = 0.0
+            return
+        self.count -= 1
+        self.total -= price
+        delta = price - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(0.0, self.m2 - delta * (price - self.mean))
+
+    @property
+    def price_index(self) -> float:
+        """Average price across all instances."""
+        return self.total / max(1, self.count)
+
+    @property
+    def volatility(self) -> float:
+        """Standard deviation of prices (0.0 for fewer than two instances)."""
+        if self.count <= 1:
+            return 0.0
+        return (self.m2 / self.count) ** 0.5
+
+    @property
+    def unique_cards(self) -> int:
+        """Number of distinct card ids with at least one instance."""
+        return len(self.card_counts)
+
+
+# Agents play with the first DECK_SIZE cards of their collection
+DECK_SIZE = 40
+
+
+@dataclass(frozen=True)
+class DeckStats:
+    """Cached combat statistics of a deck.
+
+    Attributes:
+        size: number of cards in the deck
+        total_gems: sum of colored and colorless gem costs (the score
+            denominator)
+        power: sum of card power
+        health: sum of card health
+        score: combat score as defined by `engine.calculate_combat_score`
+        card_ids: card ids of the deck in order (with repeats), used to
+            apply match results per card
+    """
+
+    size: int
+    total_gems: int
+    power: int
+    health: int
+    score: float
+    card_ids: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_cards(cls, deck: List[CardInstance]) -> "DeckStats":
+        total_gems = sum(card.ref.gem_colored + card.ref.gem_colorless for card in deck)
+        power = sum(card.ref.power for card in deck)
+        health = sum(card.ref.health for card in deck)
+        if not deck:
+            score: float = 0.0
+        elif total_gems == 0:
+            score = power - health
+        else:
+            # Per-card accumulation keeps the score bit-identical to summing
+            # each card's attack minus defence contribution in deck order
+            score = 0.0
+            for card in deck:
+                score += card.ref.power / total_gems - card.ref.health / total_gems
+        card_ids = tuple(card.ref.card_id for card in deck)
+        return cls(len(deck), total_gems, power, health, score, card_ids)
+
+
+class PlayerIndex:
+    """Agents holding a full deck, in world insertion order.
+
+    Matchmaking picks opponents from this list instead of rescanning every
+    agent. `agents` is kept in the same order as `WorldState.agents` and
+    `position` maps agent id to its index in `agents`; agents join once, when
+    their collection first reaches DECK_SIZE cards (collections never shrink).
+    """
+
+    def __init__(self) -> None:
+        self.agents: List["Agent"] = []
+        self.position: Dict[int, int] = {}
+        self._order: Dict[int, int] = {}  # agent id -> world insertion rank
+        self._ranks: List[int] = []  # ranks of `agents`, ascending
+
+    def __len__(self) -> int:
+        return len(self.agents)
+
+    def __contains__(self, agent_id: object) -> bool:
+        return agent_id in self.position
+
+    def register(self, agent: "Agent") -> None:
+        """Track a world agent, adding it right away if it has a full deck."""
+        self._order.setdefault(agent.id, len(self._order))
+        self.discard(agent.id)
+        if len(agent.collection) >= DECK_SIZE:
+            self.add(agent)
+
+    def add(self, agent: "Agent") -> None:
+        if agent.id in self.position:
+            return
+        rank = self._order.setdefault(agent.id, len(self._order))
+        i = bisect_left(self._ranks, rank)
+        self._ranks.insert(i, rank)
+        self.agents.insert(i, agent)
+        self._reindex(i)
+
+    def discard(self, agent_id: int) -> None:
+        i = self.position.pop(agent_id, None)
+        if i is None:
+            return
+        del self._ranks[i]
+        del self.agents[i]
+        self._reindex(i)
+
+    def _reindex(self, start: int) -> None:
+        for i in range(start, len(self.agents)):
+            self.position[self.agents[i].id] = i
+
+    def choose_opponent(
+        self, agent: "Agent", rng: random.Random
+    ) -> Optional["Agent"]:
+        """Pick a random deck holder other than `agent` in O(1).
+
+        Consumes exactly the draw `rng.choice(others)` would make over the
+        other deck holders in world order; returns None (without drawing)
+        when there is nobody else to play.
+        """
+        own = self.position.get(agent.id)
+        others = len(self.agents) - (own is not None)
+        if others <= 0:
+            return None
+        k = rng.randrange(others)
+        if own is not None and k >= own:
+            k += 1
+        return self.agents[k]
+
+
 @dataclass
 class Agent:
     id: int
     prism: float = 50.0
     collection: List[CardInstance] = field(default_factory=list)
-    card_instances: Dict[str, AgentCardInstance] = field(
+    card_instances: Dict[int, AgentCardInstance] = field(
         default_factory=dict
-    )  # card_instance_id -> AgentCardInstance
+    )  # card_instance_id (serial) -> AgentCardInstance
     traits: AgentTraits | None = None
     name: str = ""
     nick: str = ""
     rng_seed: int = 0
     boosters: int = 0  # number of unopened booster packs the agent holds
+    # Market statistics of the world this agent belongs to (set by add_agent)
+    market: Optional[MarketAggregates] = field(
+        default=None, repr=False, compare=False
+    )
+    # Deck holder index of the world this agent belongs to (set by add_agent)
+    players: Optional[PlayerIndex] = field(default=None, repr=False, compare=False)
+    # Card instance serial counter of the world (set by add_agent)
+    card_serials: Optional[SerialCounter] = field(
+        default=None, repr=False, compare=False
+    )
+    # Cached stats of collection[:DECK_SIZE]; None until computed or after
+    # the deck changed
+    _deck_stats: Optional[DeckStats] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add_cards(self, cards: List[CardInstance]) -> None:
+        if cards and len(self.collection) < DECK_SIZE:
+            self._deck_stats = None
+            self.collection.extend(cards)
+            if self.players is not None and len(self.collection) >= DECK_SIZE:
+                self.players.add(self)
+            return
         self.collection.extend(cards)
 
+    def deck_stats(self) -> DeckStats:
+        """Return the combat stats of the current deck, computing them once."""
+        stats = self._deck_stats
+        if stats is None or stats.size != min(len(self.collection), DECK_SIZE):
+            stats = DeckStats.from_cards(self.collection[:DECK_SIZE])
+            self._deck_stats = stats
+        return stats
+
+    def invalidate_deck(self) -> None:
+        """Drop the cached deck stats after editing the deck in place."""
+        self._deck_stats = None
+
     def add_card_instance(self, card_instance: AgentCardInstance) -> None:
         """Add a tracked card instance to this agent."""
+        previous = self.card_instances.get(card_instance.card_instance_id)
+        if previous is not None:
+            self.remove_card_instance(previous.card_instance_id)
         self.card_instances[card_instance.card_instance_id] = card_instance
+        if self.market is not None:
+            self.market.add(card_instance.card_id, card_instance.current_price)
+
+    def next_card_serial(self) -> int:
+        """Allocate the id of a new card instance owned by this agent."""
+        if self.card_serials is None:
+            self.card_serials = SerialCounter()
+        return self.card_serials.allocate()
+
+    def get_card_instance(self, card_instance_id: int | str) -> AgentCardInstance:
+        """Look up a card instance by serial or by its rendered textual id.
+
+        Raises:
+            KeyError: if the agent holds no such card instance
+            ValueError: if a string is not a rendered card instance id
+        """
+        if isinstance(card_instance_id, str):
+            card_instance_id = parse_card_instance_id(card_instance_id)
+        return self.card_instances[card_instance_id]
+
+    def remove_card_instance(self, card_instance_id: int) -> AgentCardInstance:
+        """Remove and return a tracked card instance."""
+        card_instance = self.card_instances.pop(card_instance_id)
+        if self.market is not None:
+            self.market.remove(card_instance.card_id, card_instance.current_price)
+        return card_instance
+
+    def reprice_card_instance(self, card_instance_id: int, price: float) -> None:
+        """Set the current market price of a tracked card instance."""
+        card_instance = self.card_instances[card_instance_id]
+        if self.market is not None:
+            self.market.reprice(card_instance.current_price, price)
+        card_instance.current_price = price
 
     def add_boosters(self, n: int) -> None:
         self.boosters += int(n)
@@ -112,7 +456,7 @@ class Agent:
                     continue
 
                 # Replace the card instance
-                del self.card_instances[old_id]
+                self.remove_card_instance(old_id)
                 discarded.append(old_id)
 
         return discarded
@@ -166,64 +510,213 @@ class Agent:
                     if candidates:
                         # Pick a random candidate from top performers
                         rng.shuffle(candidates)
-                        replacement_ref = candidates[0]
+                        replacement = candidates[0]
 
                         # Create new card instance with same stats as old
                         from .types import AgentCardInstance
                         new_instance = AgentCardInstance(
-                            card_instance_id=f"{replacement_ref.card_id}_rep_{self.id}_{rng.randint(0, 99999)}",
-                            card_id=replacement_ref.card_id,
-                            card_name=replacement_ref.name,
-                            flavor_text=replacement_ref.flavor_text,
-                            card_color=replacement_ref.color,
-                            card_rarity=replacement_ref.rarity.value,
+                            card_instance_id=self.next_card_serial(),
+                            ref=replacement.ref,
                             agent_id=self.id,
                             acquisition_tick=0,  # Will be set by caller
                             acquisition_price=old_instance.current_price,
                             current_price=old_instance.current_price,
-                            quality_score=replacement_ref.quality_score,
+                            quality_score=replacement.effective_quality(),
                             desirability=5.0,
                             win_count=0,
                             loss_count=0,
-                            gem_colored=replacement_ref.gem_colored,
-                            gem_colorless=replacement_ref.gem_colorless,
                         )
 
                         # Replace in card_instances
-                        del self.card_instances[card_id]
-                        self.card_instances[new_instance.card_instance_id] = new_instance
+                        self.remove_card_instance(card_id)
+                        self.add_card_instance(new_instance)
                         replaced.append(card_id)
 
         return replaced
 
 
+class CardMetadataTable:
+    """Attractiveness and price of every card in dense float arrays.
+
+    Each card id maps to an integer index (catalogue positions when built
+    with `cards.card_indices()`; unknown ids are appended). Bulk reads and
+    updates take arrays of indices. A card only counts as tracked once it has
+    been read or updated, matching the old dict-of-dicts behaviour where reads
+    inserted defaults.
+    """
+
+    def __init__(self, card_indices: Optional[Mapping[str, int]] = None) -> None:
+        self.index: Dict[str, int] = dict(card_indices or {})
+        size = max(self.index.values(), default=-1) + 1
+        capacity = max(size, 16)
+        self._size = size
+        self._attractiveness = np.ones(capacity, dtype=np.float64)
+        self._price = np.ones(capacity, dtype=np.float64)
+        self._tracked = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        """Number of tracked cards."""
+        return int(self._tracked[: self._size].sum())
+
+    def __contains__(self, card_id: object) -> bool:
+        i = self.index.get(card_id)  # type: ignore[arg-type]
+        return i is not None and bool(self._tracked[i])
+
+    @property
+    def attractiveness(self) -> np.ndarray:
+        """Attractiveness by card index (a view; 1.0 for untracked cards)."""
+        return self._attractiveness[: self._size]
+
+    @property
+    def price(self) -> np.ndarray:
+        """Price by card index (a view; 1.0 for untracked cards)."""
+        return self._price[: self._size]
+
+    def index_of(self, card_id: str) -> int:
+        """Return the index of a card id, assigning a new one if needed."""
+        i = self.index.get(card_id)
+        if i is None:
+            i = self._size
+            if i == len(self._price):
+                self._grow()
+            self.index[card_id] = i
+            self._size = i + 1
+        return i
+
+    def indices(self, card_ids: Iterable[str]) -> np.ndarray:
+        """Return the indices of many card ids as an int64 array."""
+        index = self.index
+        return np.fromiter(
+            (index[c] if c in index else self.index_of(c) for c in card_ids),
+            dtype=np.int64,
+        )
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._price)
+        for name, fill in (
+            ("_attractiveness", 1.0),
+            ("_price", 1.0),
+            ("_tracked", False),
+        ):
+            old = getattr(self, name)
+            new = np.full(capacity, fill, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+
+    def read(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (attractiveness, price) arrays for indices and track them."""
+        self._tracked[indices] = True
+        return self._attractiveness[indices], self._price[indices]
+
+    def scale(
+        self,
+        indices: np.ndarray,
+        factors: np.ndarray,
+        floor: Optional[np.ndarray] = None,
+    ) -> None:
+        """Multiply attractiveness and price of distinct indices by factors.
+
+        Args:
+            indices: distinct card indices to update
+            factors: multiplier per index
+            floor: optional minimum value per index (NaN for none)
+        """
+        self._tracked[indices] = True
+        for values in (self._attractiveness, self._price):
+            scaled = values[indices] * factors
+            if floor is not None:
+                scaled = np.fmax(scaled, floor)
+            values[indices] = scaled
+
+    def get(self, card_id: str) -> Tuple[float, float]:
+        """Return (attractiveness, price) of one card and track it."""
+        i = self.index_of(card_id)
+        self._tracked[i] = True
+        return float(self._attractiveness[i]), float(self._price[i])
+
+    def set(self, card_id: str, attractiveness: float, price: float) -> None:
+        i = self.index_of(card_id)
+        self._tracked[i] = True
+        self._attractiveness[i] = attractiveness
+        self._price[i] = price
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Return {card_id: {"attractiveness", "price"}} for tracked cards."""
+        return {
+            card_id: {
+                "attractiveness": float(self._attractiveness[i]),
+                "price": float(self._price[i]),
+            }
+            for card_id, i in self.index.items()
+            if self._tracked[i]
+        }
+
+
 @dataclass
 class WorldState:
     agents: Dict[int, Agent] = field(default_factory=dict)
     tick: int = 0
     distributor_boosters: int = 0
-    events: List[Event] = field(default_factory=list)  # all events that occurred
-    # Track card metadata (attractiveness and current price) by card_id
-    card_metadata: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    events: EventLog = field(default_factory=EventLog)  # all events that occurred
+    # Card attractiveness and current price, indexed by card (see card_metadata)
+    card_table: CardMetadataTable = field(
+        default_factory=CardMetadataTable, repr=False, compare=False
+    )
     market_snapshots: List = field(default_factory=list)  # List[MarketSnapshot]
     cards_traded_this_tick: int = 0  # Counter for trades in current tick
     volume_traded_this_tick: float = 0.0  # Total prisms exchanged this tick
+    # Columnar price history shared by every card instance in the world
+    price_history: PriceHistoryStore = field(default_factory=PriceHistoryStore)
+    # Running aggregates behind capture_market_snapshot
+    market: MarketAggregates = field(default_factory=MarketAggregates)
+    # Agents eligible for matchmaking
+    players: PlayerIndex = field(
+        default_factory=PlayerIndex, repr=False, compare=False
+    )
+    # Allocates card instance ids
+    card_serials: SerialCounter = field(default_factory=SerialCounter)
+
+    def add_agent(self, agent: Agent) -> None:
+        """Add an agent and start tracking its card instances in the market."""
+        previous = self.agents.get(agent.id)
+        if previous is not None:
+            for card_instance in previous.card_instances.values():
+                self.market.remove(card_instance.card_id, card_instance.current_price)
+            previous.market = None
+            previous.players = None
+            previous.card_serials = None
+        self.agents[agent.id] = agent
+        agent.market = self.market
+        agent.players = self.players
+        agent.card_serials = self.card_serials
+        self.players.register(agent)
+        for card_instance in agent.card_instances.values():
+            self.market.add(card_instance.card_id, card_instance.current_price)
 
     def add_event(self, event: Event) -> None:
         """Record an event that occurred in the world."""
         self.events.append(event)
 
+    @property
+    def card_metadata(self) -> Dict[str, Dict[str, float]]:
+        """Snapshot of tracked card stats as {card_id: {"attractiveness", "price"}}.
+
+        Read-only compatibility view of `card_table`; use the table (or the
+        accessors below) to change values.
+        """
+        return self.card_table.to_dict()
+
     def get_card_attractiveness(self, card_id: str, default: float = 1.0) -> float:
         """Get the current attractiveness of a card."""
-        if card_id not in self.card_metadata:
-            self.card_metadata[card_id] = {"attractiveness": default, "price": 1.0}
-        return self.card_metadata[card_id].get("attractiveness", default)
+        if card_id not in self.card_table:
+            self.card_table.set(card_id, default, 1.0)
+        return self.card_table.get(card_id)[0]
 
     def get_card_price(self, card_id: str, default: float = 1.0) -> float:
         """Get the current price of a card."""
-        if card_id not in self.card_metadata:
-            self.card_metadata[card_id] = {"attractiveness": 1.0, "price": default}
-        return self.card_metadata[card_id].get("price", default)
+        if card_id not in self.card_table:
+            self.card_table.set(card_id, 1.0, default)
+        return self.card_table.get(card_id)[1]
 
     def boost_card_stats(self, card_id: str, boost_percent: float = 0.01) -> None:
         """Increase attractiveness and price of a card by a percentage.
@@ -232,12 +725,12 @@ class WorldState:
             card_id: the card to boost
             boost_percent: percentage increase (0.01 = 1%)
         """
-        if card_id not in self.card_metadata:
-            self.card_metadata[card_id] = {"attractiveness": 1.0, "price": 1.0}
-
-        metadata = self.card_metadata[card_id]
-        metadata["attractiveness"] *= (1.0 + boost_percent)
-        metadata["price"] *= (1.0 + boost_percent)
+        attractiveness, price = self.card_table.get(card_id)
+        self.card_table.set(
+            card_id,
+            attractiveness * (1.0 + boost_percent),
+            price * (1.0 + boost_percent),
+        )
 
     def penalize_card_stats(self, card_id: str, penalty_percent: float = 0.01) -> None:
         """Decrease attractiveness and price of a card by a percentage.
@@ -246,67 +739,149 @@ class WorldState:
             card_id: the card to penalize
             penalty_percent: percentage decrease (0.01 = 1%)
         """
-        if card_id not in self.card_metadata:
-            self.card_metadata[card_id] = {"attractiveness": 1.0, "price": 1.0}
-
-        metadata = self.card_metadata[card_id]
+        attractiveness, price = self.card_table.get(card_id)
         # Ensure stats don't go below a minimum threshold
         min_value = 0.01
-        metadata["attractiveness"] = max(
-            min_value, metadata["attractiveness"] * (1.0 - penalty_percent)
+        self.card_table.set(
+            card_id,
+            max(min_value, attractiveness * (1.0 - penalty_percent)),
+            max(min_value, price * (1.0 - penalty_percent)),
         )
-        metadata["price"] = max(
-            min_value, metadata["price"] * (1.0 - penalty_percent)
+
+    def apply_card_results(
+        self,
+        wins: Mapping[str, int],
+        losses: Mapping[str, int],
+        percent: float = 0.01,
+    ) -> None:
+        """Apply many match outcomes to card attractiveness and price at once.
+
+        Equivalent to calling `boost_card_stats` `wins[card_id]` times and
+        `penalize_card_stats` `losses[card_id]` times for every card, but each
+        card's stats are multiplied once by the combined factor. The 0.01
+        floor is applied after the combined factor rather than after every
+        single penalty.
+
+        Args:
+            wins: card_id -> number of winning deck slots it filled
+            losses: card_id -> number of losing deck slots it filled
+            percent: boost/penalty per result (0.01 = 1%)
+        """
+        card_ids = list(wins.keys() | losses.keys())
+        if not card_ids:
+            return
+        n_losses = [losses.get(card_id, 0) for card_id in card_ids]
+        factors = [
+            (1.0 + percent) ** wins.get(card_id, 0) * (1.0 - percent) ** n
+            for card_id, n in zip(card_ids, n_losses, strict=True)
+        ]
+        floor = [0.01 if n else np.nan for n in n_losses]
+        self.card_table.scale(
+            self.card_table.indices(card_ids), np.array(factors), np.array(floor)
         )
 
     def record_price_points(self) -> None:
         """Record price data point for all card instances across all agents.
 
         This should be called at the end of each tick to capture market state.
+        Instances not yet stored in the world's price history store are
+        attached to it first. As in `AgentCardInstance.record_price_point`,
+        desirability and condition are updated before recording; both are
+        computed for every instance at once and the tick's points are
+        appended to the store as a single block.
         """
-        for agent in self.agents.values():
-            for card_instance in agent.card_instances.values():
-                card_instance.record_price_point(self.tick)
+        store = self.price_history
+        instances = [
+            card_instance
+            for agent in self.agents.values()
+            for card_instance in agent.card_instances.values()
+        ]
+        if not instances:
+            return
+        for card_instance in [ci for ci in instances if ci.history is not store]:
+            card_instance.attach_history(store)
+
+        def column(name: str, dtype: type) -> np.ndarray:
+            return np.fromiter(
+                map(attrgetter(name), instances), dtype=dtype, count=len(instances)
+            )
+
+        quality = column("quality_score", np.float64)
+        losses = column("loss_count", np.float64)
+        desirability = card_desirability(
+            quality, column("win_count", np.float64), losses
+        )
+        changed = np.flatnonzero(desirability != column("desirability", np.float64))
+        for i, value in zip(
+            changed.tolist(), desirability[changed].tolist(), strict=True
+        ):
+            instances[i].desirability = value
+        for card_instance, condition in zip(
+            instances, card_conditions(quality, losses), strict=True
+        ):
+            if card_instance.condition is not condition:
+                card_instance.condition = condition
+        store.append_block(
+            self.tick,
+            column("history_index", np.int32),
+            column("current_price", np.float64),
+            quality,
+            desirability,
+        )
+
+    def agent_price_history(
+        self,
+        agent_id: int,
+        start_tick: Optional[int] = None,
+        stop_tick: Optional[int] = None,
+    ) -> Dict[str, Dict[str, list]]:
+        """Return price history columns for every card instance of an agent.
+
+        Args:
+            agent_id: owner of the card instances
+            start_tick: first tick to include (inclusive), default all
+            stop_tick: last tick to include (inclusive), default all
+
+        Returns:
+            rendered card_instance_id -> {"tick", "price", "quality_score",
+            "desirability"} column lists
+        """
+        agent = self.agents.get(agent_id)
+        if agent is None:
+            return {}
+        history = {}
+        for card_instance in agent.card_instances.values():
+            if card_instance.history is None:
+                continue
+            ticks, prices, qualities, desirability = card_instance.history.columns(
+                card_instance.history_index, start_tick, stop_tick
+            )
+            history[card_instance.label] = {
+                "tick": ticks.tolist(),
+                "price": prices.tolist(),
+                "quality_score": qualities.tolist(),
+                "desirability": desirability.tolist(),
+            }
+        return history
 
     def capture_market_snapshot(self) -> None:
         """Capture aggregate market statistics for the current tick.
 
-        This should be called at the end of each tick.
+        This should be called at the end of each tick. Statistics come from
+        the running `market` aggregates, so only agents added through
+        `add_agent` are counted.
         """
         from .types import MarketSnapshot
 
-        # Count unique card IDs and total instances
-        unique_card_ids = set()
-        total_instances = 0
-        total_prices = 0.0
-        prices = []
-
-        for agent in self.agents.values():
-            for card_instance in agent.card_instances.values():
-                unique_card_ids.add(card_instance.card_id)
-                total_instances += 1
-                total_prices += card_instance.current_price
-                prices.append(card_instance.current_price)
-
-        # Calculate statistics
-        price_index = total_prices / max(1, total_instances)
-
-        # Calculate volatility (standard deviation of prices)
-        if prices and len(prices) > 1:
-            mean_price = price_index
-            variance = sum((p - mean_price) ** 2 for p in prices) / len(prices)
-            volatility = variance ** 0.5  # Standard deviation
-        else:
-            volatility = 0.0
-
+        market = self.market
         snapshot = MarketSnapshot(
             tick=self.tick,
             total_volume_traded=self.volume_traded_this_tick,
             cards_traded_count=self.cards_traded_this_tick,
-            price_index=price_index,
-            volatility=volatility,
-            unique_cards_in_circulation=len(unique_card_ids),
-            total_card_instances=total_instances,
+            price_index=market.price_index,
+            volatility=market.volatility,
+            unique_cards_in_circulation=market.unique_cards,
+            total_card_instances=market.count,
         )
         self.market_snapshots.append(snapshot)
 
@@ -5,7 +5,7 @@ from simulation.engine import run_simulation, SimulationConfig
 
 print("Running 100-tick simulation with 10 agents...")
 cfg = SimulationConfig(seed=42, initial_agents=10, ticks=100)
-result = run_simulation(cfg)
+result = run_simulation(cfg).to_dict()
 
 print(f"✓ Simulation completed successfully!")
 print(f"  Ticks: {result['config']['ticks']}")
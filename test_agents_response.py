@@ -8,7 +8,7 @@ res = run_simulation(SimulationConfig(
     seed=42,
     initial_agents=2,
     ticks=1
-))
+)).to_dict()
 
 print(f"Response keys: {list(res.keys())}")
 print(f"Has 'agents' key: {'agents' in res}")
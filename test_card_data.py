@@ -4,7 +4,7 @@
 from simulation.engine import run_simulation, SimulationConfig
 
 cfg = SimulationConfig(seed=42, initial_agents=2, ticks=1)
-result = run_simulation(cfg)
+result = run_simulation(cfg).to_dict()
 
 # Check if agent has card_instances
 agent = result['agents'][0]
@@ -6,7 +6,7 @@ import json
 
 # Run with 25 ticks so we hit the 20-tick replacement
 cfg = SimulationConfig(seed=42, initial_agents=2, ticks=25)
-result = run_simulation(cfg)
+result = run_simulation(cfg).to_dict()
 
 print(f"Simulation complete: {result['config']['ticks']} ticks")
 print(f"Agents: {len(result['agents'])}")
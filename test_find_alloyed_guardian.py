@@ -6,7 +6,7 @@ from simulation import SimulationConfig, run_simulation
 # Run a longer simulation to get more chances of finding Alloyed Guardian
 print("Running 50-tick simulation with 10 agents to find Alloyed Guardian...")
 cfg = SimulationConfig(seed=42, initial_agents=10, ticks=50)
-result = run_simulation(cfg)
+result = run_simulation(cfg).to_dict()
 
 # Search for Alloyed Guardian
 found_cards = []
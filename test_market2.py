@@ -4,7 +4,7 @@
 from simulation.engine import run_simulation, SimulationConfig
 
 config = SimulationConfig(seed=42, initial_agents=2, ticks=1)
-result = run_simulation(config)
+result = run_simulation(config).to_dict()
 
 for i, tick in enumerate(result['timeseries']):
     print(f"\nTick {i}:")
@@ -6,7 +6,7 @@ from simulation import run_simulation, SimulationConfig
 # Run a short simulation
 print("Running 10-tick simulation with 3 agents...")
 cfg = SimulationConfig(seed=42, initial_agents=3, ticks=10)
-result = run_simulation(cfg)
+result = run_simulation(cfg).to_dict()
 
 # Find a card instance and check its price history
 agents = result.get('agents', [])
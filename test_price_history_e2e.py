@@ -21,7 +21,7 @@ print("=" * 70)
 
 print("\n[1/5] Running simulation...")
 cfg = SimulationConfig(seed=42, initial_agents=5, ticks=30)
-result = run_simulation(cfg)
+result = run_simulation(cfg).to_dict()
 print(f"✓ Simulation complete: {len(result['agents'])} agents, 30 ticks")
 
 # Check simulation data has price history
@@ -2,7 +2,7 @@
 from simulation import SimulationConfig, run_simulation
 
 cfg = SimulationConfig(seed=42, initial_agents=3, ticks=1)
-result = run_simulation(cfg)
+result = run_simulation(cfg).to_dict()
 
 print("Agents:")
 for agent in result['agents']:
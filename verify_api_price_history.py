@@ -7,7 +7,7 @@ from simulation import SimulationConfig, run_simulation
 
 print("Step 1: Run simulation...")
 cfg = SimulationConfig(seed=42, initial_agents=5, ticks=20)
-result = run_simulation(cfg)
+result = run_simulation(cfg).to_dict()
 print(f"✓ Simulation complete: {len(result['agents'])} agents")
 
 # Check that card instances have price_history
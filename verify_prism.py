@@ -5,7 +5,7 @@ from simulation.engine import SimulationConfig, run_simulation
 
 # Run simulation
 config = SimulationConfig(seed=42, initial_agents=3, ticks=1)
-result = run_simulation(config)
+result = run_simulation(config).to_dict()
 
 # Check agents
 print("=== Agent Prism Economy Verification ===\n")
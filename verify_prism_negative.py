@@ -5,7 +5,7 @@ from simulation.engine import SimulationConfig, run_simulation
 
 # Run simulation for 20 ticks
 config = SimulationConfig(seed=42, initial_agents=2, ticks=20)
-result = run_simulation(config)
+result = run_simulation(config).to_dict()
 
 print("=== Prism Balance Verification ===\n")
 for agent in result["agents"]:
@@ -13,7 +13,7 @@ cfg = SimulationConfig(
     ticks=2
 )
 
-result = run_simulation(cfg)
+result = run_simulation(cfg).to_dict()
 
 print("=== Simulation Response Structure ===\n")
 print(f"Top-level keys: {list(result.keys())}\n")
@@ -5,7 +5,7 @@ from simulation.engine import run_simulation, SimulationConfig
 import json
 
 cfg = SimulationConfig(seed=42, initial_agents=1, ticks=1)
-result = run_simulation(cfg)
+result = run_simulation(cfg).to_dict()
 
 agent = result['agents'][0]
 card_instances = agent['card_instances']